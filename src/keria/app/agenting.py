@@ -7,9 +7,12 @@ keria.app.agenting module
 
 import logging
 import os
+import threading
 from base64 import b64decode
 import json
 import datetime
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from typing import List, Union
 from urllib.parse import urlparse, urljoin
@@ -67,7 +70,7 @@ from ..peer import exchanging as keriaexchanging
 from .specing import AgentSpecResource
 from ..core import authing, longrunning, httping
 from ..core.authing import Authenticater
-from ..core.keeping import RemoteManager
+from ..core.keeping import RemoteManager, RemoteKeeper
 from ..db import basing
 from .credentialing import (
     ICP_V_1,
@@ -103,6 +106,9 @@ class KERIAServerConfig:
     # WARNING: This port needs to be secured.
     # Default is 3903. KERIA_BOOT_PORT also sets this.
     bootPort: int = 3903
+    # Interface the admin, HTTP and boot servers listen on. Default is "", every interface. Agency workers
+    # of a sharded agency listen on 127.0.0.1 behind the router.
+    host: str = ""
 
     # Agency master controller information and configuration
     # Name of controller. Default is 'keria'.
@@ -138,6 +144,49 @@ class KERIAServerConfig:
     cors: bool = True
     # Timeout for releasing agents. Default is 86400 seconds (24 hours)
     releaseTimeout: int = 86400
+    # Maximum number of agents kept loaded. The least recently used agents are released first. Default is None, no limit.
+    maxAgents: int | None = None
+    # Resident memory budget of the process in MiB. The least recently used agents are released while over budget.
+    # Default is None, no budget.
+    maxRss: int | None = None
+    # Open the KERIA owned agent databases (Seeker, ExnSeeker, Operator, RemoteKeeper) as named sub databases
+    # of one LMDB environment per agent. Existing agents must be migrated with `keria migrate-shared-db`.
+    # Default is False which opens an environment for each. KERIA_SHARED_DB also sets this.
+    sharedDb: bool = False
+    # Number of agency worker processes. Each controller AID is served by the worker chosen by a stable hash of
+    # the AID and a router on the admin, HTTP and boot ports forwards requests to it. Default is 0, one process.
+    # KERIA_SHARDS also sets this.
+    shards: int = 0
+    # First of the local ports agency workers listen on, three per worker, on 127.0.0.1 only and without TLS.
+    # Default is 4901. KERIA_SHARD_PORT also sets this.
+    shardPort: int = 4901
+    # Exchange message indexes kept from the start, each a field path like "-a-i" or paths joined by "." like
+    # "-i.-dt". Other indexes are built the first time a query uses them. Default is None, the single field
+    # indexes. KERIA_EXN_INDEXES also sets this.
+    exnIndexes: list | None = None
+    # Number of credentials each agent keeps decoded, and cloned with their TEL status, in memory. Default is
+    # 1024. KERIA_CREDENTIAL_CACHE_SIZE also sets this.
+    credentialCacheSize: int = basing.CredentialCache.Size
+    # Number of credentials all resident agents together keep decoded, and cloned with their TEL status, in
+    # memory. The least recently used credential of any agent is dropped once it is spent. Default is 65536.
+    # None for no budget beyond the size of each cache. KERIA_CREDENTIAL_CACHE_BUDGET also sets this.
+    credentialCacheBudget: int | None = basing.CacheBudget.Size
+    # Milliseconds a credential or exchange message query must take to be logged as slow and kept in the
+    # slow query log of its agent. Default is None which logs no queries. KERIA_SLOW_QUERY_MS also sets this.
+    slowQueryThreshold: float | None = None
+    # Seconds finished and failed long running operations are kept before they are removed. Default is None
+    # which keeps them until clients delete them. KERIA_OP_RETENTION also sets this.
+    opRetention: int | None = None
+    # Most long running operations removed per second across all agents. Default is 100.
+    # KERIA_OP_COLLECT_BATCH also sets this.
+    opCollectBatch: int = 100
+    # Seconds an idle agent task sleeps between runs when it has no queued work. Tasks are woken early
+    # when work is queued for them. Default is None which polls every task on every Doist cycle.
+    idleTock: float | None = None
+    # Number of background threads loading cold agents from disk. Requests for an agent that is still loading
+    # are answered with 503 Service Unavailable and a Retry-After header instead of blocking the event loop.
+    # Default is 0 which loads agents synchronously inside the request that needs them.
+    loaders: int = 0
     # Controller Service Endpoint Location OOBI URLs to resolve at startup of each Agent. Makes a 'controller' EndRole and LocScheme in the database for each URL
     curls: List[str] = field(default_factory=list)
     # General Introduction OOBI URLs to resolve at startup of each Agent. For things like witnesses, watchers, mailboxes, and TEL observers.
@@ -228,6 +277,17 @@ class Agency(doing.DoDoer):
         iurls=None,
         durls=None,
         cf=None,
+        idleTock=None,
+        loaders=0,
+        maxAgents=None,
+        maxRss=None,
+        sharedDb=False,
+        exnIndexes=None,
+        credentialCacheSize=basing.CredentialCache.Size,
+        credentialCacheBudget=basing.CacheBudget.Size,
+        slowQueryThreshold=None,
+        opRetention=None,
+        opCollectBatch=100,
     ):
         """
         Initialize the Agency with the given parameters.
@@ -245,6 +305,20 @@ class Agency(doing.DoDoer):
             iurls (list | None): General Introduction OOBI URLs to resolve at startup of each Agent.
             durls (list | None): Data OOBI URLs resolved at startup of each Agent.
             cf (configing.Configer | None): Optional Configer instance for configuration data.
+            idleTock (float | None): Seconds idle agent tasks sleep between runs, None polls every cycle.
+            loaders (int): Number of background threads loading cold agents, 0 loads agents synchronously.
+            maxAgents (int | None): Maximum number of resident agents, None for no limit.
+            maxRss (int | None): Resident memory budget in MiB, None for no budget.
+            sharedDb (bool): Open KERIA owned agent databases in one shared LMDB environment per agent.
+            exnIndexes (list | None): Exchange message indexes each agent keeps from the start, None for the
+                single field indexes.
+            credentialCacheSize (int): Number of credentials each agent keeps decoded and cloned in memory.
+            credentialCacheBudget (int | None): Number of credentials all agents together keep decoded and
+                cloned in memory, None for no budget.
+            slowQueryThreshold (float | None): Milliseconds a query must take to be logged as slow, None for
+                no slow query log.
+            opRetention (int | None): Seconds finished long running operations are kept, None keeps them.
+            opCollectBatch (int): Most long running operations removed per second across all agents.
         """
         self.name = name
         self.base = base
@@ -257,6 +331,19 @@ class Agency(doing.DoDoer):
         self.curls = curls
         self.iurls = iurls
         self.durls = durls
+        self.idleTock = idleTock
+        self.sharedDb = sharedDb
+        self.exnIndexes = exnIndexes
+        self.credentialCacheSize = credentialCacheSize
+        self.cacheBudget = (
+            basing.CacheBudget(size=credentialCacheBudget)
+            if credentialCacheBudget is not None
+            else None
+        )
+        self.slowQueryThreshold = slowQueryThreshold
+        self.seed = None
+        self.aeid = None
+        self.stretching = threading.Lock()
 
         if cf is None and self.configFile is not None:
             self.cf = configing.Configer(
@@ -271,15 +358,18 @@ class Agency(doing.DoDoer):
             self.cf = cf
 
         self.agents = dict()
+        self.loader = Loader(agency=self, workers=loaders)
+        self.releaser = Releaser(
+            self, releaseTimeout=releaseTimeout, maxAgents=maxAgents, maxRss=maxRss
+        )
+        self.collector = Collector(self, retention=opRetention, batch=opCollectBatch)
 
         self.adb = (
             adb
             if adb is not None
             else basing.AgencyBaser(name="TheAgency", base=base, reopen=True, temp=temp)
         )
-        super(Agency, self).__init__(
-            doers=[Releaser(self, releaseTimeout=releaseTimeout)]
-        )
+        super(Agency, self).__init__(doers=[self.releaser, self.collector, self.loader])
 
     def _loadConfigForAgent(self, caid):
         """
@@ -338,6 +428,29 @@ class Agency(doing.DoDoer):
         cf.put(config)
         return cf
 
+    def stretch(self):
+        """
+        Stretch the agency passcode into the keystore encryption seed and aeid once per process.
+        Habery.setup derives the same pair from bran for every agent, which makes each agent
+        load pay for the key stretching, so the pair is cached and handed to each Habery instead.
+
+        Returns:
+            tuple: (seed, aeid) qb64 keystore encryption seed and its verification key,
+                   (None, None) when the agency has no passcode
+        """
+        with self.stretching:
+            if self.bran and self.seed is None:
+                if len(self.bran) < 21:
+                    raise ValueError("Bran (passcode seed material) too short.")
+                bran = (
+                    coring.MtrDex.Salt_128 + "A" + self.bran[:21]
+                )  # qb64 salt for seed
+                signer = Salter(qb64=bran).signer(transferable=False, temp=self.temp)
+                self.seed = signer.qb64
+                self.aeid = signer.verfer.qb64
+
+        return self.seed, self.aeid
+
     def create(self, caid, salt=None):
         """
         Create and return a new agent with the given caid and optional salt.
@@ -350,13 +463,15 @@ class Agency(doing.DoDoer):
             salt (str): Optional QB64 salt for the agent's Habery. If not provided, a random salt will be used.
         """
         habName = f"agent-{caid}"
+        seed, aeid = self.stretch()
         ks = keeping.Keeper(name=caid, base=self.base, temp=self.temp, reopen=True)
         agent_cf = self._writeAgentConfig(caid)
         # Create the Hab for the Agent with only 2 AIDs
         agentHby = habbing.Habery(
             name=caid,
             base=self.base,
-            bran=self.bran,
+            seed=seed,
+            aeid=aeid,
             ks=ks,
             cf=agent_cf,
             temp=self.temp,
@@ -377,6 +492,7 @@ class Agency(doing.DoDoer):
 
         # add agent to cache
         self.agents[caid] = agent
+        self.releaser.admit(agent)
         # start agents processes running
         self.extend([agent])
 
@@ -416,6 +532,8 @@ class Agency(doing.DoDoer):
             agent.registrar.rgy.close()
             agent.mgr.rb.close(clear=False)
             agent.hby.close(clear=False)
+            if agent.kdb is not None:
+                agent.kdb.close(clear=False)
         except (
             lmdb.Error
         ) as ex:  # Sometimes LMDB will throw an error if the DB is already closed
@@ -431,16 +549,64 @@ class Agency(doing.DoDoer):
         if caid in self.agents:
             agent = self.agents[caid]
             agent.last = helping.nowUTC()
+            agent.wake()
+            return agent
+
+        if (agent := self.loader.wait(caid)) is not None:
             return agent
 
         aaid = self.adb.agnt.get(keys=(caid,))
         if aaid is None:
             return None
 
+        agent = self.load(caid, aaid)
+        self.install(agent)
+
+        return agent
+
+    def warm(self, pre):
+        """
+        Ensure the agent responsible for pre is resident without loading it in the caller.
+
+        When background loading is enabled and the agent is cold, a load is started on a loader thread
+        and False is returned so the caller can answer with 503 Service Unavailable instead of blocking
+        every other agent while the Habery and Regery are opened.
+
+        Parameters:
+            pre (str): controller AID, agent AID or managed AID of the agent
+
+        Returns:
+            bool: True if the agent is resident, unknown or ready to be retrieved with get or lookup
+        """
+        if not self.loader.workers:
+            return True
+
+        caid = self.adb.controller(pre)
+        if caid is None or caid in self.agents:
+            return True
+
+        if (aaid := self.adb.agnt.get(keys=(caid,))) is None:
+            return True
+
+        return self.loader.submit(caid, aaid)
+
+    def load(self, caid, aaid):
+        """
+        Opens the databases of an existing agent and creates its Agent without starting it.
+        Only touches agent local state so it is safe to call from a loader thread.
+
+        Parameters:
+            caid (str): controller AID of the agent
+            aaid (Prefixer): agent AID recorded for the controller
+
+        Returns:
+            Agent: the loaded agent, not yet added to the agency
+        """
+        seed, aeid = self.stretch()
         ks = keeping.Keeper(name=caid, base=self.base, temp=self.temp, reopen=True)
 
         agentHby = habbing.Habery(
-            name=caid, base=self.base, bran=self.bran, ks=ks, temp=self.temp
+            name=caid, base=self.base, seed=seed, aeid=aeid, ks=ks, temp=self.temp
         )
 
         agentHab = agentHby.habByName(f"agent-{caid}", ns="agent")
@@ -452,15 +618,16 @@ class Agency(doing.DoDoer):
         agentRgy = Regery(
             hby=agentHby, name=agentHab.name, base=self.base, temp=self.temp
         )
-        agent = Agent(
+        return Agent(
             hby=agentHby, rgy=agentRgy, agentHab=agentHab, agency=self, caid=caid
         )
 
-        self.agents[caid] = agent
+    def install(self, agent):
+        """Adds a loaded agent to the agent cache and starts its processes running."""
+        self.agents[agent.caid] = agent
+        self.releaser.admit(agent)
         self.extend([agent])
 
-        return agent
-
     def lookup(self, pre):
         """
         Look up an agent by either a managed AID prefix (pre) or its controller AID in the agency's database.
@@ -486,6 +653,12 @@ class Agency(doing.DoDoer):
         """Maps a given agent to its controller AID (caid) in the agency's database."""
         self.adb.aids.pin(keys=(pre,), val=coring.Prefixer(qb64=caid))
 
+    def release(self, agent):
+        """Shuts down a resident agent and removes it from the agency, it is loaded again on use"""
+        self.remove([agent])
+        del self.agents[agent.caid]
+        agent.shutdownAgent()
+
     def shutdownAgency(self):
         """Shuts down the agents in an agency in preparation for agency shutdown."""
         if len(self.agents) > 0:
@@ -558,6 +731,9 @@ class Agent(doing.DoDoer):
             .tocks (MappingProxyType): Escrow timing configurations for the underlying Hio tasks comprising this agent.
             .last (datetime.datetime): Last activity timestamp for the agent.
             .shouldShutdown (bool): Flag indicating if the agent should shut down.
+            .idleTock (float | None): Seconds idle subtasks sleep between runs, None polls every cycle.
+            .woken (bool): Flag indicating work was queued and sleeping subtasks should run on the next cycle.
+            .dozers (list[Doer]): Subtasks that sleep for .idleTock while they have no queued work.
             .swain (delegating.Anchorer): Watches the delegator for delegation approval seals for inception and rotation.
             .counselor (Counselor): Handles multisig transaction signing orchestration including for multisig operations.
                 in delegated identifiers.
@@ -641,6 +817,8 @@ class Agent(doing.DoDoer):
         self.tocks = MappingProxyType(self.cfd.get("tocks", {}))
         self.last = helping.nowUTC()
         self._shouldShutdown = False
+        self.idleTock = self.tocks.get("idle", agency.idleTock)
+        self.woken = False
 
         self.swain = delegating.Anchorer(hby=hby, proxy=agentHab)
         self.counselor = Counselor(hby=hby, swain=self.swain, proxy=agentHab)
@@ -648,17 +826,37 @@ class Agent(doing.DoDoer):
 
         oobiery = oobiing.Oobiery(hby=hby)
 
-        self.mgr = RemoteManager(hby=hby)
+        # KERIA owned databases share one environment when the agency uses the shared layout
+        self.kdb = (
+            basing.AgentBaser(name=hby.name, base=hby.base, temp=hby.temp, reopen=True)
+            if agency.sharedDb
+            else None
+        )
 
-        self.cues = decking.Deck()
-        self.groups = decking.Deck()
-        self.anchors = decking.Deck()
-        self.witners = decking.Deck()
-        self.queries = decking.Deck()
-        self.exchanges = decking.Deck()
-        self.grants = decking.Deck()
-        self.admits = decking.Deck()
-        self.submits = decking.Deck()
+        self.mgr = RemoteManager(
+            hby=hby,
+            rb=RemoteKeeper(
+                name=hby.name,
+                base=hby.base,
+                temp=hby.temp,
+                reopen=True,
+                clear=False,
+                headDirPath=hby.db.headDirPath,
+                shared=self.kdb,
+            )
+            if self.kdb is not None
+            else None,
+        )
+
+        self.cues = WakeDeck(waker=self.wake)
+        self.groups = WakeDeck(waker=self.wake)
+        self.anchors = WakeDeck(waker=self.wake)
+        self.witners = WakeDeck(waker=self.wake)
+        self.queries = WakeDeck(waker=self.wake)
+        self.exchanges = WakeDeck(waker=self.wake)
+        self.grants = WakeDeck(waker=self.wake)
+        self.admits = WakeDeck(waker=self.wake)
+        self.submits = WakeDeck(waker=self.wake)
 
         receiptor = agenting.Receiptor(hby=hby)
         self.witq = agenting.WitnessInquisitor(hby=self.hby)
@@ -689,7 +887,9 @@ class Agent(doing.DoDoer):
         self.mux = grouping.Multiplexor(hby=hby, notifier=self.notifier)
 
         # Initialize all the credential processors
-        self.verifier = verifying.Verifier(hby=hby, reger=rgy.reger)
+        self.verifier = verifying.Verifier(
+            hby=hby, reger=rgy.reger, cues=WakeDeck(waker=self.wake)
+        )
         self.registrar = credentialing.Registrar(
             agentHab=agentHab,
             hby=hby,
@@ -714,15 +914,26 @@ class Agent(doing.DoDoer):
             reger=self.rgy.reger,
             reopen=True,
             temp=self.hby.temp,
+            shared=self.kdb,
+            cacheSize=agency.credentialCacheSize,
+            cacheBudget=agency.cacheBudget,
         )
         self.exnseeker = basing.ExnSeeker(
-            name=hby.name, db=hby.db, reopen=True, temp=self.hby.temp
+            name=hby.name,
+            db=hby.db,
+            reopen=True,
+            temp=self.hby.temp,
+            shared=self.kdb,
+            indexes=agency.exnIndexes,
         )
+        self.queryLog = basing.QueryLog(threshold=agency.slowQueryThreshold)
 
         challengeHandler = challenging.ChallengeHandler(db=hby.db, signaler=signaler)
 
         handlers = [challengeHandler]
-        self.exc = exchanging.Exchanger(hby=hby, handlers=handlers)
+        self.exc = exchanging.Exchanger(
+            hby=hby, handlers=handlers, cues=WakeDeck(waker=self.wake)
+        )
         grouping.loadHandlers(exc=self.exc, mux=self.mux)
         protocoling.loadHandlers(hby=self.hby, exc=self.exc, notifier=self.notifier)
         self.submitter = Submitter(
@@ -737,6 +948,9 @@ class Agent(doing.DoDoer):
             credentialer=self.credentialer,
             submitter=self.submitter,
             exchanger=self.exc,
+            opr=longrunning.Operator(name=hby.name, temp=hby.temp, shared=self.kdb)
+            if self.kdb is not None
+            else None,
         )
 
         self.rvy = routing.Revery(db=hby.db, cues=self.cues)
@@ -745,8 +959,12 @@ class Agent(doing.DoDoer):
         )
         self.kvy.registerReplyRoutes(router=self.rvy.rtr)
 
-        self.tvy = Tevery(
-            reger=self.verifier.reger, db=hby.db, local=False, cues=self.cues
+        self.tvy = StatusTevery(
+            statuses=self.verifier.cues,
+            reger=self.verifier.reger,
+            db=hby.db,
+            local=False,
+            cues=self.cues,
         )
 
         self.tvy.registerReplyRoutes(router=self.rvy.rtr)
@@ -760,88 +978,85 @@ class Agent(doing.DoDoer):
             local=True,
         )  # disable misfit escrow until we can add another parser for remote.
 
-        doers.extend(
-            [
-                Initer(
-                    agentHab=agentHab, caid=caid, tock=self.tocks.get("initer", 0.0)
-                ),
-                Querier(
-                    hby=hby,
-                    agentHab=agentHab,
-                    kvy=self.kvy,
-                    queries=self.queries,
-                    tock=self.tocks.get("querier", 0.0),
-                ),
-                Escrower(
-                    kvy=self.kvy,
-                    rgy=self.rgy,
-                    rvy=self.rvy,
-                    tvy=self.tvy,
-                    exc=self.exc,
-                    vry=self.verifier,
-                    registrar=self.registrar,
-                    credentialer=self.credentialer,
-                    tock=self.tocks.get("escrower", 0.0),
-                ),
-                ParserDoer(
-                    kvy=self.kvy, parser=self.parser, tock=self.tocks.get("parser", 0.0)
-                ),
-                Witnesser(
-                    receiptor=receiptor,
-                    witners=self.witners,
-                    tock=self.tocks.get("witnesser", 0.0),
-                ),
-                Delegator(
-                    agentHab=agentHab,
-                    swain=self.swain,
-                    anchors=self.anchors,
-                    tock=self.tocks.get("delegator", 0.0),
-                ),
-                ExchangeSender(
-                    hby=hby,
-                    agentHab=agentHab,
-                    exc=self.exc,
-                    exchanges=self.exchanges,
-                    tock=self.tocks.get("exchangeSender", 0.0),
-                ),
-                Granter(
-                    hby=hby,
-                    rgy=rgy,
-                    agentHab=agentHab,
-                    exc=self.exc,
-                    grants=self.grants,
-                    tock=self.tocks.get("granter", 0.0),
-                ),
-                Admitter(
-                    hby=hby,
-                    witq=self.witq,
-                    psr=self.parser,
-                    agentHab=agentHab,
-                    exc=self.exc,
-                    admits=self.admits,
-                    tock=self.tocks.get("admitter", 0.0),
-                ),
-                GroupRequester(
-                    hby=hby,
-                    agentHab=agentHab,
-                    counselor=self.counselor,
-                    groups=self.groups,
-                    tock=self.tocks.get("groupRequester", 0.0),
-                ),
-                SeekerDoer(
-                    seeker=self.seeker,
-                    cues=self.verifier.cues,
-                    tock=self.tocks.get("seeker", 0.0),
-                ),
-                ExchangeCueDoer(
-                    seeker=self.exnseeker,
-                    cues=self.exc.cues,
-                    queries=self.queries,
-                    tock=self.tocks.get("exchangecue", 0.0),
-                ),
-                self.submitter,
-            ]
-        )
+        self.dozers = [
+            Initer(agentHab=agentHab, caid=caid, tock=self.tocks.get("initer", 0.0)),
+            Querier(
+                hby=hby,
+                agentHab=agentHab,
+                kvy=self.kvy,
+                queries=self.queries,
+                tock=self.tocks.get("querier", 0.0),
+            ),
+            Escrower(
+                kvy=self.kvy,
+                rgy=self.rgy,
+                rvy=self.rvy,
+                tvy=self.tvy,
+                exc=self.exc,
+                vry=self.verifier,
+                registrar=self.registrar,
+                credentialer=self.credentialer,
+                tock=self.tocks.get("escrower", 0.0),
+            ),
+            ParserDoer(
+                kvy=self.kvy, parser=self.parser, tock=self.tocks.get("parser", 0.0)
+            ),
+            Witnesser(
+                receiptor=receiptor,
+                witners=self.witners,
+                tock=self.tocks.get("witnesser", 0.0),
+            ),
+            Delegator(
+                agentHab=agentHab,
+                swain=self.swain,
+                anchors=self.anchors,
+                tock=self.tocks.get("delegator", 0.0),
+            ),
+            ExchangeSender(
+                hby=hby,
+                agentHab=agentHab,
+                exc=self.exc,
+                exchanges=self.exchanges,
+                tock=self.tocks.get("exchangeSender", 0.0),
+            ),
+            Granter(
+                hby=hby,
+                rgy=rgy,
+                agentHab=agentHab,
+                exc=self.exc,
+                grants=self.grants,
+                tock=self.tocks.get("granter", 0.0),
+            ),
+            Admitter(
+                hby=hby,
+                witq=self.witq,
+                psr=self.parser,
+                agentHab=agentHab,
+                exc=self.exc,
+                admits=self.admits,
+                tock=self.tocks.get("admitter", 0.0),
+            ),
+            GroupRequester(
+                hby=hby,
+                agentHab=agentHab,
+                counselor=self.counselor,
+                groups=self.groups,
+                tock=self.tocks.get("groupRequester", 0.0),
+            ),
+            SeekerDoer(
+                seeker=self.seeker,
+                cues=self.verifier.cues,
+                tock=self.tocks.get("seeker", 0.0),
+            ),
+            ExchangeCueDoer(
+                seeker=self.exnseeker,
+                cues=self.exc.cues,
+                queries=self.queries,
+                tock=self.tocks.get("exchangecue", 0.0),
+            ),
+            self.submitter,
+        ]
+        doers.extend(self.dozers)
 
         super(Agent, self).__init__(doers=doers, **opts)
 
@@ -881,11 +1096,43 @@ class Agent(doing.DoDoer):
 
         self.agency.incept(self.caid, pre)
 
+    def wake(self):
+        """Flags that work was queued so any dozing subtasks run on the next cycle of this Agent and
+        waiting long running operations are checked again."""
+        self.woken = True
+        if (monitor := getattr(self, "monitor", None)) is not None:
+            monitor.touch()
+
+    def rouse(self, tyme):
+        """Reschedules each dozing subtask to run now."""
+        self.woken = False
+        for _ in range(len(self.deeds)):
+            dog, retyme, doer = self.deeds.popleft()
+            if doer in self.dozers:
+                retyme = min(retyme, tyme)
+            self.deeds.append((dog, retyme, doer))
+
+    def doze(self, tyme):
+        """Reschedules each subtask with no queued work to run again after .idleTock seconds, and
+        each dozing one that has work again, such as new escrow entries, to run after its tock."""
+        for _ in range(len(self.deeds)):
+            dog, retyme, doer = self.deeds.popleft()
+            if doer in self.dozers:
+                if doer.idle:
+                    retyme = max(retyme, tyme + self.idleTock)
+                else:
+                    retyme = min(retyme, tyme + doer.tock)
+            self.deeds.append((dog, retyme, doer))
+
     def recur(self, tyme=None, tock=0.0):
         if self.shouldShutdown:
             self.shutdownAgent()  # will call exit so no need to return
             return True  # never gets here since shutdownAgent triggers exit
+        if self.woken:
+            self.rouse(tyme)
         super(Agent, self).recur(tyme=tyme)
+        if self.idleTock is not None:
+            self.doze(tyme)
         return False
 
     def shutdownAgent(self):
@@ -901,6 +1148,10 @@ class Agent(doing.DoDoer):
             self.mgr.rb,
             self.hby,
         ]
+        if self.kdb is not None:
+            to_close.append(self.kdb)
+        # Return the credentials cached in memory to the budget shared with the other agents
+        self.seeker.cache.clear()
         for db in to_close:
             try:
                 db.close(clear=False)
@@ -924,10 +1175,15 @@ def createBootServerDoer(config: KERIAServerConfig, agency: Agency):
         agency, username=config.bootUsername, password=config.bootPassword
     )
     bootApp.add_route("/boot", bootEnd)
-    bootApp.add_route("/health", HealthEnd())
+    bootApp.add_route("/health", HealthEnd(agency))
 
     bootServer = createHttpServer(
-        config.bootPort, bootApp, config.keyPath, config.certPath, config.caFilePath
+        config.bootPort,
+        bootApp,
+        config.keyPath,
+        config.certPath,
+        config.caFilePath,
+        host=config.host,
     )
     if not bootServer.reopen():
         raise RuntimeError(f"Cannot create boot HTTP server on port {config.bootPort}")
@@ -964,7 +1220,12 @@ def createAdminServerDoer(config: KERIAServerConfig, agency: Agency):
     ipexing.loadEnds(app=adminApp)
 
     adminServer = createHttpServer(
-        config.adminPort, adminApp, config.keyPath, config.certPath, config.caFilePath
+        config.adminPort,
+        adminApp,
+        config.keyPath,
+        config.certPath,
+        config.caFilePath,
+        host=config.host,
     )
     if not adminServer.reopen():
         raise RuntimeError(
@@ -993,7 +1254,12 @@ def createHttpServerDoer(
     specEnd.addRoutes(happ)
     happ.add_route("/spec.yaml", specEnd)
     server = createHttpServer(
-        config.httpPort, happ, config.keyPath, config.certPath, config.caFilePath
+        config.httpPort,
+        happ,
+        config.keyPath,
+        config.certPath,
+        config.caFilePath,
+        host=config.host,
     )
     if not server.reopen():
         raise RuntimeError(f"cannot create local http server on port {config.httpPort}")
@@ -1008,11 +1274,22 @@ def createAgency(config: KERIAServerConfig, temp=False, cf=None):
         configFile=config.configFile,
         configDir=config.configDir,
         releaseTimeout=config.releaseTimeout,
+        maxAgents=config.maxAgents,
+        maxRss=config.maxRss,
+        sharedDb=config.sharedDb,
+        exnIndexes=config.exnIndexes,
+        credentialCacheSize=config.credentialCacheSize,
+        credentialCacheBudget=config.credentialCacheBudget,
+        slowQueryThreshold=config.slowQueryThreshold,
+        opRetention=config.opRetention,
+        opCollectBatch=config.opCollectBatch,
         curls=config.curls,
         iurls=config.iurls,
         durls=config.durls,
         temp=temp,
         cf=cf,
+        idleTock=config.idleTock,
+        loaders=config.loaders,
     )
 
 
@@ -1039,6 +1316,56 @@ def setupDoers(agency: Agency, config: KERIAServerConfig, temp=False, cf=None):
     return doers
 
 
+class WakeDeck(decking.Deck):
+    """
+    Deck that calls its waker whenever an element is added so a dozing consumer of the Deck can be
+    rescheduled to run right away instead of waiting for its idle timer.
+    """
+
+    def __init__(self, iterable=(), maxlen=None, waker=None):
+        """
+        Parameters:
+            iterable (Iterable): initial elements of the Deck
+            maxlen (int | None): maximum size of the Deck or None if unbounded
+            waker (Callable | None): called with no arguments each time elements are added
+        """
+        super(WakeDeck, self).__init__(iterable, maxlen)
+        self.waker = waker
+
+    def append(self, elem):
+        super(WakeDeck, self).append(elem)
+        self.rouse()
+
+    def appendleft(self, elem):
+        super(WakeDeck, self).appendleft(elem)
+        self.rouse()
+
+    def extend(self, iterable):
+        super(WakeDeck, self).extend(iterable)
+        self.rouse()
+
+    def extendleft(self, iterable):
+        super(WakeDeck, self).extendleft(iterable)
+        self.rouse()
+
+    def rouse(self):
+        if self.waker is not None:
+            self.waker()
+
+    def requeue(self, elem):
+        """Put back elem its consumer could not handle yet without waking it, as nothing new was
+        queued and the consumer retries elem on its next run anyway."""
+        super(WakeDeck, self).append(elem)
+
+
+def requeue(cues, cue):
+    """Put cue back on cues to be retried, without waking the agent when cues is a WakeDeck"""
+    if isinstance(cues, WakeDeck):
+        cues.requeue(cue)
+    else:
+        cues.append(cue)
+
+
 class ParserDoer(doing.Doer):
     """A Doer that continuously processes messages from the Parser."""
 
@@ -1048,6 +1375,11 @@ class ParserDoer(doing.Doer):
         self.tock = tock
         super(ParserDoer, self).__init__(tock=self.tock)
 
+    @property
+    def idle(self):
+        """True when there are no messages waiting on the incoming message stream."""
+        return not self.parser.ims
+
     def recur(self, tyme=None, tock=0.0, **opts):
         """
         Continually processes messages on the incoming message stream (ims).
@@ -1072,13 +1404,20 @@ class Witnesser(doing.Doer):
         self.receiptor = receiptor
         self.witners = witners
         self.tock = tock
+        self.busy = False
         super(Witnesser, self).__init__(tock=self.tock)
 
+    @property
+    def idle(self):
+        """True when no witness receipting is queued or in progress."""
+        return not self.witners and not self.busy
+
     def recur(self, tyme=None, tock=0.0, **opts):
         while True:
             if self.witners:
                 msg = self.witners.popleft()
                 serder = msg["serder"]
+                self.busy = True
 
                 # If we are a rotation event, may need to catch new witnesses up to current key state
                 if serder.ked["t"] in (Ilks.rot, Ilks.drt):
@@ -1087,6 +1426,7 @@ class Witnesser(doing.Doer):
                         yield from self.receiptor.catchup(serder.pre, wit)
 
                 yield from self.receiptor.receipt(serder.pre, serder.sn)
+                self.busy = False
 
             yield self.tock
 
@@ -1099,6 +1439,10 @@ class Delegator(doing.Doer):
         self.tock = tock
         super(Delegator, self).__init__(tock=self.tock)
 
+    @property
+    def idle(self):
+        return not self.anchors
+
     def recur(self, tyme=None, tock=0.0, **opts):
         if self.anchors:
             msg = self.anchors.popleft()
@@ -1117,6 +1461,10 @@ class ExchangeSender(doing.DoDoer):
         self.tock = tock
         super(ExchangeSender, self).__init__(always=True, tock=self.tock)
 
+    @property
+    def idle(self):
+        return not self.exchanges and not self.deeds
+
     def recur(self, tyme, deeds=None):
         if self.exchanges:
             msg = self.exchanges.popleft()
@@ -1184,6 +1532,11 @@ class Granter(doing.DoDoer):
         self.tock = tock
         super(Granter, self).__init__(always=True, tock=self.tock)
 
+    @property
+    def idle(self):
+        """True when there are no queued grants and no grants being sent."""
+        return not self.grants and not self.deeds
+
     def recur(self, tyme, deeds=None):
         """Doer lifecycle method to process grants. Continuously processes grants as they arrive."""
         while self.grants:
@@ -1330,6 +1683,10 @@ class Admitter(doing.Doer):
         self.tock = tock
         super(Admitter, self).__init__(tock=self.tock)
 
+    @property
+    def idle(self):
+        return not self.admits
+
     def recur(self, tyme, tock=0.0, **opts):
         if self.admits:
             msg = self.admits.popleft()
@@ -1368,52 +1725,118 @@ class Admitter(doing.Doer):
                 self.psr.parseOne(ims=ims)
 
 
+class StatusTevery(Tevery):
+    """Tevery cueing the SAID of each credential it issues or revokes so its status is reindexed"""
+
+    def __init__(self, statuses, **kwa):
+        """
+        Parameters:
+            statuses (Deck): receives a status cue for each credential issued or revoked
+        """
+        self.statuses = statuses
+        super(StatusTevery, self).__init__(**kwa)
+
+    def processEvent(self, serder, seqner=None, saider=None, wigers=None):
+        super(StatusTevery, self).processEvent(
+            serder=serder, seqner=seqner, saider=saider, wigers=wigers
+        )
+        # Escrowed events raise above and are cued when the escrow processes them here
+        if serder.ilk in (Ilks.iss, Ilks.bis, Ilks.rev, Ilks.brv):
+            self.statuses.append(dict(kin="status", said=serder.pre))
+
+
 class SeekerDoer(doing.Doer):
+    """Indexes saved credentials, draining up to BatchSize cues per run in one index write
+
+    Status cues of credentials issued or revoked move their status index entries after the batch
+    is indexed.
+    """
+
+    BatchSize = 100
+
     def __init__(self, seeker, cues, tock=0.0):
         self.seeker = seeker
         self.cues = cues
         self.tock = tock
+        self.retries = 0
         super(SeekerDoer, self).__init__(tock=self.tock)
 
+    @property
+    def idle(self):
+        """True when the only queued cues are those put back by the last run to be retried later"""
+        return len(self.cues) <= self.retries
+
     def recur(self, tyme=None, tock=0.0, **opts):
-        if self.cues:
+        batch = []
+        statuses = []
+        taken = min(len(self.cues), self.BatchSize)
+        kept = len(self.cues) - taken
+        for _ in range(taken):
             cue = self.cues.popleft()
             if cue["kin"] == "saved":
-                creder = cue["creder"]
-                try:
-                    self.seeker.index(said=creder.said)
-                except Exception:
-                    self.cues.append(cue)
-                    return False
+                batch.append(cue)
+            elif cue["kin"] == "status":
+                statuses.append(cue["said"])
             else:
-                self.cues.append(cue)
-                return False
+                requeue(self.cues, cue)
+
+        indexBatch(self.seeker, self.cues, batch, [cue["creder"].said for cue in batch])
+        if statuses:
+            self.seeker.updateStatus(statuses)
+        self.retries = len(self.cues) - kept
+        return False
 
 
 class ExchangeCueDoer(doing.Doer):
+    """Indexes saved exns, draining up to BatchSize cues per run in one index write"""
+
+    BatchSize = 100
+
     def __init__(self, seeker, cues, queries, tock=0.0):
         self.seeker = seeker
         self.cues = cues
         self.queries = queries
         self.tock = tock
+        self.retries = 0
         super(ExchangeCueDoer, self).__init__(tock=self.tock)
 
+    @property
+    def idle(self):
+        """True when the only queued cues are those put back by the last run to be retried later"""
+        return len(self.cues) <= self.retries
+
     def recur(self, tyme=None, tock=0.0, **opts):
-        if self.cues:
+        batch = []
+        taken = min(len(self.cues), self.BatchSize)
+        kept = len(self.cues) - taken
+        for _ in range(taken):
             cue = self.cues.popleft()
             if cue["kin"] == "saved":
-                said = cue["said"]
-                try:
-                    self.seeker.index(said=said)
-                except Exception:
-                    self.cues.append(cue)
-                    return False
+                batch.append(cue)
             elif cue["kin"] == "query":
                 self.queries.append(cue["q"])
-                return False
             else:
-                self.cues.append(cue)
-                return False
+                requeue(self.cues, cue)
+
+        indexBatch(self.seeker, self.cues, batch, [cue["said"] for cue in batch])
+        self.retries = len(self.cues) - kept
+        return False
+
+
+def indexBatch(seeker, cues, batch, saids):
+    """Index saids in one write, requeueing the cue of each one that cannot be indexed yet"""
+    if not batch:
+        return
+
+    try:
+        seeker.indexBatch(saids)
+    except Exception:
+        # Find the failures one by one so the rest of the batch is indexed
+        for cue, said in zip(batch, saids):
+            try:
+                seeker.index(said=said)
+            except Exception:
+                requeue(cues, cue)
 
 
 class Initer(doing.Doer):
@@ -1425,6 +1848,11 @@ class Initer(doing.Doer):
         self.tock = tock
         super(Initer, self).__init__(tock=self.tock)
 
+    @property
+    def idle(self):
+        """True until the agent is initialized so the Initer runs once it is."""
+        return not self.agentHab.inited
+
     def print_agent(self):
         """Prints agent and associated controller name and prefix"""
         if not self.agentHab.inited:
@@ -1450,6 +1878,10 @@ class GroupRequester(doing.Doer):
         self.tock = tock
         super(GroupRequester, self).__init__(tock=self.tock)
 
+    @property
+    def idle(self):
+        return not self.groups
+
     def recur(self, tyme, tock=0.0, **opts):
         """Checks cue for group processing requests and handles any with Counselor"""
         if self.groups:
@@ -1481,6 +1913,11 @@ class Querier(doing.DoDoer):
         self.tock = tock
         super(Querier, self).__init__(always=True, tock=self.tock)
 
+    @property
+    def idle(self):
+        """True when there are no queued queries and no queries in progress."""
+        return not self.queries and not self.deeds
+
     def recur(self, tyme, deeds=None):
         """Processes query reqests submitting any on the cue"""
         if self.queries:
@@ -1534,9 +1971,22 @@ class Escrower(doing.Doer):
         self.registrar = registrar
         self.credentialer = credentialer
         self.tock = tock
+        # Databases holding the escrows and the last transaction written to each at the last run
+        self.dbs = (kvy.db, rgy.reger)
+        self.writes = self.written()
 
         super(Escrower, self).__init__(tock=self.tock)
 
+    @property
+    def idle(self):
+        """True when no escrow could have new entries, as nothing was written to the databases
+        holding them since the last run. Entries left in escrow are retried on the idle timer."""
+        return self.writes == self.written()
+
+    def written(self):
+        """Id of the last transaction written to each database holding escrows"""
+        return tuple(db.env.info()["last_txnid"] for db in self.dbs)
+
     def recur(self, tyme, tock=0.0, **opts):
         """Process all escrows once per loop."""
         self.kvy.processEscrows()
@@ -1549,42 +1999,271 @@ class Escrower(doing.Doer):
         self.vry.processEscrows()
         self.registrar.processEscrows()
         self.credentialer.processEscrows()
+        self.writes = self.written()
         return False
 
 
 class Releaser(doing.Doer):
-    def __init__(self, agency: Agency, releaseTimeout=86400):
-        """Check open agents and close if idle for more than releaseTimeout seconds
+    """
+    Keeps agent residency within budget by releasing least recently used agents.
+
+    Resident agents are kept in a min heap keyed on Agent.last so each check only looks at the
+    least recently used agents instead of scanning all of them. Heap entries are refreshed lazily
+    when an agent has been used since it was pushed.
+    """
+
+    def __init__(
+        self, agency: Agency, releaseTimeout=86400, maxAgents=None, maxRss=None
+    ):
+        """Check open agents and close if idle for more than releaseTimeout seconds or over budget
         Parameters:
             agency (Agency): KERIA agent manager
-            releaseTimeout (int): Timeout in seconds
+            releaseTimeout (int | None): Timeout in seconds, None never releases idle agents
+            maxAgents (int | None): Maximum number of resident agents, None for no limit
+            maxRss (int | None): Resident memory budget of the process in MiB, None for no budget
 
         """
-        self.tock = 60.0
+        self.tock = 1.0
         self.agents = agency.agents
         self.agency = agency
         self.releaseTimeout = releaseTimeout
+        self.maxAgents = maxAgents
+        self.maxRss = maxRss
+        self.heap = []  # (last, caid) of resident agents, least recently used first
+        self.evictions = dict(idle=0, count=0, rss=0)
 
         super(Releaser, self).__init__(tock=self.tock)
 
+    def admit(self, agent):
+        """Start tracking the residency of a newly loaded agent"""
+        heapq.heappush(self.heap, (agent.last, agent.caid))
+
+    def oldest(self):
+        """Returns the least recently used resident agent or None if there are none"""
+        while self.heap:
+            last, caid = self.heap[0]
+            agent = self.agents.get(caid)
+            if agent is None:  # released elsewhere
+                heapq.heappop(self.heap)
+            elif agent.last != last:  # used since pushed, move to its place
+                heapq.heapreplace(self.heap, (agent.last, caid))
+            else:
+                return agent
+
+        return None
+
+    def release(self):
+        """Release least recently used agents until idle timeout and budgets are met
+
+        Agents with a stream or long poll still open are in use, they are moved behind the others.
+        """
+        now = helping.nowUTC()
+        while (agent := self.oldest()) is not None:
+            if agent.monitor.busy:
+                if agent.last == now:  # every agent left is in use or used since now
+                    break
+                agent.last = now
+                continue
+
+            if self.releaseTimeout is not None and (
+                now - agent.last
+            ) > datetime.timedelta(seconds=self.releaseTimeout):
+                reason = "idle"
+            elif self.maxAgents is not None and len(self.agents) > self.maxAgents:
+                reason = "count"
+            elif self.maxRss is not None and (rss := residentSetSize()) is not None:
+                if rss <= self.maxRss * 1024 * 1024:
+                    break
+                # Freed memory is not always returned to the OS right away, release one per check
+                self.evict(agent, "rss")
+                break
+            else:
+                break
+
+            self.evict(agent, reason)
+
+    def evict(self, agent, reason):
+        """Shut down agent and record the reason it was released"""
+        logger.info(f"Releasing agent {agent.caid}, reason: {reason}")
+        heapq.heappop(self.heap)
+        self.evictions[reason] += 1
+        self.agency.release(agent)
+
+    def metrics(self):
+        """Returns residency and eviction counters"""
+        return dict(
+            resident=len(self.agents),
+            maxAgents=self.maxAgents,
+            rss=residentSetSize(),
+            maxRss=self.maxRss,
+            evictions=dict(self.evictions),
+            credentialCache=self.cacheMetrics(),
+        )
+
+    def cacheMetrics(self):
+        """Returns the credential cache counters summed over the resident agents"""
+        totals = dict(hits=0, misses=0, sads=0, clones=0)
+        for agent in self.agents.values():
+            for key, val in agent.seeker.cache.metrics().items():
+                totals[key] += val
+
+        return totals
+
     def recur(self, tyme=None, tock=0.0, **opts):
         while True:
-            idle = []
-            for caid in self.agents:
-                now = helping.nowUTC()
-                if (now - self.agents[caid].last) > datetime.timedelta(
-                    seconds=self.releaseTimeout
-                ):
-                    idle.append(caid)
-
-            for caid in idle:
-                self.agency.shut(self.agents[caid])
+            if not self.agency.shouldShutdown:
+                self.release()
             yield self.tock
 
 
+class Collector(doing.Doer):
+    """
+    Removes the long running operations of resident agents that finished more than a retention
+    period ago. Each run removes at most .batch operations, taking turns over the agents so every
+    agent is collected from.
+    """
+
+    def __init__(self, agency: Agency, retention=None, batch=100):
+        """
+        Parameters:
+            agency (Agency): KERIA agent manager
+            retention (int | None): Seconds finished operations are kept, None never removes them
+            batch (int): Most operations removed per run
+
+        """
+        self.tock = 1.0
+        self.agents = agency.agents
+        self.agency = agency
+        self.retention = retention
+        self.batch = batch
+        self.turn = 0
+        self.reclaimed = dict()  # operations removed, keyed by caid
+
+        super(Collector, self).__init__(tock=self.tock)
+
+    def collect(self):
+        """Remove up to .batch finished operations past retention, returns the number removed"""
+        if self.retention is None or not self.agents:
+            return 0
+
+        cutoff = helping.nowUTC() - datetime.timedelta(seconds=self.retention)
+        caids = list(self.agents)
+        budget = self.batch
+        for i in range(len(caids)):
+            if budget <= 0:
+                break
+
+            caid = caids[(self.turn + i) % len(caids)]
+            if (count := self.agents[caid].monitor.collect(cutoff, limit=budget)) > 0:
+                logger.info(f"Removed {count} finished operations of agent {caid}")
+                self.reclaimed[caid] = self.reclaimed.get(caid, 0) + count
+                budget -= count
+
+        self.turn = (self.turn + 1) % len(caids)
+        return self.batch - budget
+
+    def metrics(self):
+        """Returns the retention and the operations removed per agent"""
+        return dict(
+            retention=self.retention,
+            reclaimed=sum(self.reclaimed.values()),
+            agents=dict(self.reclaimed),
+        )
+
+    def recur(self, tyme=None, tock=0.0, **opts):
+        while True:
+            if not self.agency.shouldShutdown:
+                self.collect()
+            yield self.tock
+
+
+def residentSetSize():
+    """Returns the resident set size of this process in bytes or None if it cannot be read"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class Loader(doing.Doer):
+    """
+    Loads cold agents on a pool of background threads and installs them into the Agency
+    from the Doist thread once their databases are open.
+    """
+
+    RetryAfter = 1  # seconds clients are asked to wait before retrying a request for a loading agent
+
+    def __init__(self, agency: Agency, workers=0, tock=0.0):
+        """Create a loader for the agency
+
+        Parameters:
+            agency (Agency): KERIA agent manager
+            workers (int): Number of loader threads, 0 disables background loading
+            tock (float): Seconds between checks for completed loads
+
+        """
+        self.agency = agency
+        self.workers = workers
+        self.loads = dict()
+        self.pool = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="keria-loader")
+            if workers
+            else None
+        )
+
+        super(Loader, self).__init__(tock=tock)
+
+    def submit(self, caid, aaid):
+        """Start loading the agent for caid if not already loading
+
+        Returns:
+            bool: True if a finished load is waiting to be retrieved, False while still loading
+        """
+        if caid not in self.loads:
+            logger.info(f"Loading agent {caid} in background")
+            self.loads[caid] = self.pool.submit(self.agency.load, caid, aaid)
+
+        return self.loads[caid].done()
+
+    def wait(self, caid):
+        """Returns the agent for caid from a load in flight, waiting for it to complete, or None.
+        Load errors are raised to the caller."""
+        if caid not in self.loads:
+            return None
+
+        agent = self.loads.pop(caid).result()
+        self.agency.install(agent)
+        agent.last = helping.nowUTC()
+        return agent
+
+    def recur(self, tyme=None, tock=0.0, **opts):
+        """Installs agents whose loads completed successfully. Failed loads are left for get to raise."""
+        for caid, future in list(self.loads.items()):
+            if future.done() and future.exception() is None:
+                del self.loads[caid]
+                self.agency.install(future.result())
+
+        return False
+
+    def exit(self):
+        """Stop the loader threads and close any agent loaded after shutdown began."""
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+
+        for caid, future in list(self.loads.items()):
+            del self.loads[caid]
+            if not future.cancelled() and future.exception() is None:
+                future.result().shutdownAgent()
+
+
 def loadEnds(app):
     opColEnd = longrunning.OperationCollectionEnd()
     app.add_route("/operations", opColEnd)
+    opStreamEnd = longrunning.OperationStreamEnd()
+    app.add_route("/operations/events", opStreamEnd)
+    opStatusEnd = longrunning.OperationStatusCollectionEnd()
+    app.add_route("/operations/status", opStatusEnd)
     opResEnd = longrunning.OperationResourceEnd()
     app.add_route("/operations/{name}", opResEnd)
 
@@ -1601,6 +2280,8 @@ def loadEnds(app):
 
     queryEnd = QueryCollectionEnd()
     app.add_route("/queries", queryEnd)
+    slowQueryEnd = SlowQueryCollectionEnd()
+    app.add_route("/queries/slow", slowQueryEnd)
 
     configEnd = ConfigResourceEnd()
     app.add_route("/config", configEnd)
@@ -1784,9 +2465,19 @@ class BootEnd:
 class HealthEnd:
     """Health resource for determining that a container is live"""
 
+    def __init__(self, agency=None):
+        """
+        Parameters:
+            agency (Agency | None): agency whose agent residency and operation collection metrics are reported
+        """
+        self.agency = agency
+
     def on_get(self, req, resp):
         resp.status = falcon.HTTP_OK
         resp.media = {"message": f"Health is okay. Time is {nowIso8601()}"}
+        if self.agency is not None:
+            resp.media["agents"] = self.agency.releaser.metrics()
+            resp.media["operations"] = self.agency.collector.metrics()
 
 
 class KeyStateCollectionEnd:
@@ -2218,6 +2909,10 @@ class Submitter(doing.DoDoer):
 
         super(Submitter, self).__init__(always=True)
 
+    @property
+    def idle(self):
+        return not self.submits and not self.doers
+
     def recur(self, tyme, deeds=None):
         """Processes submit reqests submitting any on the cue"""
         if self.submits:
@@ -2257,6 +2952,39 @@ class AgentConfig:
     iurls: list[str] = field(default_factory=list)
 
 
+class SlowQueryCollectionEnd:
+    @staticmethod
+    def on_get(req, rep):
+        """Slow query log GET endpoint
+
+        Parameters:
+            req (Request): falcon.Request HTTP request
+            rep (Response): falcon.Response HTTP response
+
+        ---
+        summary: List slow credential and exchange message queries
+        description: List the most recent queries of this agent that took longer than the slow query
+                     threshold, oldest first, with the plan each used and where its time went
+        tags:
+          - Queries
+        responses:
+           200:
+              description: Slow queries
+              content:
+                application/json:
+                  schema:
+                    type: array
+                    items:
+                      type: object
+
+        """
+        agent = req.context.agent
+
+        rep.status = falcon.HTTP_200
+        rep.content_type = "application/json"
+        rep.data = json.dumps(list(agent.queryLog.entries)).encode("utf-8")
+
+
 class ConfigResourceEnd:
     @staticmethod
     def on_get(req, rep):
@@ -0,0 +1,122 @@
+# -*- encoding: utf-8 -*-
+"""
+KERIA
+keria.app.cli.commands module
+
+"""
+
+import argparse
+import time
+
+from keri import help
+
+from keria.core.keeping import RemoteKeeper
+from keria.core.longrunning import Operator
+from keria.db import basing
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(
+    description="Copies the Seeker, ExnSeeker, Operator and RemoteKeeper databases of every agent into one "
+    "shared LMDB environment per agent for use with KERIA_SHARED_DB. Run while the agency is stopped."
+)
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument(
+    "--base",
+    "-b",
+    help="additional optional prefix to file location of KERI keystore",
+    required=False,
+    default="",
+)
+parser.add_argument(
+    "--force",
+    action="store_true",
+    required=False,
+    default=False,
+    help="Perform migration, otherwise only list the agents to migrate",
+)
+
+
+def handler(args):
+    # The keria entry point calls handlers directly rather than running returned doers
+    return migrate(args)
+
+
+def stores(name, base, shared=None):
+    """Open the KERIA owned databases of an agent, in their own environments or in shared"""
+    return [
+        basing.Seeker(
+            name=name, base=base, db=None, reger=None, reopen=True, shared=shared
+        ),
+        basing.ExnSeeker(name=name, base=base, db=None, reopen=True, shared=shared),
+        Operator(name=name, base=base, reopen=True, shared=shared),
+        RemoteKeeper(name=name, base=base, reopen=True, clear=False, shared=shared),
+    ]
+
+
+def subdbs(store):
+    """Returns the opened sub databases of store keyed by attribute or index name"""
+    dbs = {name: val for name, val in vars(store).items() if hasattr(val, "sdb")}
+    for key, idx in getattr(store, "indexes", {}).items():
+        dbs[f"indexes.{key}"] = idx
+    return dbs
+
+
+def copy(src, dst):
+    """Copy every entry of every sub database of src into the same sub database of dst
+
+    Returns:
+        int: number of entries copied
+    """
+    count = 0
+    dbs = subdbs(dst)
+    with src.env.begin() as stxn, dst.env.begin(write=True) as dtxn:
+        for name, sub in subdbs(src).items():
+            for key, val in stxn.cursor(db=sub.sdb):
+                dtxn.put(key, val, db=dbs[name].sdb, dupdata=True)
+                count += 1
+
+    return count
+
+
+def timed(name, base, shared=False):
+    """Seconds taken to open and close the agent's KERIA owned databases in either layout"""
+    start = time.perf_counter()
+    kdb = basing.AgentBaser(name=name, base=base, reopen=True) if shared else None
+    for store in stores(name, base, shared=kdb):
+        store.close()
+    if kdb is not None:
+        kdb.close()
+    return time.perf_counter() - start
+
+
+def migrate(args):
+    adb = basing.AgencyBaser(name="TheAgency", base=args.base, reopen=True, temp=False)
+    caids = [caid for (caid,), _ in adb.agnt.getItemIter()]
+    adb.close()
+
+    if not args.force:
+        print(f"{len(caids)} agents to migrate, rerun with --force to migrate them")
+        return 0
+
+    for caid in caids:
+        kdb = basing.AgentBaser(name=caid, base=args.base, reopen=True)
+        count = 0
+        for src, dst in zip(stores(caid, args.base), stores(caid, args.base, kdb)):
+            # First pass brings over the dynIdx records that name the dynamic Seeker indexes,
+            # reopening opens those indexes so the second pass can fill them
+            copy(src, dst)
+            dst.reopen()
+            count += copy(src, dst)
+            src.close()
+            dst.close()
+        kdb.close()
+
+        before = timed(caid, args.base)
+        after = timed(caid, args.base, shared=True)
+        print(
+            f"{caid}: copied {count} entries, open/close {before * 1000:.1f}ms separate, "
+            f"{after * 1000:.1f}ms shared"
+        )
+
+    return 0
@@ -0,0 +1,125 @@
+# -*- encoding: utf-8 -*-
+"""
+KERIA
+keria.app.cli.commands module
+
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from keri import help
+from keri.db import basing as kbasing
+from keri.vdr import viring
+
+from keria.db import basing
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(
+    description="Rebuilds the credential (Seeker) and exchange message (ExnSeeker) indexes of every agent "
+    "from their saved credentials and exchange messages. Run while the agency is stopped."
+)
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument(
+    "--base",
+    "-b",
+    help="additional optional prefix to file location of KERI keystore",
+    required=False,
+    default="",
+)
+parser.add_argument(
+    "--workers",
+    "-w",
+    help="number of agents to reindex in parallel, defaults to the number of CPUs",
+    required=False,
+    type=int,
+    default=os.cpu_count(),
+)
+parser.add_argument(
+    "--shared-db",
+    dest="sharedDb",
+    action="store_true",
+    required=False,
+    default=False,
+    help="Agents keep their indexes in the shared agent database (KERIA_SHARED_DB)",
+)
+parser.add_argument(
+    "--caid",
+    action="append",
+    required=False,
+    default=None,
+    help="Only reindex the agent of this controller AID, may be repeated",
+)
+
+
+def handler(args):
+    return reindex(args)
+
+
+def rebuild(caid, base, sharedDb=False):
+    """Empty and bulk load the Seeker and ExnSeeker indexes of the agent of caid
+
+    Returns:
+        tuple: caid, credentials indexed, exns indexed, index entries written, seconds taken
+    """
+    start = time.perf_counter()
+    db = kbasing.Baser(name=caid, base=base, reopen=True)
+    reger = viring.Reger(name=caid, base=base, db=db, reopen=True)
+    kdb = basing.AgentBaser(name=caid, base=base, reopen=True) if sharedDb else None
+    seeker = basing.Seeker(
+        name=caid, base=base, db=db, reger=reger, reopen=True, shared=kdb
+    )
+    exnseeker = basing.ExnSeeker(name=caid, base=base, db=db, reopen=True, shared=kdb)
+
+    try:
+        creds = [said for (said,), _ in reger.saved.getItemIter()]
+        seeker.reset()
+        count = seeker.batch(creds).load()
+
+        exns = [said for (said,), _ in db.exns.getItemIter()]
+        exnseeker.reset()
+        count += exnseeker.batch(exns).load()
+    finally:
+        for store in (exnseeker, seeker, kdb, reger, db):
+            if store is not None:
+                store.close()
+
+    return caid, len(creds), len(exns), count, time.perf_counter() - start
+
+
+def reindex(args):
+    adb = basing.AgencyBaser(name="TheAgency", base=args.base, reopen=True, temp=False)
+    caids = args.caid or [caid for (caid,), _ in adb.agnt.getItemIter()]
+    adb.close()
+
+    print(f"Reindexing {len(caids)} agents with {args.workers} workers")
+    start = time.perf_counter()
+    done = entries = failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(rebuild, caid, args.base, args.sharedDb): caid for caid in caids
+        }
+        for future in as_completed(futures):
+            done += 1
+            try:
+                caid, creds, exns, count, took = future.result()
+            except Exception as ex:
+                failed += 1
+                print(f"[{done}/{len(caids)}] {futures[future]}: failed {ex}")
+                continue
+
+            entries += count
+            print(
+                f"[{done}/{len(caids)}] {caid}: {creds} credentials, {exns} exchanges, "
+                f"{count} index entries in {took:.2f}s ({count / max(took, 1e-6):.0f} entries/s)"
+            )
+
+    took = time.perf_counter() - start
+    print(
+        f"Reindexed {done - failed} agents, {entries} index entries in {took:.2f}s "
+        f"({entries / max(took, 1e-6):.0f} entries/s), {failed} failed"
+    )
+    return -1 if failed else 0
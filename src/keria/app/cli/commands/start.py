@@ -13,7 +13,7 @@ import os
 from keri import __version__
 from keri import help
 
-from keria.app import agenting
+from keria.app import agenting, sharding
 
 d = "Runs KERI Signify Agent\n"
 d += "\tExample:\nkli ahab\n"
@@ -137,34 +137,59 @@ logger = help.ogler.getLogger()
 
 
 def launch(args):
-    agenting.runAgency(
-        agenting.KERIAServerConfig(
-            name=args.name or "ahab",
-            base=args.base or "",
-            bran=args.bran,
-            adminPort=args.admin,
-            httpPort=args.http,
-            bootPort=args.boot,
-            configFile=args.configFile,
-            configDir=args.configDir,
-            keyPath=args.keypath,
-            certPath=args.certpath,
-            caFilePath=args.cafilepath,
-            logLevel=args.loglevel,
-            logFile=args.logfile,
-            logRequests=args.logrequests if args.logrequests else False,
-            cors=os.getenv("KERI_AGENT_CORS", "false").lower() in ("true", "1"),
-            releaseTimeout=int(os.getenv("KERIA_RELEASER_TIMEOUT", "86400")),
-            curls=getListVariable("KERIA_CURLS"),
-            iurls=getListVariable("KERIA_IURLS"),
-            durls=getListVariable("KERIA_DURLS"),
-            bootPassword=args.bootPassword,
-            bootUsername=args.bootUsername,
-        )
+    config = agenting.KERIAServerConfig(
+        name=args.name or "ahab",
+        base=args.base or "",
+        bran=args.bran,
+        adminPort=args.admin,
+        httpPort=args.http,
+        bootPort=args.boot,
+        configFile=args.configFile,
+        configDir=args.configDir,
+        keyPath=args.keypath,
+        certPath=args.certpath,
+        caFilePath=args.cafilepath,
+        logLevel=args.loglevel,
+        logFile=args.logfile,
+        logRequests=args.logrequests if args.logrequests else False,
+        cors=os.getenv("KERI_AGENT_CORS", "false").lower() in ("true", "1"),
+        releaseTimeout=int(os.getenv("KERIA_RELEASER_TIMEOUT", "86400")),
+        maxAgents=getIntVariable("KERIA_MAX_AGENTS"),
+        maxRss=getIntVariable("KERIA_MAX_RSS"),
+        sharedDb=os.getenv("KERIA_SHARED_DB", "false").lower() in ("true", "1"),
+        exnIndexes=getListVariable("KERIA_EXN_INDEXES"),
+        credentialCacheSize=int(os.getenv("KERIA_CREDENTIAL_CACHE_SIZE", "1024")),
+        credentialCacheBudget=int(os.getenv("KERIA_CREDENTIAL_CACHE_BUDGET", "65536")),
+        slowQueryThreshold=getFloatVariable("KERIA_SLOW_QUERY_MS"),
+        opRetention=getIntVariable("KERIA_OP_RETENTION"),
+        opCollectBatch=int(os.getenv("KERIA_OP_COLLECT_BATCH", "100")),
+        idleTock=getFloatVariable("KERIA_IDLE_TOCK"),
+        loaders=int(os.getenv("KERIA_AGENT_LOADERS", "0")),
+        curls=getListVariable("KERIA_CURLS"),
+        iurls=getListVariable("KERIA_IURLS"),
+        durls=getListVariable("KERIA_DURLS"),
+        bootPassword=args.bootPassword,
+        bootUsername=args.bootUsername,
+        shards=int(os.getenv("KERIA_SHARDS", "0")),
+        shardPort=int(os.getenv("KERIA_SHARD_PORT", "4901")),
     )
+    if config.shards > 1:
+        sharding.runShardedAgency(config)
+    else:
+        agenting.runAgency(config)
     logger.info("Agent %s gracefully stopped", args.name)
 
 
 def getListVariable(name):
     value = os.getenv(name)
     return value.split(";") if value else None
+
+
+def getIntVariable(name):
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+def getFloatVariable(name):
+    value = os.getenv(name)
+    return float(value) if value else None
@@ -7,6 +7,7 @@ services and endpoint for ACDC credential managements
 """
 
 import json
+import time
 from dataclasses import asdict, dataclass, field
 
 import falcon
@@ -66,6 +67,10 @@ def loadEnds(app, identifierResource):
 
     queryCollectionEnd = CredentialQueryCollectionEnd()
     app.add_route("/credentials/query", queryCollectionEnd)
+    queryCountEnd = CredentialQueryCountEnd()
+    app.add_route("/credentials/query/count", queryCountEnd)
+    chainEnd = CredentialChainEnd()
+    app.add_route("/credentials/{said}/chains", chainEnd)
 
     credentialVerificationEnd = CredentialVerificationCollectionEnd()
     app.add_route("/credentials/verify", credentialVerificationEnd)
@@ -780,9 +785,30 @@ class CredentialQueryCollectionEnd:
                 type: string
              description:  schema to filter by if provided
              required: false
+        requestBody:
+            content:
+              application/json:
+                schema:
+                  type: object
+                  properties:
+                    after:
+                      type: string
+                      description: Continuation-Token of the previous page to resume after.
+                    explain:
+                      type: boolean
+                      description: Return the query plan, the entries it read and its timings with the SAIDs found.
+                    count:
+                      type: boolean
+                      description: Count every matching record for the total of the Content-Range header, which
+                                   is * when the page is full and not counted.
         responses:
            200:
-              description: Credential list.
+              description: Credential list, or the explained query when explain is set.
+              headers:
+                Continuation-Token:
+                  schema:
+                    type: string
+                  description: Pass as `after` to get the next page, only present when the page is full.
               content:
                   application/json:
                     schema:
@@ -814,25 +840,194 @@ class CredentialQueryCollectionEnd:
                 limit = body["limit"]
             else:
                 limit = 25
+
+            after = body.get("after")
+            explain = body.get("explain", False)
+            counting = body.get("count", False)
         except falcon.HTTPError:
             filtr = {}
             sort = {}
             skip = 0
             limit = 25
+            after = None
+            explain = False
+            counting = False
+
+        try:
+            cur = agent.seeker.find(
+                filtr=filtr, sort=sort, skip=skip, limit=limit, after=after
+            )
+            saids = [coring.Saider(qb64=said) for said in cur]
+            total = cur.total(count=counting)
+        except ValueError as ex:
+            raise falcon.HTTPBadRequest(description=ex.args[0])
 
-        cur = agent.seeker.find(filtr=filtr, sort=sort, skip=skip, limit=limit)
-        saids = [coring.Saider(qb64=said) for said in cur]
-        creds = agent.rgy.reger.cloneCreds(saids=saids, db=agent.hby.db)
+        if (token := cur.token) is not None:
+            rep.set_header("Continuation-Token", token)
+
+        if explain:
+            agent.queryLog.record("credentials", cur)
+            rep.status = falcon.HTTP_200
+            rep.content_type = "application/json"
+            rep.data = json.dumps(
+                dict(cur.explain(), count=total, results=[said.qb64 for said in saids])
+            ).encode("utf-8")
+            return
+
+        start = time.perf_counter()
+        creds = agent.seeker.cloneCreds(saids=saids, db=agent.hby.db)
+        cur.timings["load"] = (time.perf_counter() - start) * 1000
+        agent.queryLog.record("credentials", cur)
 
         end = skip + (len(creds) - 1) if len(creds) > 0 else 0
         rep.set_header("Accept-Ranges", "credentials")
-        rep.set_header("Content-Range", f"credentials {skip}-{end}/{limit}")
+        rep.set_header(
+            "Content-Range",
+            f"credentials {skip}-{end}/{'*' if total is None else total}",
+        )
 
         rep.status = falcon.HTTP_200
         rep.content_type = "application/json"
         rep.data = json.dumps(creds).encode("utf-8")
 
 
+class CredentialQueryCountEnd:
+    """Counts the credentials matching a credential query without loading them"""
+
+    @staticmethod
+    def on_post(req, rep):
+        """Credential query count POST endpoint
+
+        Parameters:
+            req: falcon.Request HTTP request
+            rep: falcon.Response HTTP response
+
+        ---
+        summary:  Count credentials matching a query
+        description: Count the credentials in the credential store (wallet) matching a query filter
+        operationId: countCredentials
+        tags:
+           - Credentials
+        requestBody:
+            content:
+              application/json:
+                schema:
+                  type: object
+                  properties:
+                    filter:
+                      type: object
+                      description: The filter criteria of the credential query.
+        responses:
+           200:
+              description: Number of matching credentials.
+              content:
+                  application/json:
+                    schema:
+                        type: object
+                        properties:
+                          count:
+                            type: integer
+           400:
+              description: Invalid filter.
+
+        """
+        agent = req.context.agent
+        try:
+            body = req.get_media()
+            filtr = body.get("filter", {})
+        except falcon.HTTPError:
+            filtr = {}
+
+        try:
+            count = agent.seeker.count(filtr=filtr)
+        except ValueError as ex:
+            raise falcon.HTTPBadRequest(description=ex.args[0])
+
+        rep.status = falcon.HTTP_200
+        rep.content_type = "application/json"
+        rep.data = json.dumps(dict(count=count)).encode("utf-8")
+
+
+class CredentialChainEnd:
+    """Traverses the chains between credentials from the Seeker edge indexes"""
+
+    # Most edges a traversal may follow
+    MaxDepth = 16
+
+    @staticmethod
+    def on_get(req, rep, said):
+        """Credential chain GET endpoint
+
+        Parameters:
+            req: falcon.Request HTTP request
+            rep: falcon.Response HTTP response
+            said (str): SAID of the credential to start from
+
+        ---
+        summary:  Credentials chained from or to a credential
+        description: List the credentials a credential chains to through its edges, or with reverse the
+                     credentials chaining to it, up to depth edges away
+        operationId: getCredentialChains
+        tags:
+           - Credentials
+        parameters:
+          - in: path
+            name: said
+            schema:
+              type: string
+            required: true
+            description: SAID of the credential to start from
+          - in: query
+            name: depth
+            schema:
+              type: integer
+            required: false
+            description: number of edges to follow, default 1
+          - in: query
+            name: reverse
+            schema:
+              type: boolean
+            required: false
+            description: list the credentials chaining to the credential instead
+        responses:
+           200:
+              description: SAID and depth of each credential found, nearest first.
+              content:
+                  application/json:
+                    schema:
+                        type: array
+                        items:
+                          type: object
+                          properties:
+                            said:
+                              type: string
+                            depth:
+                              type: integer
+           400:
+              description: Invalid depth.
+           404:
+              description: The requested credential was not found.
+        """
+        agent = req.context.agent
+        depth = req.get_param_as_int(
+            "depth", default=1, min_value=1, max_value=CredentialChainEnd.MaxDepth
+        )
+        reverse = req.get_param_as_bool("reverse", default=False)
+
+        if agent.rgy.reger.saved.get(keys=(said,)) is None:
+            raise falcon.HTTPNotFound(
+                description=f"credential for said {said} not found."
+            )
+
+        found = agent.seeker.chain(said, depth=depth, reverse=reverse)
+
+        rep.status = falcon.HTTP_200
+        rep.content_type = "application/json"
+        rep.data = json.dumps(
+            [dict(said=other, depth=step) for other, step in found]
+        ).encode("utf-8")
+
+
 class CredentialCollectionEnd:
     def __init__(self, identifierResource):
         """
@@ -1024,9 +1219,7 @@ class CredentialResourceEnd:
             data = CredentialResourceEnd.outputCred(agent.hby, agent.rgy, said)
         else:
             rep.content_type = "application/json"
-            creds = agent.rgy.reger.cloneCreds(
-                [coring.Saider(qb64=said)], db=agent.hby.db
-            )
+            creds = agent.seeker.cloneCreds([coring.Saider(qb64=said)], db=agent.hby.db)
             data = json.dumps(creds[0]).encode("utf-8")
 
         rep.status = falcon.HTTP_200
@@ -1235,7 +1428,7 @@ class CredentialResourceDeleteEnd:
             )
 
         try:
-            agent.rgy.reger.cloneCreds([coring.Saider(qb64=said)], db=agent.hby.db)
+            agent.seeker.cloneCreds([coring.Saider(qb64=said)], db=agent.hby.db)
         except Exception:
             raise falcon.HTTPNotFound(
                 description=f"credential for said {said} not found."
@@ -1623,6 +1816,9 @@ class Registrar:
             self.witPub.msgs.append(dict(pre=prefixer.qb64, msg=tevt))
             self.rgy.reger.ctel.put(keys=(regk, rseq.qb64), val=saider)  # idempotent
 
+            # Credential issued or revoked, the Seeker skips registry events
+            self.verifier.cues.append(dict(kin="status", said=regk))
+
 
 class Credentialer:
     """
@@ -70,6 +70,12 @@ class HttpEnd:
             raise falcon.HTTPBadRequest(title="CESR request destination header missing")
 
         aid = req.headers[CESR_DESTINATION_HEADER]
+        if not self.agency.warm(aid):
+            raise falcon.HTTPServiceUnavailable(
+                title=f"agent for {aid} is loading",
+                retry_after=self.agency.loader.RetryAfter,
+            )
+
         agent = self.agency.lookup(aid)
         if agent is None:
             raise falcon.HTTPNotFound(title=f"unknown destination AID {aid}")
@@ -141,6 +147,12 @@ class HttpEnd:
             raise falcon.HTTPBadRequest(title="CESR request destination header missing")
 
         aid = req.headers[CESR_DESTINATION_HEADER]
+        if not self.agency.warm(aid):
+            raise falcon.HTTPServiceUnavailable(
+                title=f"agent for {aid} is loading",
+                retry_after=self.agency.loader.RetryAfter,
+            )
+
         agent = self.agency.lookup(aid)
         if agent is None:
             raise falcon.HTTPNotFound(title=f"unknown destination AID {aid}")
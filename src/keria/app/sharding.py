@@ -0,0 +1,270 @@
+# -*- encoding: utf-8 -*-
+"""
+KERIA
+keria.app.sharding module
+
+Sharded Agency running one agency worker process per shard. Each controller AID (caid) belongs to
+the shard chosen by a stable hash of the caid and a front router forwards every request to the
+worker owning the caid it is for.
+
+Workers listen on 127.0.0.1 over plain HTTP, the router terminates TLS. Every worker opens the same
+AgencyBaser LMDB environment under the agency base directory, as does the router to resolve HTTP
+ingress requests, so all of them must run on one host. LMDB serializes their writes to it across
+processes, each agent's own databases are only opened by the worker owning its caid.
+"""
+
+import dataclasses
+import hashlib
+import http.client
+import json
+import multiprocessing
+import signal
+import socketserver
+import ssl
+import threading
+from urllib.parse import quote
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from . import agenting
+from .. import log_name, ogler
+from ..db import basing
+
+logger = ogler.getLogger(log_name)
+
+# Headers that apply to a single connection and are not forwarded
+HOP_HEADERS = (
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+)
+
+
+# Interface agency workers listen on, only the router may reach them
+WORKER_HOST = "127.0.0.1"
+
+
+def shardOf(caid, shards):
+    """Returns the index of the shard owning caid, stable across processes and restarts"""
+    digest = hashlib.blake2b(caid.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shards
+
+
+def shardConfig(config: agenting.KERIAServerConfig, index):
+    """Returns the configuration of the agency worker for shard index
+
+    Workers listen on 127.0.0.1 on consecutive ports from config.shardPort, three per shard for the
+    admin, HTTP and boot servers. TLS is terminated by the router.
+    """
+    port = config.shardPort + 3 * index
+    return dataclasses.replace(
+        config,
+        host=WORKER_HOST,
+        adminPort=port,
+        httpPort=port + 1 if config.httpPort else None,
+        bootPort=port + 2,
+        shards=0,
+        keyPath=None,
+        certPath=None,
+        caFilePath=None,
+    )
+
+
+class Router:
+    """WSGI application forwarding each request to the agency worker owning its controller AID"""
+
+    def __init__(self, ports, resolve, timeout=60.0):
+        """
+        Parameters:
+            ports (list[int]): port of this server on each shard worker, indexed by shard
+            resolve (Callable): returns the caid a request is for from its WSGI environ and body
+            timeout (float): seconds to wait on a worker before failing the request, event streams
+                are not timed out once they started
+        """
+        self.ports = ports
+        self.resolve = resolve
+        self.timeout = timeout
+
+    def __call__(self, environ, start_response):
+        length = environ.get("CONTENT_LENGTH")
+        body = environ["wsgi.input"].read(int(length)) if length else b""
+
+        caid = self.resolve(environ, body)
+        port = self.ports[shardOf(caid, len(self.ports)) if caid else 0]
+
+        path = quote(environ.get("PATH_INFO", "/").encode("iso-8859-1"))
+        if query := environ.get("QUERY_STRING"):
+            path = f"{path}?{query}"
+
+        headers = {
+            key[5:].replace("_", "-").title(): val
+            for key, val in environ.items()
+            if key.startswith("HTTP_")
+            and key[5:].replace("_", "-").lower() not in HOP_HEADERS
+        }
+        if environ.get("CONTENT_TYPE"):
+            headers["Content-Type"] = environ["CONTENT_TYPE"]
+
+        conn = http.client.HTTPConnection(WORKER_HOST, port, timeout=self.timeout)
+        try:
+            conn.request(environ["REQUEST_METHOD"], path, body=body, headers=headers)
+            sock = conn.sock  # handed over to the response when the worker closes it
+            rep = conn.getresponse()
+        except OSError as ex:
+            conn.close()
+            logger.error(f"Shard on port {port} unavailable: {ex}")
+            start_response(
+                "503 Service Unavailable",
+                [("Retry-After", "1"), ("Content-Type", "application/json")],
+            )
+            return [json.dumps(dict(title="agency shard unavailable")).encode("utf-8")]
+
+        # Event streams stay open longer than any request waits on a worker
+        if (rep.getheader("Content-Type") or "").startswith("text/event-stream"):
+            sock.settimeout(None)
+
+        start_response(
+            f"{rep.status} {rep.reason}",
+            [
+                (key, val)
+                for key, val in rep.getheaders()
+                if key.lower() not in HOP_HEADERS
+            ],
+        )
+        return self.stream(conn, rep)
+
+    @staticmethod
+    def stream(conn, rep):
+        """Yield the worker response body as it arrives so streamed responses keep streaming"""
+        try:
+            while chunk := rep.read1(65536):
+                yield chunk
+        finally:
+            conn.close()
+
+
+def adminResolver(environ, body):
+    """Admin requests are for the controller named in their signed Signify-Resource header"""
+    return environ.get("HTTP_SIGNIFY_RESOURCE")
+
+
+def bootResolver(environ, body):
+    """Boot requests are for the controller of the inception event in their body"""
+    if environ.get("PATH_INFO") != "/boot" or not body:
+        return None
+
+    try:
+        return json.loads(body)["icp"]["i"]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def ingressResolver(adb: basing.AgencyBaser):
+    """Returns resolver of HTTP ingress requests to the controller of their destination AID"""
+
+    def resolve(environ, body):
+        aid = environ.get("HTTP_CESR_DESTINATION")
+        if aid is None:
+            parts = environ.get("PATH_INFO", "").split("/")
+            if len(parts) > 2 and parts[1] == "oobi":
+                aid = parts[2]
+
+        return adb.controller(aid) if aid else None
+
+    return resolve
+
+
+class ThreadingServer(socketserver.ThreadingMixIn, WSGIServer):
+    """WSGI server handling each connection on its own thread so slow workers do not block others"""
+
+    daemon_threads = True
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+def createRouter(port, app, keypath=None, certpath=None, cafilepath=None):
+    """Create router server on port, serving TLS when key material is present"""
+    server = make_server(
+        "", port, app, server_class=ThreadingServer, handler_class=QuietHandler
+    )
+    if keypath is not None and certpath is not None and cafilepath is not None:
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH, cafile=cafilepath)
+        context.load_cert_chain(certfile=certpath, keyfile=keypath)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+    return server
+
+
+def runShardedAgency(config: agenting.KERIAServerConfig):
+    """Runs config.shards agency worker processes behind a router until SIGTERM or SIGINT"""
+    workers = []
+    for index in range(config.shards):
+        worker = multiprocessing.Process(
+            target=agenting.runAgency,
+            args=[shardConfig(config, index)],
+            name=f"keria-shard-{index}",
+        )
+        worker.start()
+        workers.append(worker)
+
+    # Opened after the workers are started so no LMDB environment is shared across fork
+    adb = basing.AgencyBaser(name="TheAgency", base=config.base, reopen=True)
+    shards = [shardConfig(config, index) for index in range(config.shards)]
+    routes = [
+        (config.adminPort, [shard.adminPort for shard in shards], adminResolver),
+        (config.bootPort, [shard.bootPort for shard in shards], bootResolver),
+    ]
+    if config.httpPort:
+        routes.append(
+            (
+                config.httpPort,
+                [shard.httpPort for shard in shards],
+                ingressResolver(adb),
+            )
+        )
+
+    servers = []
+    for port, ports, resolve in routes:
+        server = createRouter(
+            port,
+            Router(ports=ports, resolve=resolve),
+            config.keyPath,
+            config.certPath,
+            config.caFilePath,
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+
+    logger.info(
+        "Sharded agency with %s workers routing admin/%s, http/%s, boot/%s",
+        config.shards,
+        config.adminPort,
+        config.httpPort,
+        config.bootPort,
+    )
+    while not stop.wait(timeout=1.0):
+        if not all(worker.is_alive() for worker in workers):
+            logger.error("Agency shard exited, shutting down sharded agency")
+            break
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+    for worker in workers:  # SIGTERM lets each agency shut its agents down gracefully
+        if worker.is_alive():
+            worker.terminate()
+    for worker in workers:
+        worker.join(timeout=30)
+
+    adb.close()
@@ -180,6 +180,16 @@ class SignatureValidationComponent(object):
 
         req.path = quote(req.path)
 
+        try:
+            # Answer without blocking while a cold agent is loaded in the background
+            if not self.agency.warm(self.authn.resource(req)):
+                resp.complete = True
+                resp.status = falcon.HTTP_503
+                resp.set_header("Retry-After", str(self.agency.loader.RetryAfter))
+                return
+        except ValueError:
+            pass
+
         try:
             # Use Authenticater to verify the signature on the request
             if self.authn.verify(req):
@@ -105,6 +105,7 @@ keriHeaders = [
     "cesr-attachment",
     "cesr-date",
     "content-type",
+    "continuation-token",
     "signature",
     "signature-input",
     "signify-resource",
@@ -123,7 +124,7 @@ def falconApp(logRequests=False):
     return falcon.App(middleware=middlewares)
 
 
-def createHttpServer(port, app, keypath=None, certpath=None, cafilepath=None):
+def createHttpServer(port, app, keypath=None, certpath=None, cafilepath=None, host=""):
     """
     Create an HTTP or HTTPS server depending on whether TLS key material is present
 
@@ -133,6 +134,7 @@ def createHttpServer(port, app, keypath=None, certpath=None, cafilepath=None):
         keypath (string)   : the file path to the TLS private key
         certpath (string)  : the file path to the TLS signed certificate (public key)
         cafilepath (string): the file path to the TLS CA certificate chain file
+        host (string)      : interface to listen on, '' for every interface
     Returns:
         hio.core.http.Server
     """
@@ -142,9 +144,10 @@ def createHttpServer(port, app, keypath=None, certpath=None, cafilepath=None):
             keypath=keypath,
             certpath=certpath,
             cafilepath=cafilepath,
+            host=host,
             port=port,
         )
-        server = http.Server(port=port, app=app, servant=servant)
+        server = http.Server(host=host, port=port, app=app, servant=servant)
     else:
-        server = http.Server(port=port, app=app)
+        server = http.Server(host=host, port=port, app=app)
     return server
@@ -11,9 +11,11 @@ from keri.app.keeping import PreSit, Algos, PubLot, PubSet
 from keri import core
 from keri.core import coring
 from keri.core.coring import Tiers, MtrDex
-from keri.db import dbing, subing, koming
+from keri.db import subing, koming
 from keri.help import helping
 
+from keria.db.basing import SharedLMDBer
+
 
 @dataclass()
 class Prefix:
@@ -43,7 +45,7 @@ class SaltyPrm:
         return iter(asdict(self))
 
 
-class RemoteKeeper(dbing.LMDBer):
+class RemoteKeeper(SharedLMDBer):
     """
     RemoteKeeper stores data for Salty or Randy Encrypted edge key generation.
 
@@ -53,6 +55,7 @@ class RemoteKeeper(dbing.LMDBer):
     AltTailDirPath = ".keri/rks"
     TempPrefix = "keri_rks_"
     MaxNamedDBs = 10
+    Namespace = "rks:"
 
     def __init__(self, headDirPath=None, perm=None, reopen=False, **kwa):
         """
@@ -112,28 +115,34 @@ class RemoteKeeper(dbing.LMDBer):
         # Names end with "." as sub DB name must include a non Base64 character
         # to avoid namespace collisions with Base64 identifier prefixes.
 
-        self.gbls = subing.Suber(db=self, subkey="gbls.")
-        self.prxs = subing.CesrSuber(db=self, subkey="prxs.", klas=core.Cipher)
-        self.nxts = subing.CesrSuber(db=self, subkey="nxts.", klas=core.Cipher)
-        self.mhabs = subing.CesrSuber(db=self, subkey="mhabs.", klas=coring.Prefixer)
+        self.gbls = subing.Suber(db=self, subkey=self.named("gbls."))
+        self.prxs = subing.CesrSuber(
+            db=self, subkey=self.named("prxs."), klas=core.Cipher
+        )
+        self.nxts = subing.CesrSuber(
+            db=self, subkey=self.named("nxts."), klas=core.Cipher
+        )
+        self.mhabs = subing.CesrSuber(
+            db=self, subkey=self.named("mhabs."), klas=coring.Prefixer
+        )
         self.pres = koming.Komer(
             db=self,
-            subkey="pres.",
+            subkey=self.named("pres."),
             schema=Prefix,
         )  # New Prefix
         self.sprms = koming.Komer(
             db=self,
-            subkey="sprms.",
+            subkey=self.named("sprms."),
             schema=SaltyPrm,
         )  # New Salty Parameters
         self.sits = koming.Komer(
             db=self,
-            subkey="sits.",
+            subkey=self.named("sits."),
             schema=PreSit,
         )  # Prefix Situation
         self.pubs = koming.Komer(
             db=self,
-            subkey="pubs.",
+            subkey=self.named("pubs."),
             schema=PubSet,
         )  # public key set at pre.ridx
         return self.opened
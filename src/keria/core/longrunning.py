@@ -6,6 +6,9 @@ keria.core.longrunning module
 """
 
 import datetime
+import itertools
+import time
+import weakref
 from collections import namedtuple
 from dataclasses import dataclass, asdict, field
 from marshmallow import fields
@@ -14,14 +17,24 @@ from typing import Optional, Dict
 import falcon
 import json
 from dataclasses_json import dataclass_json
+from hio.help import decking
 from keri import kering
 from keri.app.oobiing import Result
 from keri.core import eventing, coring, serdering
-from keri.db import dbing, koming
+from keri.db import dbing, koming, subing
 from keri.help import helping
 from marshmallow_dataclass import class_schema
 
 from keria.app import delegating
+from keria.core import httping
+from keria.db.basing import (
+    SharedLMDBer,
+    decodeToken,
+    encodeToken,
+    entries,
+    snapshot,
+    walk,
+)
 
 # long running operation types
 Typeage = namedtuple(
@@ -84,10 +97,20 @@ class Op:
     metadata: dict
 
 
-class Operator(dbing.LMDBer):
+@dataclass
+class Outcome:
+    """Terminal status of a long running operation, saved the first time it is seen done"""
+
+    completed: str
+    operation: dict
+
+
+class Operator(SharedLMDBer):
     TailDirPath = "keri/opr"
     AltTailDirPath = ".keri/opr"
     TempPrefix = "keri_ops_"
+    MaxNamedDBs = 16
+    Namespace = "ops:"
 
     def __init__(self, name="opr", headDirPath=None, reopen=True, **kwa):
         """
@@ -99,6 +122,10 @@ class Operator(dbing.LMDBer):
             kwa:
         """
         self.ops = None
+        self.outcomes = None
+        self.starts = None
+        self.types = None
+        self.completes = None
         self.msgs = None
 
         super(Operator, self).__init__(
@@ -112,23 +139,83 @@ class Operator(dbing.LMDBer):
         # Long running operations, keyed by "name" which is f"{type}.{oid}"
         self.ops = koming.Komer(
             db=self,
-            subkey="opr.",
+            subkey=self.named("opr."),
             schema=Op,
         )
 
+        # Terminal Operation of finished long running operations, keyed by the same "name"
+        self.outcomes = koming.Komer(
+            db=self,
+            subkey=self.named("res."),
+            schema=Outcome,
+        )
+
+        # Names of long running operations at their start time and at their type and start time
+        self.starts = subing.DupSuber(db=self, subkey=self.named("sts."))
+        self.types = subing.DupSuber(db=self, subkey=self.named("tys."))
+
+        # Names of finished long running operations at the time they were seen done
+        self.completes = subing.DupSuber(db=self, subkey=self.named("cms."))
+
+        # Index the operations and outcomes saved before there were indexes
+        if entries(self.starts) == 0 and self.ops.cntAll() > 0:
+            for keys, op in self.ops.getItemIter():
+                self.index(".".join(keys), op)
+        if entries(self.completes) == 0 and self.outcomes.cntAll() > 0:
+            for keys, outcome in self.outcomes.getItemIter():
+                self.completes.add(keys=(outcome.completed,), val=".".join(keys))
+
         return self.env
 
+    def index(self, name, op):
+        """Add the index entries of the operation op saved at name"""
+        self.starts.add(keys=(op.start,), val=name)
+        self.types.add(keys=(op.type, op.start), val=name)
+
+    def unindex(self, name, op):
+        """Remove the index entries of the operation op saved at name"""
+        self.starts.rem(keys=(op.start,), val=name)
+        self.types.rem(keys=(op.type, op.start), val=name)
+
+    def finish(self, name, outcome):
+        """Save outcome as the Outcome of the operation saved at name"""
+        self.outcomes.pin(keys=(name,), val=outcome)
+        self.completes.add(keys=(outcome.completed,), val=name)
+
+    def unfinish(self, name):
+        """Remove the Outcome of the operation saved at name, if any"""
+        if (outcome := self.outcomes.get(keys=(name,))) is not None:
+            self.completes.rem(keys=(outcome.completed,), val=name)
+            self.outcomes.rem(keys=(name,))
+
 
 class Monitor:
     """Monitoring and garbage collecting long running operations
 
+    Waiting clients are not answered by checking their operations on every request. The agent calls
+    .touch() whenever its KEL, TEL or exchange message processing queues work, waiting operations are
+    only checked again after such a change or, for processes that complete without queueing work like
+    collecting witness receipts, once every .Recheck seconds.
+
+    The first time an operation is seen done its Operation is saved as its Outcome and returned from
+    then on, finished operations are never checked again. Finished operations are removed by
+    .collect() once past their retention.
+
     Attributes:
         hby (Habery): identifier database environment
         opr(Operator): long running operations database
         swain(Anchorer): Delegation processes tracker
+        changes (int): number of changes to the state operations complete from
+        streams (WeakSet): open streams of operation completions
+        waiters (WeakSet): open long polls of operations
 
     """
 
+    # Seconds between checks of waiting operations when no change was seen
+    Recheck = 1.0
+    # Operation types whose check writes to the Habery, not checked in the read snapshot of a batch
+    Writing = (OpTypes.delegation,)
+
     def __init__(
         self,
         hby,
@@ -158,6 +245,13 @@ class Monitor:
         self.submitter = submitter
         self.opr = opr if opr is not None else Operator(name=hby.name, temp=temp)
 
+        self.changes = 0
+        self.streams = weakref.WeakSet()
+        self.waiters = weakref.WeakSet()
+        self.pending = set()
+        self.seen = None
+        self.checked = 0.0
+
     def submit(self, oid, typ, metadata=None):
         """Submit a new long running operation to track
 
@@ -180,44 +274,254 @@ class Monitor:
 
         # Overwrite any existing long running operation of this type for this resource.
         # resets the clock basically
+        if (old := self.opr.ops.get(keys=(name,))) is not None:
+            self.opr.unindex(name, old)
         self.opr.ops.pin(keys=(name,), val=op)
+        self.opr.index(name, op)
+        self.opr.unfinish(name)
+        if self.streams:
+            self.pending.add(name)
+            self.touch()
 
         # Return Operation with full status check in case its already finished.
         return self.get(name)
 
     def get(self, name):
+        if (operation := self.outcome(name)) is not None:
+            return operation
+
         if (op := self.opr.ops.get(keys=(name,))) is None:
             return None
 
+        return self.resolve(op)
+
+    def statuses(self, names):
+        """Operations of names in order, None for each name of no operation
+
+        The Outcomes and operations of every name are read in one read transaction of the Operator
+        and only the operations without an Outcome are checked. Those whose check only reads read
+        the KEL and TEL state through one read transaction of the Habery and of the registry, see
+        snapshot(), the others are checked after it.
+        """
+        found = []
+        with self.opr.env.begin(write=False, buffers=False) as txn:
+            for name in names:
+                key = name.encode("utf-8")
+                if (raw := txn.get(key, db=self.opr.outcomes.sdb)) is not None:
+                    found.append((name, self.opr.outcomes.deserializer(raw), None))
+                elif (raw := txn.get(key, db=self.opr.ops.sdb)) is not None:
+                    found.append((name, None, self.opr.ops.deserializer(raw)))
+                else:
+                    found.append((name, None, None))
+
+        dbers = [self.hby.db]
+        if (rgy := getattr(self.registrar, "rgy", None)) is not None:
+            dbers.append(rgy.reger)
+
+        operations = []
+        writing = []
+        with snapshot(*dbers):
+            for name, outcome, op in found:
+                if outcome is not None:
+                    operations.append(Operation.from_dict(outcome.operation))
+                elif op is not None and op.type in self.Writing:
+                    writing.append((len(operations), op))
+                    operations.append(None)
+                elif op is not None:
+                    operations.append(self.check(op))
+                else:
+                    operations.append(None)
+
+        for i, op in writing:
+            operations[i] = self.check(op)
+
+        return operations
+
+    def outcome(self, name):
+        """Saved terminal Operation of the operation name, None while it is pending"""
+        if (outcome := self.opr.outcomes.get(keys=(name,))) is None:
+            return None
+
+        return Operation.from_dict(outcome.operation)
+
+    def resolve(self, op):
+        """Status of op, saved as its Outcome when it is done"""
         operation = self.status(op)
+        if operation.done:
+            self.opr.finish(
+                operation.name,
+                Outcome(completed=helping.nowIso8601(), operation=operation.to_dict()),
+            )
 
         return operation
 
-    def getOperations(self, type=None):
+    def getOperations(self, type=None, pending=False):
         """Return list of long running opterations, optionally filtered by type"""
-        ops = self.opr.ops.getItemIter()
-        if type is not None:
-            ops = filter(lambda i: i[1].type == type, ops)
-
-        def get_status(op):
-            try:
-                return self.status(op)
-            except Exception as err:
-                # self.status may throw an exception.
-                # Handling error by returning an operation with error status
-                return Operation(
-                    name=f"{op.type}.{op.oid}",
-                    metadata=op.metadata,
-                    done=True,
-                    error=OperationStatus(code=500, message=f"{err}"),
-                )
+        operations, _ = self.page(type=type, pending=pending)
+        return operations
+
+    def page(self, type=None, pending=False, skip=0, limit=None, after=None):
+        """Page of long running operations in the order they were started
+
+        Only the operations of the page are checked. Operations found done while listing pending
+        operations are returned done.
+
+        Parameters:
+            type (str | None): only operations of this type
+            pending (bool): only operations not yet seen done, finished operations are skipped unchecked
+            skip (int): number of operations to skip
+            limit (int | None): most operations to return, None for all
+            after (str | None): continuation token of the previous page to resume after
+
+        Returns:
+            tuple: list of Operation, continuation token of the next page or None if the page is not full
+
+        Raises:
+            ValueError: if after is not a continuation token
+
+        """
+        position = decodeToken(after)[0] if after else None
+        rows = self.names(type=type, pending=pending, after=position)
+        try:
+            stop = skip + limit if limit is not None else None
+            found = list(itertools.islice(rows, skip, stop))
+        finally:
+            rows.close()
+
+        operations = []
+        for _, name in found:
+            if (op := self.opr.ops.get(keys=(name,))) is not None:
+                operations.append(self.check(op))
 
-        return [get_status(op) for (_, op) in ops]
+        token = None
+        if limit is not None and len(found) == limit and found:
+            token = encodeToken(found[-1][0])
+
+        return operations, token
+
+    def names(self, type=None, pending=False, after=None):
+        """Stream the (position, name) of operations in the order they were started
+
+        Parameters:
+            type (str | None): only operations of this type
+            pending (bool): skip the operations with a saved Outcome
+            after (tuple | None): (key, val) index position to resume after
+
+        """
+        if type is None:
+            rows = walk(self.opr.starts, after=after)
+        else:
+            rows = walk(self.opr.types, prefix=f"{type}.", after=after)
+
+        for position, name in rows:
+            if pending and self.opr.outcomes.get(keys=(name,)) is not None:
+                continue
+
+            yield position, name
 
     def rem(self, name):
         """Remove tracking of the long running operation represented by name"""
+        self.pending.discard(name)
+        self.opr.unfinish(name)
+        if (op := self.opr.ops.get(keys=(name,))) is not None:
+            self.opr.unindex(name, op)
         return self.opr.ops.rem(keys=(name,))
 
+    def collect(self, cutoff, limit=None):
+        """Remove the operations that finished, or failed, before cutoff, oldest first
+
+        Parameters:
+            cutoff (datetime): operations seen done before this time are removed
+            limit (int | None): most operations to remove, None for all
+
+        Returns:
+            int: number of operations removed
+        """
+        before = helping.toIso8601(cutoff)
+        rows = walk(self.opr.completes)
+        try:
+            names = []
+            for (key, _), name in rows:
+                if key.decode("utf-8") >= before or (
+                    limit is not None and len(names) >= limit
+                ):
+                    break
+                names.append(name)
+        finally:
+            rows.close()
+
+        for name in names:
+            self.rem(name)
+
+        return len(names)
+
+    def touch(self):
+        """Record a change to KEL, TEL or exchange message state so waiting operations are checked again"""
+        self.changes += 1
+
+    @property
+    def busy(self):
+        """True while a stream or long poll of the operations is still open"""
+        return len(self.streams) > 0 or len(self.waiters) > 0
+
+    def stale(self, seen, checked):
+        """True when a check made at change seen and perf_counter time checked may be out of date"""
+        return seen != self.changes or time.perf_counter() - checked >= self.Recheck
+
+    def subscribe(self, stream):
+        """Start pushing the operations that complete from now on to stream"""
+        if not self.streams:
+            # Names such as witness.<prefix> are split on "." into their type and id keys
+            self.pending = set(
+                ".".join(keys)
+                for keys, op in self.opr.ops.getItemIter()
+                if not self.check(op).done
+            )
+            self.seen, self.checked = self.changes, time.perf_counter()
+        self.streams.add(stream)
+
+    def unsubscribe(self, stream):
+        self.streams.discard(stream)
+        if not self.streams:
+            self.pending = set()
+
+    def poll(self):
+        """Push the pending operations completed since the last check to every stream
+
+        Any number of streams may poll, pending operations are checked at most once per change.
+        """
+        if not self.streams or not self.stale(self.seen, self.checked):
+            return
+
+        self.seen, self.checked = self.changes, time.perf_counter()
+        for name in list(self.pending):
+            if (op := self.opr.ops.get(keys=(name,))) is None:
+                self.pending.discard(name)
+                continue
+
+            operation = self.check(op)
+            if operation.done:
+                self.pending.discard(name)
+                for stream in list(self.streams):
+                    stream.operations.append(operation)
+
+    def check(self, op):
+        """Status of op, or a failed operation if its status can not be determined"""
+        if (operation := self.outcome(f"{op.type}.{op.oid}")) is not None:
+            return operation
+
+        try:
+            return self.resolve(op)
+        except Exception as err:
+            # self.status may throw an exception.
+            # Handling error by returning an operation with error status
+            return Operation(
+                name=f"{op.type}.{op.oid}",
+                metadata=op.metadata,
+                done=True,
+                error=OperationStatus(code=500, message=f"{err}"),
+            )
+
     def status(self, op):
         """Calculate the status of an operation.
 
@@ -568,6 +872,107 @@ class Monitor:
         return operation
 
 
+class OperationWaiter:
+    """Long poll of one long running operation
+
+    Iterated by the HTTP server between runs of the agent. Yields nothing until the operation is
+    done or the wait expires and then the operation as JSON. The operation is only checked again
+    when the Monitor says an earlier check may be out of date.
+    """
+
+    def __init__(self, monitor, name, operation, wait):
+        """
+        Parameters:
+            monitor (Monitor): long running operations of the agent
+            name (str): name of the operation waited on
+            operation (Operation): current status of the operation
+            wait (float): seconds to wait for the operation to complete
+        """
+        self.monitor = monitor
+        self.name = name
+        self.operation = operation
+        self.expires = time.perf_counter() + wait
+        self.seen = monitor.changes
+        self.checked = time.perf_counter()
+        self.sent = False
+        monitor.waiters.add(self)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.sent:
+            raise StopIteration
+
+        if not self.operation.done and self.monitor.stale(self.seen, self.checked):
+            self.seen, self.checked = self.monitor.changes, time.perf_counter()
+            if (op := self.monitor.opr.ops.get(keys=(self.name,))) is not None:
+                self.operation = self.monitor.check(op)
+
+        if self.operation.done or time.perf_counter() >= self.expires:
+            self.sent = True
+            self.monitor.waiters.discard(self)
+            return self.operation.to_json().encode("utf-8")
+
+        return b""
+
+
+class OperationStream:
+    """Server-sent events of the long running operations of an agent completing while it is open"""
+
+    # Seconds a stream stays open before the client has to reconnect
+    Timeout = 300.0
+    # Most seconds a stream stays silent, well under the read timeout of the sharding router and proxies
+    Heartbeat = 15.0
+
+    def __init__(self, monitor, retry=5000, timeout=Timeout, heartbeat=Heartbeat):
+        """
+        Parameters:
+            monitor (Monitor): long running operations of the agent
+            retry (int): milliseconds clients wait before reconnecting a closed stream
+            timeout (float): seconds the stream stays open
+            heartbeat (float): seconds without events after which a comment line is sent
+        """
+        self.monitor = monitor
+        self.retry = retry
+        self.expires = time.perf_counter() + timeout
+        self.heartbeat = heartbeat
+        self.beat = time.perf_counter() + heartbeat
+        self.operations = decking.Deck()
+        self.started = False
+        monitor.subscribe(self)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if time.perf_counter() >= self.expires:
+            self.monitor.unsubscribe(self)
+            raise StopIteration
+
+        if not self.started:
+            self.started = True
+            return f"retry: {self.retry}\n\n".encode("utf-8")
+
+        self.monitor.poll()
+        data = bytearray()
+        while (operation := self.operations.pull(emptive=True)) is not None:
+            data.extend(
+                f"id: {operation.name}\nevent: operation\ndata: {operation.to_json()}\n\n".encode(
+                    "utf-8"
+                )
+            )
+
+        now = time.perf_counter()
+        if data:
+            self.beat = now + self.heartbeat
+        elif now >= self.beat:
+            self.beat = now + self.heartbeat
+            return b": heartbeat\n\n"
+
+        return bytes(data)
+
+
 class OperationCollectionEnd:
     @staticmethod
     def on_get(req, rep):
@@ -579,6 +984,9 @@ class OperationCollectionEnd:
 
         ---
         summary: Get list of long running operations
+        description: List long running operations in the order they were started. Pages are selected
+                     with a Range header like operations=0-9 or resumed after the Continuation-Token of
+                     the previous page.
         parameters:
           - in: query
             name: type
@@ -586,19 +994,199 @@ class OperationCollectionEnd:
               type: string
             required: false
             description: filter list of long running operations by type
+          - in: query
+            name: pending
+            schema:
+              type: boolean
+            required: false
+            description: only list operations not yet done, finished operations are not checked again
+          - in: query
+            name: limit
+            schema:
+              type: integer
+            required: false
+            description: most operations to return
+          - in: query
+            name: after
+            schema:
+              type: string
+            required: false
+            description: Continuation-Token of the previous page to resume after
+          - in: header
+            name: Range
+            schema:
+              type: string
+            required: false
+            description: size of the result list (page)
         responses:
             200:
               description: list of long running operations
+              headers:
+                Continuation-Token:
+                  schema:
+                    type: string
+                  description: Pass as `after` to get the next page, only present when the page is full.
               content:
                   application/json:
                     schema:
                         type: array
                         items:
                           $ref: '#/components/schemas/Operation'
+            206:
+              description: Range of the list of long running operations
+            400:
+              description: Invalid continuation token
         """
         agent = req.context.agent
         type = req.params.get("type")
-        ops = agent.monitor.getOperations(type=type)
+        pending = req.get_param_as_bool("pending", default=False)
+        limit = req.get_param_as_int("limit", min_value=1)
+        after = req.params.get("after")
+
+        skip = 0
+        rng = req.get_header("Range")
+        if rng is not None:
+            skip, end = httping.parseRangeHeader(rng, "operations")
+            limit = max(end - skip + 1, 0)
+
+        try:
+            ops, token = agent.monitor.page(
+                type=type, pending=pending, skip=skip, limit=limit, after=after
+            )
+        except ValueError as ex:
+            raise falcon.HTTPBadRequest(description=ex.args[0])
+
+        if token is not None:
+            rep.set_header("Continuation-Token", token)
+
+        if rng is not None:
+            count = sum(1 for _ in agent.monitor.names(type=type, pending=pending))
+            end = skip + (len(ops) - 1) if len(ops) > 0 else 0
+            rep.set_header("Accept-Ranges", "operations")
+            rep.set_header("Content-Range", f"operations {skip}-{end}/{count}")
+            rep.status = falcon.HTTP_206
+        else:
+            rep.status = falcon.HTTP_200
+
+        rep.data = json.dumps(ops, default=lambda o: o.to_dict()).encode("utf-8")
+        rep.content_type = "application/json"
+
+
+class OperationStreamEnd:
+    @staticmethod
+    def on_get(req, rep):
+        """Stream of long running operation completions
+
+        Parameters:
+            req (Request):  Falcon HTTP Request object
+            rep (Response): Falcon HTTP Response object
+
+        ---
+        summary: Stream long running operations as they complete
+        description: Server-sent events stream with an operation event for each long running operation
+                     of the agent that completes while the stream is open.
+        tags:
+        - Operation
+        parameters:
+          - in: query
+            name: timeout
+            schema:
+              type: number
+            required: false
+            description: seconds to keep the stream open, at most 300
+        responses:
+            200:
+              description: Stream of completed long running operations
+              content:
+                  text/event-stream:
+                    schema:
+                        type: string
+        """
+        agent = req.context.agent
+        timeout = req.get_param_as_float(
+            "timeout", min_value=0.0, default=OperationStream.Timeout
+        )
+
+        rep.status = falcon.HTTP_200
+        rep.content_type = "text/event-stream"
+        rep.set_header("Cache-Control", "no-cache")
+        rep.stream = OperationStream(
+            agent.monitor, timeout=min(timeout, OperationStream.Timeout)
+        )
+
+
+class OperationStatusCollectionEnd:
+    """Batch status endpoint for long running operations"""
+
+    # Most operations one request may ask for
+    MaxNames = 100
+
+    @staticmethod
+    def on_post(req, rep):
+        """POST batch status endpoint
+
+        Parameters:
+            req (Request):  Falcon HTTP Request object
+            rep (Response): Falcon HTTP Response object
+        ---
+        summary: Retrieve the status of several long running operations.
+        description: Returns the status of each named long running operation in the order requested,
+                     operations that do not exist are returned done with a 404 error.
+        tags:
+        - Operation
+        requestBody:
+            required: true
+            content:
+              application/json:
+                schema:
+                  type: object
+                  properties:
+                    names:
+                      type: array
+                      items:
+                        type: string
+                      description: Names of the long running operations, at most 100.
+        responses:
+          200:
+            description: Status of each long running operation.
+            content:
+                application/json:
+                    schema:
+                        type: array
+                        items:
+                          $ref: '#/components/schemas/Operation'
+          400:
+            description: Missing or invalid list of operation names.
+
+        """
+        agent = req.context.agent
+        body = req.get_media()
+        names = body.get("names") if isinstance(body, dict) else None
+        if not isinstance(names, list) or not all(
+            isinstance(name, str) for name in names
+        ):
+            raise falcon.HTTPBadRequest(
+                description="names must be a list of long running operation names"
+            )
+
+        if len(names) > OperationStatusCollectionEnd.MaxNames:
+            raise falcon.HTTPBadRequest(
+                description=f"at most {OperationStatusCollectionEnd.MaxNames} operations per request"
+            )
+
+        ops = [
+            operation
+            if operation is not None
+            else Operation(
+                name=name,
+                done=True,
+                error=OperationStatus(
+                    code=404, message=f"long running operation '{name}' not found"
+                ),
+            )
+            for name, operation in zip(names, agent.monitor.statuses(names))
+        ]
+
         rep.data = json.dumps(ops, default=lambda o: o.to_dict()).encode("utf-8")
         rep.content_type = "application/json"
         rep.status = falcon.HTTP_200
@@ -607,6 +1195,9 @@ class OperationCollectionEnd:
 class OperationResourceEnd:
     """Single Resource REST endpoint for long running operations"""
 
+    # Most seconds a request may wait for an operation to complete
+    MaxWait = 30.0
+
     @staticmethod
     def on_get(req, rep, name):
         """GET single resource REST endpoint
@@ -627,6 +1218,12 @@ class OperationResourceEnd:
               type: string
             required: true
             description: The name of the long running operation to retrieve.
+          - in: query
+            name: wait
+            schema:
+              type: number
+            required: false
+            description: seconds to wait for the operation to complete before answering, at most 30
         responses:
           200:
             description: Successfully retrieved the status of the long running operation.
@@ -644,9 +1241,19 @@ class OperationResourceEnd:
                 title=f"long running operation '{name}' not found"
             )
 
+        wait = req.get_param_as_float("wait", min_value=0.0, default=0.0)
+
         rep.content_type = "application/json"
-        rep.data = operation.to_json().encode("utf-8")
         rep.status = falcon.HTTP_200
+        if operation.done or wait == 0.0:
+            rep.data = operation.to_json().encode("utf-8")
+        else:
+            rep.stream = OperationWaiter(
+                agent.monitor,
+                name,
+                operation,
+                min(wait, OperationResourceEnd.MaxWait),
+            )
 
     @staticmethod
     def on_delete(req, rep, name):
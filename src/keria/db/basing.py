@@ -5,12 +5,22 @@ keria.db.basing module
 
 """
 
+import base64
+import itertools
+import json
+import struct
+import time
+from collections import OrderedDict, deque
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
-from ordered_set import OrderedSet as oset
 
+import lmdb
+from keri import help
 from keri.core import coring
 from keri.db import dbing, subing, koming
 
+logger = help.ogler.getLogger()
+
 SCALAR_TYPES = ("string", "number")
 
 ISSUER_FIELD = coring.Pather(path=["i"])
@@ -18,6 +28,27 @@ ISSUEE_FIELD = coring.Pather(path=["a", "i"])
 SCHEMA_FIELD = coring.Pather(path=["s"])
 REGISTRY_FIELD = coring.Pather(path=["ri"])
 
+# TEL status of a credential, indexed as though it were a field of the credential
+STATUS_FIELD = coring.Pather(path=["status"])
+ISSUED = "issued"
+REVOKED = "revoked"
+
+# Node SAID of any edge of a credential, indexed from each node to the credentials chaining to it
+EDGE_FIELD = coring.Pather(path=["e", "n"])
+# Index from each credential to the node SAIDs of its edges
+EDGES_INDEX = "edges"
+
+# Index keys of numbers start with NUMBER_PREFIX and sort before NUMBER_END, strings on either side
+NUMBER_PREFIX = "#"
+NUMBER_END = "$"
+
+# Indexes of credentials by status, alone, with schema and with issuee and schema
+STATUS_INDEXES = (
+    STATUS_FIELD.qb64,
+    f"{SCHEMA_FIELD.qb64}.{STATUS_FIELD.qb64}",
+    f"{ISSUEE_FIELD.qb64}.{SCHEMA_FIELD.qb64}.{STATUS_FIELD.qb64}",
+)
+
 
 @dataclass
 class IndexRecord:
@@ -27,6 +58,176 @@ class IndexRecord:
     paths: list
 
 
+@dataclass
+class IndexStats:
+    """Cardinality of an index, its number of distinct keys and of entries over all keys"""
+
+    keys: int = 0
+    entries: int = 0
+
+    @property
+    def dups(self):
+        """Average number of entries per key"""
+        return self.entries / self.keys if self.keys else 0.0
+
+
+class IndexStatistics:
+    """
+    Cardinality statistics of the indexes of a Seeker, kept up to date as entries are added and
+    removed. Statistics of indexes populated before they were kept are counted on first use.
+
+    """
+
+    def __init__(self, db, subkey):
+        self.stats = koming.Komer(db=db, subkey=subkey, schema=IndexStats)
+
+    def get(self, name, idx):
+        if (stats := self.stats.get(keys=(name,))) is None:
+            stats = self.count(idx)
+            self.stats.pin(keys=(name,), val=stats)
+
+        return stats
+
+    def apply(self, txn, deltas):
+        """Add the IndexStats deltas keyed by index name to their statistics within write txn"""
+        for name, delta in deltas.items():
+            key = name.encode("utf-8")
+            raw = txn.get(key, db=self.stats.sdb)
+            stats = self.stats.deserializer(raw) if raw is not None else IndexStats()
+            stats.keys += delta.keys
+            stats.entries += delta.entries
+            txn.put(key, self.stats.serializer(stats), db=self.stats.sdb)
+
+    @staticmethod
+    def count(idx):
+        stats = IndexStats()
+        with idx.db.env.begin(db=idx.sdb, write=False) as txn:
+            cursor = txn.cursor()
+            found = cursor.first()
+            while found:
+                stats.keys += 1
+                stats.entries += cursor.count()
+                found = cursor.next_nodup()
+
+        return stats
+
+
+class IndexBatch:
+    """
+    Index entries added and removed for a batch of documents, written to the indexes of a Seeker
+    and their statistics in one LMDB write transaction.
+
+    """
+
+    def __init__(self, seeker):
+        self.seeker = seeker
+        self.adds = []
+        self.rems = []
+
+    def add(self, name, value, saider):
+        self.adds.append((name, value.encode("utf-8"), saider.qb64b))
+
+    def rem(self, name, value, saider):
+        self.rems.append((name, value.encode("utf-8"), saider.qb64b))
+
+    def write(self):
+        """Write the batch
+
+        Returns:
+            int: number of index entries added or removed
+        """
+        deltas = dict()
+        for name, _, _ in itertools.chain(self.adds, self.rems):
+            if name not in deltas:
+                # Count indexes without statistics before their first write
+                self.seeker.stats.get(name, self.seeker.indexes[name])
+                deltas[name] = IndexStats()
+
+        changed = 0
+        with self.seeker.env.begin(write=True) as txn:
+            for name, key, val in self.adds:
+                sdb = self.seeker.indexes[name].sdb
+                fresh = txn.get(key, db=sdb) is None
+                # False when the SAID is already at key, without reading the other duplicates
+                if txn.put(key, val, db=sdb, dupdata=False):
+                    deltas[name].entries += 1
+                    deltas[name].keys += 1 if fresh else 0
+                    changed += 1
+
+            for name, key, val in self.rems:
+                cursor = txn.cursor(db=self.seeker.indexes[name].sdb)
+                if cursor.set_key_dup(key, val) and cursor.delete():
+                    deltas[name].entries -= 1
+                    deltas[name].keys -= 0 if cursor.set_key(key) else 1
+                    changed += 1
+
+            self.seeker.stats.apply(txn, deltas)
+
+        return changed
+
+    def load(self):
+        """Bulk load the additions of the batch into emptied indexes
+
+        Entries are appended in sorted order through one cursor per index, so each put lands after
+        the last one instead of searching the tree from its root. Entries that do not sort after
+        the last one in their index are not written, only entries LMDB stores are counted.
+
+        Returns:
+            int: number of index entries written
+        """
+        deltas = dict()
+        with self.seeker.env.begin(write=True) as txn:
+            for name, rows in itertools.groupby(
+                sorted(set(self.adds)), key=lambda e: e[0]
+            ):
+                sdb = self.seeker.indexes[name].sdb
+                stats = deltas[name] = IndexStats()
+                last = None
+                # Appends are MDB_APPENDDUP only for the default database of the transaction
+                with self.seeker.env.begin(write=True, parent=txn, db=sdb) as sub:
+                    cursor = sub.cursor()
+                    for _, key, val in rows:
+                        if not cursor.put(key, val, dupdata=True, append=True):
+                            continue
+                        stats.entries += 1
+                        if key != last:
+                            stats.keys += 1
+                            last = key
+
+            self.seeker.stats.apply(txn, deltas)
+
+        return sum(stats.entries for stats in deltas.values())
+
+
+def entries(suber):
+    """Number of entries in a sub database, read from LMDB without walking it"""
+    with suber.db.env.begin(write=False) as txn:
+        return txn.stat(suber.sdb)["entries"]
+
+
+def indexValue(val):
+    """Index key component of a field value
+
+    Numbers are encoded so their keys sort in numeric order, other values are indexed as is.
+    """
+    if isinstance(val, (int, float)) and not isinstance(val, bool):
+        return encodeNumber(val)
+
+    return val
+
+
+def encodeNumber(num):
+    """Fixed width key of num that sorts lexicographically in numeric order
+
+    The IEEE 754 double of num has its sign bit flipped when positive and all bits flipped when
+    negative, giving an unsigned integer in numeric order written as 16 hex digits after a '#'.
+    Integers beyond 2**53 lose precision like they do in JSON.
+    """
+    (bits,) = struct.unpack(">Q", struct.pack(">d", float(num)))
+    bits = bits ^ 0xFFFFFFFFFFFFFFFF if bits >> 63 else bits | 1 << 63
+    return f"{NUMBER_PREFIX}{bits:016x}"
+
+
 class AgencyBaser(dbing.LMDBer):
     """
     Agency database for tracking Agent tenants and their managed identifiers in this KERIA instance.
@@ -110,8 +311,362 @@ class AgencyBaser(dbing.LMDBer):
         # Sub-database keyed by qb64 AID mapping to the Prefixer object of the AID of its Agent
         self.aids = subing.CesrSuber(db=self, subkey="aids.", klas=coring.Prefixer)
 
+    def controller(self, pre):
+        """
+        Returns the controller AID (caid) of the agent responsible for pre, or None if not found.
+
+        Parameters:
+            pre (str): controller AID, agent AID or managed AID
+        """
+        if self.agnt.get(keys=(pre,)) is not None:
+            return pre
+        if (prefixer := self.aids.get(keys=(pre,))) is not None:
+            return prefixer.qb64
+        if (prefixer := self.ctrl.get(keys=(pre,))) is not None:
+            return prefixer.qb64
+        return None
+
+
+class AgentBaser(dbing.LMDBer):
+    """
+    Shared LMDB environment of one agent holding the KERIA owned databases (Seeker, ExnSeeker,
+    Operator and RemoteKeeper) as named sub databases, so a tenant needs one environment for them
+    instead of one each.
 
-class Seeker(dbing.LMDBer):
+    """
+
+    TailDirPath = "keri/kdb"
+    AltTailDirPath = ".keri/kdb"
+    TempPrefix = "keri_kdb_"
+    # Room for the sub databases each of the stores sharing it may open on its own, see their
+    # MaxNamedDBs, with the version database of the environment
+    MaxNamedDBs = 600
+    MapSize = (
+        419430400  # room for the four databases that each had their own map before
+    )
+
+    def __init__(self, headDirPath=None, perm=None, reopen=False, **kwa):
+        """
+        Setup shared environment, sub databases are opened by the stores sharing it.
+
+        Inherited Parameters:
+            name is str directory path name differentiator for main database
+            temp is boolean, assign to .temp
+                True then open in temporary directory, clear on close
+            headDirPath is optional str head directory pathname for main database
+            perm is numeric optional os dir permissions mode
+            reopen is boolean, IF True then database will be reopened by this init
+
+        """
+        if perm is None:
+            perm = self.Perm  # defaults to restricted permissions for non temp
+
+        super(AgentBaser, self).__init__(
+            headDirPath=headDirPath, perm=perm, reopen=reopen, **kwa
+        )
+
+    def reopen(self, **kwa):
+        self.opened = super(AgentBaser, self).reopen(**kwa)
+        if self.env.info()["map_size"] < self.MapSize:
+            self.env.set_mapsize(self.MapSize)
+
+        return self.opened
+
+
+class SharedLMDBer(dbing.LMDBer):
+    """
+    LMDBer that opens its sub databases in the environment of another LMDBer when given one.
+    Sub database names are prefixed with .Namespace when shared to keep each store's names apart.
+
+    """
+
+    Namespace = ""
+
+    def __init__(self, shared=None, **kwa):
+        """
+        Parameters:
+            shared (LMDBer | None): opened database whose environment is shared, None opens
+                                    an environment of its own
+        """
+        self.shared = shared
+        super(SharedLMDBer, self).__init__(**kwa)
+
+    def reopen(self, **kwa):
+        if self.shared is None:
+            return super(SharedLMDBer, self).reopen(**kwa)
+
+        self.env = self.shared.env
+        self.path = self.shared.path
+        self.opened = self.shared.opened
+        return self.opened
+
+    def close(self, clear=False):
+        """Close own environment, a shared environment is left open for its owner to close"""
+        if self.shared is None:
+            return super(SharedLMDBer, self).close(clear=clear)
+
+        self.env = None
+        self.opened = False
+        return True
+
+    def named(self, subkey):
+        """Returns name of sub database subkey in the environment in use"""
+        return subkey if self.shared is None else f"{self.Namespace}{subkey}"
+
+
+class SnapshotTxn:
+    """Read transaction shared by the reads of a snapshot, left open when each read is done"""
+
+    def __init__(self, txn, db=None):
+        self.txn = txn
+        self.db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get(self, key, default=None, db=None):
+        return self.txn.get(key, default=default, db=db if db is not None else self.db)
+
+    def cursor(self, db=None):
+        return self.txn.cursor(db=db if db is not None else self.db)
+
+    def stat(self, db=None):
+        return self.txn.stat(db if db is not None else self.db)
+
+
+class SnapshotEnv:
+    """LMDB environment whose read transactions all reuse one open read transaction
+
+    Writes are refused, they would not be seen by the reads of the snapshot after them.
+    """
+
+    def __init__(self, env, txn):
+        self.env = env
+        self.txn = txn
+
+    def begin(self, db=None, write=False, **kwa):
+        if write:
+            raise lmdb.ReadonlyError("write to a database read through a snapshot")
+
+        return SnapshotTxn(self.txn, db=db)
+
+    def __getattr__(self, name):
+        return getattr(self.env, name)
+
+
+@contextmanager
+def snapshot(*dbers):
+    """Read each of the opened LMDBers dbers through one read transaction while in context
+
+    Every read of a database in context sees the same snapshot of it without opening a
+    transaction of its own, and writes to it raise lmdb.ReadonlyError. The databases are swapped
+    back on exit, so code in context must not yield to other readers of them.
+    """
+    with ExitStack() as stack:
+        for dber in dbers:
+            env = dber.env
+            txn = stack.enter_context(env.begin(write=False, buffers=False))
+            dber.env = SnapshotEnv(env, txn)
+            stack.callback(setattr, dber, "env", env)
+
+        yield
+
+
+class CacheBudget:
+    """Least recently used order of the entries of every CredentialCache of an agency
+
+    Bounds the decoded and cloned credentials held in memory across all resident agents, so memory
+    no longer grows with the number of agents times the size of each cache. The least recently used
+    entry of any agent is dropped once the budget is spent.
+    """
+
+    # Default number of decoded and cloned credentials kept across all caches
+    Size = 65536
+
+    def __init__(self, size=Size):
+        """
+        Parameters:
+            size (int): number of decoded and cloned credentials kept across all caches
+        """
+        self.size = size
+        self.entries = OrderedDict()  # (id of cache dict, SAID) -> cache dict
+
+    def use(self, cache, said):
+        """Mark said in cache as the most recently used entry and drop the oldest ones over budget"""
+        key = (id(cache), said)
+        self.entries[key] = cache
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            (_, oldest), owner = self.entries.popitem(last=False)
+            owner.pop(oldest, None)
+
+    def drop(self, cache, said):
+        """Forget said in cache, dropped by the cache itself"""
+        self.entries.pop((id(cache), said), None)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class CredentialCache:
+    """Size bounded least recently used cache of decoded and cloned credentials of one agent
+
+    Credentials never change once saved under their SAID so decoded bodies are kept until evicted.
+    Cloned credentials also carry the TEL status of the credential and of every credential chained
+    to it. Each clone records how many TEL events each of those credentials had when it was made and
+    is cloned again once a new TEL event, such as a revocation, has been logged for any of them.
+
+    Caches of agents of one agency also share a CacheBudget, bounding their total size.
+
+    Clones are also saved as summary rows in .summaries when it is set, so a clone evicted from
+    memory or lost on restart is read back in one read instead of being cloned again.
+    """
+
+    # Default number of credentials kept in each of the decoded and cloned caches
+    Size = 1024
+
+    def __init__(self, reger, size=Size, budget=None):
+        """
+        Parameters:
+            reger (Reger): registry database holding the credentials
+            size (int): number of credentials kept in each of the decoded and cloned caches
+            budget (CacheBudget | None): budget shared with the caches of other agents, None for none
+        """
+        self.reger = reger
+        self.size = size
+        self.budget = budget
+        self.sads = OrderedDict()  # SAID -> decoded credential body
+        self.clones = OrderedDict()  # SAID -> (TEL event counts, cloned credential)
+        self.summaries = (
+            None  # SAID -> saved summary row, set by the Seeker when opened
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def sad(self, said):
+        """Decoded body of the credential with SAID said"""
+        if (sad := self.sads.get(said)) is not None:
+            self.hits += 1
+            self.sads.move_to_end(said)
+            if self.budget is not None:
+                self.budget.use(self.sads, said)
+            return sad
+
+        self.misses += 1
+        if (creder := self.reger.creds.get(keys=(said,))) is None:
+            raise ValueError(f"{said} is not a saved credential")
+
+        self.keep(self.sads, said, creder.sad)
+        return creder.sad
+
+    def cloneCreds(self, saids, db):
+        """Cloned credentials of saids as returned by Reger.cloneCreds
+
+        Parameters:
+            saids (list): Saider of each credential
+            db (Baser): database holding the schema of the credentials
+        """
+        return [self.clone(saider.qb64, db) for saider in saids]
+
+    def clone(self, said, db):
+        if (entry := self.clones.get(said)) is not None and self.current(entry[0]):
+            self.hits += 1
+            self.clones.move_to_end(said)
+            if self.budget is not None:
+                self.budget.use(self.clones, said)
+            return entry[1]
+
+        self.misses += 1
+        if (entry := self.summary(said)) is None or not self.current(entry[0]):
+            entry = self.summarize(said, db)
+
+        self.keep(self.clones, said, entry)
+        return entry[1]
+
+    def current(self, tels):
+        """True when no TEL event was logged for the credentials of tels since they were counted"""
+        return all(self.reger.cntTels(pre) == cnt for pre, cnt in tels)
+
+    def summary(self, said):
+        """Saved (TEL event counts, cloned credential) of said or None"""
+        if self.summaries is None or (row := self.summaries.get(keys=(said,))) is None:
+            return None
+
+        row = json.loads(row)
+        return tuple((pre, cnt) for pre, cnt in row["tels"]), row["cred"]
+
+    def summarize(self, said, db):
+        """Clone the credential with SAID said and save its summary row
+
+        Returns:
+            tuple: (TEL event counts, cloned credential)
+        """
+        cred = self.reger.cloneCreds([coring.Saider(qb64=said)], db)[0]
+        tels = tuple((pre, self.reger.cntTels(pre)) for pre in chained(cred))
+        if self.summaries is not None:
+            row = json.dumps(dict(tels=tels, cred=cred))
+            self.summaries.pin(keys=(said,), val=row)
+
+        return tels, cred
+
+    def keep(self, cache, said, val):
+        cache[said] = val
+        cache.move_to_end(said)
+        while len(cache) > self.size:
+            oldest, _ = cache.popitem(last=False)
+            if self.budget is not None:
+                self.budget.drop(cache, oldest)
+
+        if self.budget is not None:
+            self.budget.use(cache, said)
+
+    def forget(self, said):
+        """Drop the credential with SAID said, as when it is deleted"""
+        for cache in (self.sads, self.clones):
+            if cache.pop(said, None) is not None and self.budget is not None:
+                self.budget.drop(cache, said)
+        if self.summaries is not None:
+            self.summaries.rem(keys=(said,))
+
+    def clear(self):
+        """Drop every credential kept in memory and return its share of the budget"""
+        for cache in (self.sads, self.clones):
+            if self.budget is not None:
+                for said in cache:
+                    self.budget.drop(cache, said)
+            cache.clear()
+
+    def metrics(self):
+        """Returns hit and miss counters and the number of cached credentials"""
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            sads=len(self.sads),
+            clones=len(self.clones),
+        )
+
+
+def nodes(creder):
+    """Node SAIDs of the edges of creder, the credentials it chains to"""
+    edge = creder.edge if isinstance(creder.edge, dict) else dict()
+    return [
+        node["n"]
+        for label, node in edge.items()
+        if label != "d" and isinstance(node, dict) and "n" in node
+    ]
+
+
+def chained(cred):
+    """SAIDs of a cloned credential and of every credential chained to it"""
+    yield cred["sad"]["d"]
+    for chain in cred["chains"]:
+        yield from chained(chain)
+
+
+class Seeker(SharedLMDBer):
     """
     Seeker indexes all credentials in the KERIpy `saved` Creder database.
 
@@ -125,11 +680,32 @@ class Seeker(dbing.LMDBer):
     AltTailDirPath = ".keri/seekdb"
     TempPrefix = "keri_seekdb_"
     MaxNamedDBs = 500
-
-    def __init__(self, db, reger, headDirPath=None, perm=None, reopen=False, **kwa):
+    Namespace = "seek:"
+    # Indexed fields that are not in the credential, so only their indexes can answer them
+    Virtual = (STATUS_FIELD.qb64, EDGE_FIELD.qb64)
+    # Indexes with an entry for each edge of a credential, so several for one credential
+    Multi = (EDGE_FIELD.qb64,)
+
+    def __init__(
+        self,
+        db,
+        reger,
+        headDirPath=None,
+        perm=None,
+        reopen=False,
+        cacheSize=CredentialCache.Size,
+        cacheBudget=None,
+        **kwa,
+    ):
         """
         Setup named sub databases.
 
+        Parameters:
+            db (Baser): database holding the schema of indexed credentials
+            reger (Reger): registry database holding the credentials
+            cacheSize (int): number of credentials kept decoded and cloned in .cache
+            cacheBudget (CacheBudget | None): budget .cache shares with the caches of other agents
+
         Inherited Parameters:
             name is str directory path name differentiator for main database
                 When system employs more than one keri database, name allows
@@ -152,9 +728,11 @@ class Seeker(dbing.LMDBer):
         self.db = db
         self.reger = reger
         self.indexes = dict()
+        self.cache = CredentialCache(reger=reger, size=cacheSize, budget=cacheBudget)
 
         self.schIdx = None
         self.dynIdx = None
+        self.stats = None
 
         super(Seeker, self).__init__(
             headDirPath=headDirPath, perm=perm, reopen=reopen, **kwa
@@ -164,18 +742,23 @@ class Seeker(dbing.LMDBer):
         super(Seeker, self).reopen(**kwa)
 
         # List of indexs for a given schema
-        self.schIdx = subing.IoSetSuber(db=self, subkey="schIdx.")
+        self.schIdx = subing.IoSetSuber(db=self, subkey=self.named("schIdx."))
         # List of dynamically created indexes to be recreated at load
         self.dynIdx = koming.Komer(
             db=self,
-            subkey="dynIdx.",
+            subkey=self.named("dynIdx."),
             schema=IndexRecord,
         )
+        # Cardinality of each index for planning queries
+        self.stats = IndexStatistics(db=self, subkey=self.named("stats."))
+        # Summary row of each credential served to credential listings
+        self.summaries = subing.Suber(db=self, subkey=self.named("sums."))
+        self.cache.summaries = self.summaries
 
         for name, idx in self.dynIdx.getItemIter():
             key = ".".join(name)
             self.indexes[key] = subing.CesrDupSuber(
-                db=self, subkey=idx.subkey, klas=coring.Saider
+                db=self, subkey=self.named(idx.subkey), klas=coring.Saider
             )
 
         # Create persistent Indexes if they don't already exist
@@ -183,52 +766,208 @@ class Seeker(dbing.LMDBer):
         self.createIndex(REGISTRY_FIELD.qb64)
 
         # Index of credentials by issuer/issuee.
+        stale = []
         for field in (ISSUER_FIELD, ISSUEE_FIELD):
             self.createIndex(field.qb64)
             subkey = f"{field.qb64}.{SCHEMA_FIELD.qb64}"
+            if not self.createIndex(subkey):
+                stale.append(subkey)
+
+        # Compound indexes once recorded with a single path were keyed by their first field only,
+        # rebuilt by the seeker opened with the registry holding the credentials
+        if stale and self.reger is not None:
+            self.rebuild(stale)
+
+        # Index of credentials by TEL status
+        for subkey in STATUS_INDEXES:
             self.createIndex(subkey)
 
+        # Indexes of the edges between credentials, in both directions
+        self.createIndex(EDGE_FIELD.qb64)
+        self.createIndex(EDGES_INDEX)
+
     @property
     def table(self):
         return self.reger.saved
 
     def value(self, said):
-        saider = self.reger.saved.get(keys=(said,))
-        creder = self.reger.creds.get(keys=(saider.qb64,))
-        return creder.sad
+        return self.cache.sad(said)
+
+    def cloneCreds(self, saids, db):
+        """Cloned credentials of saids like Reger.cloneCreds, served from .cache"""
+        return self.cache.cloneCreds(saids, db)
+
+    def records(self, rows):
+        """Yield (position, SAID, record) for each (position, SAID) row, see records()"""
+        return records(self.reger.creds, rows)
 
     def saidIter(self):
         return self.reger.saved.getItemIter()
 
+    def demand(self, name):
+        """True when index name can serve a query"""
+        return name in self.indexes
+
     def createIndex(self, key):
-        if self.dynIdx.get(keys=(key,)) is None:
+        """Create index key over the fields of its dotted paths unless it exists
+
+        Returns:
+            bool: False when the index exists recorded with other paths, see rebuild()
+        """
+        paths = key.split(".")
+        if (idx := self.dynIdx.get(keys=(key,))) is None:
             self.indexes[key] = subing.CesrDupSuber(
-                db=self, subkey=key, klas=coring.Saider
+                db=self, subkey=self.named(key), klas=coring.Saider
             )
-            self.dynIdx.pin(keys=(key,), val=IndexRecord(subkey=key, paths=[key]))
+            self.dynIdx.pin(keys=(key,), val=IndexRecord(subkey=key, paths=paths))
+
+        return idx is None or idx.paths == paths
+
+    def rebuild(self, names):
+        """Record the indexes names over the fields of their dotted paths, empty them and reload
+        them from every saved credential"""
+        with self.env.begin(write=True) as txn:
+            for name in names:
+                txn.drop(self.indexes[name].sdb, delete=False)
+                txn.delete(name.encode("utf-8"), db=self.stats.stats.sdb)
+
+        for name in names:
+            record = IndexRecord(subkey=name, paths=name.split("."))
+            self.dynIdx.pin(keys=(name,), val=record)
+
+        saids = [said for (said,), _ in self.reger.saved.getItemIter()]
+        batch = self.batch(saids)
+        batch.adds = [add for add in batch.adds if add[0] in names]
+        return batch.load()
 
     def index(self, said):
-        if (saider := self.reger.saved.get(keys=(said,))) is None:
-            raise ValueError(f"{said} is not a verified credential")
+        self.indexBatch([said])
 
-        creder = self.reger.creds.get(keys=(saider.qb64,))
-        saider = coring.Saider(qb64b=creder.saidb)
+    def indexBatch(self, saids):
+        """Index the credentials of saids, writing all their index entries in one transaction
 
-        # Load schema index and if not indexed in schIdx, index it.
-        schemaSaid = creder.schema
-        if not (indexes := self.schIdx.get(keys=(schemaSaid,))):
-            indexes = self.generateIndexes(schemaSaid)
+        Entries are read from the credential body and its edges only. Credentials are cloned, and
+        their summary rows saved, when they are first listed.
 
-        for index in indexes:
-            db = self.indexes[index]
-            idx = self.dynIdx.get(keys=(index,))
-            values = []
-            for path in idx.paths:
-                pather = coring.Pather(qb64=path)
-                values.append(pather.resolve(creder.sad))
+        Raises:
+            ValueError: if any of saids is not a verified credential, nothing is indexed
+
+        """
+        return self.batch(saids).write()
+
+    def batch(self, saids):
+        """IndexBatch of the index entries of the credentials of saids"""
+        batch = IndexBatch(self)
+        for said in saids:
+            if (saider := self.reger.saved.get(keys=(said,))) is None:
+                raise ValueError(f"{said} is not a verified credential")
+
+            creder = self.reger.creds.get(keys=(saider.qb64,))
+            saider = coring.Saider(qb64b=creder.saidb)
+
+            # Load schema index and if not indexed in schIdx, index it.
+            schemaSaid = creder.schema
+            if not (indexes := self.schIdx.get(keys=(schemaSaid,))):
+                indexes = self.generateIndexes(schemaSaid)
+
+            for index in indexes:
+                idx = self.dynIdx.get(keys=(index,))
+                values = []
+                for path in idx.paths:
+                    pather = coring.Pather(qb64=path)
+                    values.append(indexValue(pather.resolve(creder.sad)))
+
+                batch.add(index, "".join(values), saider)
 
-            value = "".join(values)
-            db.add(keys=(value,), val=saider)
+            for index, value in self.statuses(creder, self.status(said)):
+                batch.add(index, value, saider)
+
+            for node in nodes(creder):
+                batch.add(EDGE_FIELD.qb64, node, saider)
+                batch.add(EDGES_INDEX, saider.qb64, coring.Saider(qb64=node))
+
+        return batch
+
+    def chain(self, said, depth=1, reverse=False):
+        """Credentials chained from said, or chaining to it when reverse, up to depth edges away
+
+        Each step of the traversal reads the edge index entries of the credentials found by the
+        step before.
+
+        Parameters:
+            said (str): SAID of the credential to start from
+            depth (int): number of edges to follow
+            reverse (bool): follow edges to the credentials chaining to said instead of from it
+
+        Returns:
+            list: (SAID, depth) of each credential found, nearest first, each credential once
+        """
+        idx = self.indexes[EDGE_FIELD.qb64 if reverse else EDGES_INDEX]
+        seen = {said}
+        level = [said]
+        found = []
+        for step in range(1, depth + 1):
+            nxt = []
+            for node in level:
+                for _, other in walk(idx, key=node):
+                    if other not in seen:
+                        seen.add(other)
+                        nxt.append(other)
+                        found.append((other, step))
+
+            if not nxt:
+                break
+            level = nxt
+
+        return found
+
+    def status(self, said):
+        """ISSUED or REVOKED from the number of TEL events of the credential with SAID said"""
+        return REVOKED if self.reger.cntTels(said) > 1 else ISSUED
+
+    @staticmethod
+    def statuses(creder, status):
+        """(index, value) of each status index entry of creder with status"""
+        entries = [
+            (STATUS_INDEXES[0], status),
+            (STATUS_INDEXES[1], f"{creder.schema}{status}"),
+        ]
+        if isinstance(issuee := resolve(ISSUEE_FIELD, creder.sad), str):
+            entries.append((STATUS_INDEXES[2], f"{issuee}{creder.schema}{status}"))
+
+        return entries
+
+    def updateStatus(self, saids):
+        """Move the status index entries of the credentials of saids to their current TEL status
+
+        Credentials not saved yet are skipped, their status is indexed when they are.
+
+        Returns:
+            int: number of index entries added or removed
+        """
+        batch = IndexBatch(self)
+        for said in saids:
+            if self.reger.saved.get(keys=(said,)) is None:
+                continue
+
+            creder = self.reger.creds.get(keys=(said,))
+            saider = coring.Saider(qb64b=creder.saidb)
+            status = self.status(said)
+            prior = ISSUED if status == REVOKED else REVOKED
+            for index, value in self.statuses(creder, prior):
+                batch.rem(index, value, saider)
+            for index, value in self.statuses(creder, status):
+                batch.add(index, value, saider)
+
+        return batch.write()
+
+    def reset(self):
+        """Empty every index, the indexes of each schema and the index statistics for a rebuild"""
+        with self.env.begin(write=True) as txn:
+            for idx in self.indexes.values():
+                txn.drop(idx.sdb, delete=False)
+            txn.drop(self.schIdx.sdb, delete=False)
+            txn.drop(self.stats.stats.sdb, delete=False)
 
     def unindex(self, said):
         if (saider := self.reger.saved.get(keys=(said,))) is None:
@@ -239,16 +978,26 @@ class Seeker(dbing.LMDBer):
         if not indexes:
             raise ValueError(f"No known indexes for schema {creder.schema}")
 
+        batch = IndexBatch(self)
         for index in indexes:
-            db = self.indexes[index]
             idx = self.dynIdx.get(keys=(index,))
             values = []
             for path in idx.paths:
                 pather = coring.Pather(qb64=path)
-                values.append(pather.resolve(creder.sad))
+                values.append(indexValue(pather.resolve(creder.sad)))
+
+            batch.rem(index, "".join(values), saider)
+
+        for status in (ISSUED, REVOKED):
+            for index, value in self.statuses(creder, status):
+                batch.rem(index, value, saider)
+
+        for node in nodes(creder):
+            batch.rem(EDGE_FIELD.qb64, node, saider)
+            batch.rem(EDGES_INDEX, saider.qb64, coring.Saider(qb64=node))
 
-            value = "".join(values)
-            db.rem(keys=(value,), val=saider)
+        batch.write()
+        self.cache.forget(said)
 
     def generateIndexes(self, said):
         """Parse schema of said, create schIdx entry keyed to said of schema and the subkey indexes in
@@ -296,7 +1045,7 @@ class Seeker(dbing.LMDBer):
             pather = coring.Pather(path=["a", p])
             if pather.qb64 not in self.indexes:
                 self.indexes[pather.qb64] = subing.CesrDupSuber(
-                    db=self, subkey=pather.qb64, klas=coring.Saider
+                    db=self, subkey=self.named(pather.qb64), klas=coring.Saider
                 )
                 idx = IndexRecord(subkey=pather.qb64, paths=[pather.qb64])
                 self.dynIdx.pin(keys=(pather.qb64,), val=idx)
@@ -305,7 +1054,7 @@ class Seeker(dbing.LMDBer):
             subkey = f"{SCHEMA_FIELD.qb64}.{pather.qb64}"
             if subkey not in self.indexes:
                 self.indexes[subkey] = subing.CesrDupSuber(
-                    db=self, subkey=subkey, klas=coring.Saider
+                    db=self, subkey=self.named(subkey), klas=coring.Saider
                 )
                 idx = IndexRecord(subkey=subkey, paths=[SCHEMA_FIELD.qb64, pather.qb64])
                 self.dynIdx.pin(keys=(subkey,), val=idx)
@@ -315,7 +1064,7 @@ class Seeker(dbing.LMDBer):
                 subkey = f"{field.qb64}.{pather.qb64}"
                 if subkey not in self.indexes:
                     self.indexes[subkey] = subing.CesrDupSuber(
-                        db=self, subkey=subkey, klas=coring.Saider
+                        db=self, subkey=self.named(subkey), klas=coring.Saider
                     )
                     idx = IndexRecord(subkey=subkey, paths=[field.qb64, pather.qb64])
                     self.dynIdx.pin(keys=(subkey,), val=idx)
@@ -325,7 +1074,7 @@ class Seeker(dbing.LMDBer):
                 subkey = f"{field.qb64}.{SCHEMA_FIELD.qb64}.{pather.qb64}"
                 if subkey not in self.indexes:
                     self.indexes[subkey] = subing.CesrDupSuber(
-                        db=self, subkey=subkey, klas=coring.Saider
+                        db=self, subkey=self.named(subkey), klas=coring.Saider
                     )
                     idx = IndexRecord(
                         subkey=subkey,
@@ -337,24 +1086,33 @@ class Seeker(dbing.LMDBer):
 
         return [index for index in self.schIdx.get(keys=(said,))]
 
-    def find(self, filtr, sort=None, skip=None, limit=None):
-        return Cursor(seeker=self, filtr=filtr, sort=sort, skip=skip, limit=limit)
+    def find(self, filtr, sort=None, skip=None, limit=None, after=None):
+        return Cursor(
+            seeker=self, filtr=filtr, sort=sort, skip=skip, limit=limit, after=after
+        )
+
+    def count(self, filtr):
+        return Cursor(seeker=self, filtr=filtr).count()
 
 
-class ExnSeeker(dbing.LMDBer):
+class ExnSeeker(SharedLMDBer):
     """
-    Seeker indexes all credentials in the KERIpy `saved` Creder database.
+    ExnSeeker indexes the exchange messages in the KERIpy `exns` database.
 
-    Static indexes are created for issued by/schema and issued to/schema and dynamic indexes are
-    created for all top level scalar valued fields in the credential payload ('a' field).  The Seeker
-    uses the schema of each credential to determine the payload fields to index by.
+    Indexes are defined over the route, sender, recipient, date and IPEX schema fields of an exn and
+    every ordered pair of them. Only the indexes in .eager are kept from the start, any other is built
+    the first time a query can use it with a one-off backfill of every exn and kept up to date from
+    then on, so exns received are only written to the indexes that are used.
 
     """
 
     TailDirPath = "keri/exndb"
     AltTailDirPath = ".keri/exndb"
     TempPrefix = "keri_exndb_"
-    MaxNamedDBs = 36
+    MaxNamedDBs = 48
+    Virtual = ()
+    Multi = ()
+    Namespace = "exn:"
 
     DATE_FIELD = coring.Pather(path=["dt"])
     SENDER_FIELD = coring.Pather(path=["i"])
@@ -364,10 +1122,18 @@ class ExnSeeker(dbing.LMDBer):
     # Special field for IPEX messages... consider moving to IpexSeeker if needed
     SCHEMA = coring.Pather(path=["e", "acdc", "s"])
 
-    def __init__(self, db, headDirPath=None, perm=None, reopen=False, **kwa):
+    FIELDS = (ROUTE_FIELD, SENDER_FIELD, RECIPIENT_FIELD, DATE_FIELD, SCHEMA)
+
+    def __init__(
+        self, db, headDirPath=None, perm=None, reopen=False, indexes=None, **kwa
+    ):
         """
         Setup named sub databases.
 
+        Parameters:
+            indexes (list | None): indexes kept from the start, each a field path like "-a-i" or
+                paths joined by "." like "-i.-dt". Default None keeps the single field indexes
+
         Inherited Parameters:
             name is str directory path name differentiator for main database
                 When system employs more than one keri database, name allows
@@ -389,6 +1155,24 @@ class ExnSeeker(dbing.LMDBer):
         """
         self.db = db
         self.indexes = dict()
+        self.stats = None
+        self.built = None
+
+        if indexes is None:
+            self.eager = [field.qb64 for field in self.FIELDS]
+        else:
+            self.eager = [
+                ".".join(coring.Pather(bext=path).qb64 for path in index.split("."))
+                for index in indexes
+            ]
+
+        self.definitions = set()
+        for field in self.FIELDS:
+            self.definitions.add(field.qb64)
+            for subfield in self.FIELDS:
+                if field != subfield:
+                    self.definitions.add(f"{field.qb64}.{subfield.qb64}")
+        self.available = self.definitions | set(self.eager)
 
         super(ExnSeeker, self).__init__(
             headDirPath=headDirPath, perm=perm, reopen=reopen, **kwa
@@ -396,24 +1180,31 @@ class ExnSeeker(dbing.LMDBer):
 
     def reopen(self, **kwa):
         super(ExnSeeker, self).reopen(**kwa)
+        # Cardinality of each index for planning queries
+        self.stats = IndexStatistics(db=self, subkey=self.named("stats."))
+        # Indexes holding every exn, kept up to date as exns are indexed
+        self.built = subing.Suber(db=self, subkey=self.named("built."))
+        self.indexes = dict()
 
-        # List of dynamically created indexes to be recreated at load
-        # Create persistent Indexes if they don't already exist
-        fields = (
-            self.ROUTE_FIELD,
-            self.SENDER_FIELD,
-            self.RECIPIENT_FIELD,
-            self.DATE_FIELD,
-            self.SCHEMA,
-        )
-        # Index of credentials by issuer/issuee.
-        for field in fields:
-            self.createIndex(field.qb64)
-            for subfield in fields:
-                if field == subfield:
-                    continue
-                subkey = f"{field.qb64}.{subfield.qb64}"
-                self.createIndex(subkey)
+        if next(self.built.getItemIter(), None) is None:
+            # Every index used to be kept, those in the index set stay valid when already populated
+            self.createIndex(self.ROUTE_FIELD.qb64)
+            if entries(self.indexes[self.ROUTE_FIELD.qb64]) > 0:
+                for key in self.eager:
+                    if key in self.definitions:
+                        self.built.pin(keys=(key,), val="")
+            self.indexes = dict()
+
+        for keys, _ in self.built.getItemIter():
+            self.createIndex(".".join(keys))
+
+        # Eager indexes are backfilled from the exns of the agent database, without one the
+        # backfill is left to the seeker opened with it
+        for key in self.eager:
+            if self.db is None:
+                self.createIndex(key)
+            else:
+                self.demand(key)
 
     @property
     def table(self):
@@ -423,41 +1214,119 @@ class ExnSeeker(dbing.LMDBer):
         serder = self.db.exns.get(keys=(said,))
         return serder.ked
 
+    def records(self, rows):
+        """Yield (position, SAID, record) for each (position, SAID) row, see records()"""
+        return records(self.db.exns, rows)
+
     def saidIter(self):
         for (said,), _ in self.db.exns.getItemIter():
             yield said
 
     def createIndex(self, key):
-        self.indexes[key] = subing.CesrDupSuber(db=self, subkey=key, klas=coring.Saider)
+        self.indexes[key] = subing.CesrDupSuber(
+            db=self, subkey=self.named(key), klas=coring.Saider
+        )
+
+    def demand(self, name):
+        """True when index name can serve a query, backfilling it from every exn on first use"""
+        if name in self.indexes:
+            return True
+
+        if name not in self.available:
+            return False
+
+        self.createIndex(name)
+        try:
+            # Drop whatever an interrupted backfill or an older index set left behind
+            with self.env.begin(write=True) as txn:
+                txn.drop(self.indexes[name].sdb, delete=False)
+                txn.delete(name.encode("utf-8"), db=self.stats.stats.sdb)
+
+            saids = [said for (said,), _ in self.db.exns.getItemIter()]
+            self.batch(saids, indexes=[name]).load()
+        except Exception:
+            del self.indexes[name]
+            raise
+
+        self.built.pin(keys=(name,), val="")
+        return True
 
     def index(self, said):
-        if (serder := self.db.exns.get(keys=(said,))) is None:
-            raise ValueError(f"{said} is not a valid exn")
+        self.indexBatch([said])
 
-        saider = coring.Saider(qb64b=serder.saidb)
+    def indexBatch(self, saids):
+        """Index the exns of saids, writing all their index entries in one transaction
 
-        # Load schema index and if not indexed in schIdx, index it.
-        for index, db in self.indexes.items():
-            pathers = [coring.Pather(qb64=path) for path in index.split(".")]
-            values = []
-            for pather in pathers:
-                try:
-                    values.append(pather.resolve(serder.ked))
-                except KeyError:
-                    pass
-
-            value = "".join(values)
-            if not value:
-                continue
+        Raises:
+            ValueError: if any of saids is not a valid exn, nothing is indexed
+
+        """
+        return self.batch(saids).write()
+
+    def batch(self, saids, indexes=None):
+        """IndexBatch of the entries of the exns of saids in indexes, default every index kept"""
+        batch = IndexBatch(self)
+        for said in saids:
+            if (serder := self.db.exns.get(keys=(said,))) is None:
+                raise ValueError(f"{said} is not a valid exn")
+
+            saider = coring.Saider(qb64b=serder.saidb)
+
+            for index in indexes if indexes is not None else list(self.indexes):
+                pathers = [coring.Pather(qb64=path) for path in index.split(".")]
+                values = []
+                for pather in pathers:
+                    try:
+                        values.append(indexValue(pather.resolve(serder.ked)))
+                    except KeyError:
+                        pass
+
+                value = "".join(values)
+                if not value:
+                    continue
 
-            db.add(keys=(value,), val=saider)
+                batch.add(index, value, saider)
 
-    def find(self, filtr, sort=None, skip=None, limit=None):
-        return Cursor(seeker=self, filtr=filtr, sort=sort, skip=skip, limit=limit)
+        return batch
+
+    def reset(self):
+        """Empty every index kept and the index statistics for a rebuild of the indexes kept"""
+        with self.env.begin(write=True) as txn:
+            for idx in self.indexes.values():
+                txn.drop(idx.sdb, delete=False)
+            txn.drop(self.stats.stats.sdb, delete=False)
+
+    def find(self, filtr, sort=None, skip=None, limit=None, after=None):
+        return Cursor(
+            seeker=self, filtr=filtr, sort=sort, skip=skip, limit=limit, after=after
+        )
+
+    def count(self, filtr):
+        return Cursor(seeker=self, filtr=filtr).count()
 
 
 class Cursor:
-    def __init__(self, seeker, filtr=None, sort=None, skip=None, limit=None):
+    """Lazy query over a Seeker yielding matching SAIDs one page at a time
+
+    Results stream from LMDB cursors over the table or its indexes so a page only reads the entries
+    it returns plus those it skips. Every result has a position (its LMDB key and duplicate value)
+    and .token encodes the position of the last result of a full page so the next page can resume
+    right after it instead of skipping over everything already returned.
+
+    Filters over several indexes are planned from the index statistics kept by the Seeker. The
+    index expected to return the fewest entries drives the query and the others are probed, unless
+    testing every record of the table is expected to be cheaper.
+
+    The plan chosen, the indexes it read, the rows it scanned and the time spent planning, fetching
+    and counting are kept as the query runs and reported by .explain().
+    """
+
+    # Relative cost of loading and testing a record against reading an index entry
+    ScanCost = 10
+
+    def __init__(
+        self, seeker, filtr=None, sort=None, skip=None, limit=None, after=None
+    ):
         self.filtr = filtr
         self.operators = operators(self.filtr)
         self.names = [op.name for op in self.operators]
@@ -470,22 +1339,35 @@ class Cursor:
         self._sort = sort
         self._skip = skip if skip is not None else 0
         self._limit = limit if limit is not None else 25
+        self._after = after
+
+        self.rows = None
+        self.last = None
+        self.returned = 0
+        self.driver = None
 
-        self.cur = None
-        self.saids = None
+        self.plan = None
+        self.used = []
+        self.sorting = None
+        self.scanned = 0
+        self.loaded = 0
+        self.timings = dict(plan=0.0, fetch=0.0)
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if self.saids is None:
-            self._query()
+        if self.rows is None:
+            self.rows = self._query()
 
-        if self.cur >= len(self.saids):
-            raise StopIteration
+        start = time.perf_counter()
+        try:
+            position, said = next(self.rows)
+        finally:
+            self.timings["fetch"] += elapsed(start)
 
-        said = self.saids[self.cur]
-        self.cur += 1
+        self.last = position
+        self.returned += 1
         return said
 
     def sort(self, sort):
@@ -500,129 +1382,452 @@ class Cursor:
         self._limit = limit
         return self
 
+    def after(self, token):
+        self._after = token
+        return self
+
+    @property
+    def token(self):
+        """Continuation token resuming after the last SAID returned, None unless the page is full"""
+        if self.last is None or self.returned < self._limit:
+            return None
+
+        return encodeToken(self.last, self.driver)
+
+    def explain(self):
+        """Plan and work of the query so far, timings in milliseconds"""
+        return dict(
+            plan=self.plan,
+            indexes=self.used,
+            sort=self.sorting,
+            scanned=self.scanned,
+            loaded=self.loaded,
+            returned=self.returned,
+            timings={phase: round(ms, 3) for phase, ms in self.timings.items()},
+        )
+
+    def total(self, count=False):
+        """Number of records matching the filter when known without counting them, else None
+
+        A page read from the start that is not full ends the results, unless it skipped past their
+        end and so returned nothing. Otherwise the records are counted only when count is True.
+        """
+        if count:
+            return self.count()
+
+        if (
+            not self._after
+            and self.returned < self._limit
+            and (self.returned > 0 or self._skip == 0)
+        ):
+            return self._skip + self.returned
+
+        return None
+
+    def count(self):
+        """Number of records matching the filter, regardless of sort, skip, limit and after
+
+        Equality on one index, or on a compound index over every filtered field, is answered by the
+        count LMDB keeps of the duplicates at a key. Other filters count the SAIDs of the planned
+        index intersection, only loading records when a filter field has no index.
+        """
+        start = time.perf_counter()
+        # Counting plans again, keep what .explain() reports about the page
+        state = (
+            self.plan,
+            self.used,
+            self.sorting,
+            self.scanned,
+            self.loaded,
+            self.driver,
+        )
+        try:
+            return self._count()
+        finally:
+            (
+                self.plan,
+                self.used,
+                self.sorting,
+                self.scanned,
+                self.loaded,
+                self.driver,
+            ) = state
+            self.timings["count"] = elapsed(start)
+
+    def _count(self):
+        if len(self.filtr) == 0:
+            return entries(self.seeker.table)
+
+        if len(self.operators) == 1 and self.indexed(op := self.operators[0]):
+            if isinstance(op, Eq) and op.name not in self.seeker.Multi:
+                return op.estimate(self.seeker.indexes[op.name], None)
+
+        index = ".".join(self.names)
+        if self.indexable and self.seeker.demand(index):
+            val = "".join(indexValue(value) for value in self.values)
+            return self.seeker.indexes[index].cnt(keys=(val,))
+
+        return sum(1 for _ in self.candidates())
+
     def _query(self):
-        self.cur = 0
+        after = None
+        if self._after:
+            after, self.driver = decodeToken(self._after)
+
+        start = time.perf_counter()
+        rows = self.order(after)
+        self.timings["plan"] = elapsed(start)
+        return itertools.islice(rows, self._skip, self._skip + self._limit)
+
+    def candidates(self, after=None):
         if len(self.filtr) == 0:
-            self.saids = self.order(
-                [said for (said,), _ in self.seeker.table.getItemIter()]
-            )
-        elif (saids := self.indexSearch()) is not None:
-            self.saids = self.order(saids)
-        elif (saids := self.indexScan()) is not None:
-            self.saids = self.order(saids)
+            self.plan, self.used = "table", []
+            return self.counted(walk(self.seeker.table, after=after))
+        elif (rows := self.indexSearch(after)) is not None:
+            return rows
         else:
-            saids = self.fullTableScan()
-            self.saids = self.order(saids)
+            return self.indexScan(after)
+
+    def counted(self, rows):
+        """Rows of an index or table walk, counted as scanned"""
+        for row in rows:
+            self.scanned += 1
+            yield row
 
-    def indexSearch(self):
-        if len(self.operators) == 1 and self.operators[0].name in self.seeker.indexes:
+    def indexSearch(self, after=None):
+        if len(self.operators) == 1 and self.indexed(self.operators[0]):
             op = self.operators[0]
             idx = self.seeker.indexes[op.name]
-            return op.index(idx)
+            self.plan, self.used = "indexSearch", [op.name]
+            return self.distinct(op.name, self.counted(op.index(idx, after=after)))
 
         index = ".".join(self.names)
-        if not (self.indexable and index in self.seeker.indexes):
+        if not (self.indexable and self.seeker.demand(index)):
             return None
 
         idx = self.seeker.indexes[index]
-        val = "".join(self.values)
-        return [val.qb64 for val in idx.getIter(keys=(val,))]
+        val = "".join(indexValue(value) for value in self.values)
+        self.plan, self.used = "indexSearch", [index]
+        return self.counted(walk(idx, key=val, after=after))
 
-    def indexScan(self):
+    def indexScan(self, after=None):
         use = []
         scan = []
 
         for idx, op in enumerate(self.operators):
-            if op.name in self.seeker.indexes:
+            if self.indexed(op):
                 use.append(op)
             else:
                 scan.append(op)
 
         if len(use) == 0:
-            return self.fullTableScan()
-
-        idx = self.seeker.indexes[use[0].name]
-        saids = oset(use[0].index(idx))
-        if len(saids) == 0:
-            return list()
-
-        for i, op in enumerate(use[1:]):
-            idx = self.seeker.indexes[op.name]
-            nxt = oset(op.index(idx))
-            saids &= nxt
+            return self.fullTableScan(after)
+
+        # Stream the most selective index and probe the rest, a resumed query keeps its plan
+        plan = sorted(use, key=lambda op: (op.name != self.driver, self.estimate(op)))
+        scannable = not any(op.name in self.seeker.Virtual for op in use)
+        if scannable and (
+            self.driver == ""
+            or (self.driver is None and self.tableCost() < self.planCost(plan, scan))
+        ):
+            return self.fullTableScan(after)
+
+        first, *rest = plan
+        self.driver = first.name
+        self.plan, self.used = "indexScan", [op.name for op in plan]
+        members = [
+            set(
+                said for _, said in self.counted(op.index(self.seeker.indexes[op.name]))
+            )
+            for op in rest
+        ]
+        rows = (
+            (position, said)
+            for position, said in self.distinct(
+                first.name,
+                self.counted(first.index(self.seeker.indexes[first.name], after)),
+            )
+            if all(said in saids for saids in members)
+        )
 
         if len(scan) == 0:
-            return list(saids)
+            return rows
         else:
-            return self.tableScan(list(saids), scan)
+            return self.tableScan(rows, scan)
 
-    def fullTableScan(self):
-        saids = [saider.qb64 for _, saider in self.seeker.saidIter()]
-        return self.tableScan(saids, ops=self.operators)
+    def distinct(self, name, rows):
+        """Rows of index name with each SAID once, a credential has several entries in a Multi index
 
-    def tableScan(self, saids, ops):
-        res = []
-        for said in saids:
-            val = self.seeker.value(said)
-            for op in ops:
-                if op(val):
-                    res.append(said)
+        A query resumed from a token only skips the SAIDs of its own walk, so one with several edges
+        can be found again on a later page.
+        """
+        if name not in self.seeker.Multi:
+            return rows
 
-        return res
+        return unique(rows)
 
-    def order(self, saids):
-        if not self._sort:
-            return self.slice(saids)
+    def indexed(self, op):
+        """True when op can read its matches from an index of the Seeker"""
+        return op.indexed and self.seeker.demand(op.name)
 
-        if (res := self.indexOrder(saids)) is not None:
-            return res
-        else:
-            return self.tableScanOrder(saids)
+    def estimate(self, op):
+        """Estimated number of entries op reads from its index"""
+        idx = self.seeker.indexes[op.name]
+        return op.estimate(idx, self.seeker.stats.get(op.name, idx))
+
+    def planCost(self, plan, scan):
+        first, *rest = plan
+        rows = self.estimate(first)
+        cost = rows + sum(self.estimate(op) for op in rest)
+        return cost + (rows * self.ScanCost if scan else 0)
 
-    def indexOrder(self, saids):
+    def tableCost(self):
+        return entries(self.seeker.table) * self.ScanCost
+
+    def fullTableScan(self, after=None):
+        self.driver = ""
+        self.plan, self.used = "fullTableScan", []
+        rows = self.counted(walk(self.seeker.table, after=after))
+        return self.tableScan(rows, ops=self.operators)
+
+    def tableScan(self, rows, ops):
+        """Rows whose record matches every operator of ops
+
+        Each record is decoded once and tested by the predicate compiled from ops, which stops at
+        the first operator the record fails. Operators on virtual fields are tested on their index
+        instead, as those fields are not in the record.
+        """
+        virtual = [op for op in ops if op.name in self.seeker.Virtual]
+        ops = [op for op in ops if op.name not in self.seeker.Virtual]
+        if virtual:
+            rows = self.virtualScan(rows, virtual)
+        if not ops:
+            return rows
+
+        return self.recordScan(rows, ops)
+
+    def virtualScan(self, rows, ops):
+        """Rows matching ops on virtual fields, present when the index of the field holds the SAID
+
+        Only $exists false is left to scan on a virtual field, every other operator reads its index.
+        """
+        present = [
+            (
+                op,
+                set(
+                    said for _, said in self.counted(walk(self.seeker.indexes[op.name]))
+                ),
+            )
+            for op in ops
+        ]
+        for position, said in rows:
+            if all(op.test(True if said in saids else None) for op, saids in present):
+                yield position, said
+
+    def recordScan(self, rows, ops):
+        match = predicate(ops)
+        for position, said, sad in self.seeker.records(rows):
+            self.loaded += 1
+            if match(sad):
+                yield position, said
+
+    def order(self, after=None):
+        if self._sort and (rows := self.indexOrder(after)) is not None:
+            return rows
+
+        # Without an index for the sort order results stay in the order they are found
+        return self.candidates(after)
+
+    def indexOrder(self, after=None):
         index = ".".join([coring.Pather(bext=s).qb64 for s in self._sort])
-        if index not in self.seeker.indexes:
+        if not self.seeker.demand(index):
             return None
 
-        idx = self.seeker.indexes[index]
-        ctx = idx.getItemIter()
-
-        # Run off the values before start
-        cur = 0
-        while cur < self._skip:
-            _, saider = next(ctx)
-            if saider.qb64 in saids:
-                cur += 1
-
-        # Load values in order until we get enough (based on limit)
-        res = []
-        for _, saider in ctx:
-            if saider.qb64 in saids:
-                res.append(saider.qb64)
-
-            if len(res) == self._limit:
-                break
+        self.sorting = index
+        rows = self.distinct(
+            index, self.counted(walk(self.seeker.indexes[index], after=after))
+        )
+        if len(self.filtr) == 0:
+            self.plan, self.used = "indexOrder", [index]
+            return rows
+
+        return self.members(rows, set(said for _, said in self.candidates()))
 
-        return res
+    @staticmethod
+    def members(rows, saids):
+        """Rows of the sort index with SAIDs in the hashed candidate set saids
 
-    def slice(self, saids):
-        if self._skip >= len(saids):
-            return []
+        The walk stops once every candidate has been found instead of running off the rest of the
+        index, and yields each candidate once even when it has several entries in the index.
+        """
+        pending = set(saids)
+        if not pending:
+            return
+
+        for position, said in rows:
+            if said in pending:
+                yield position, said
+                pending.discard(said)
+                if not pending:
+                    return
+
+
+def unique(rows):
+    """Rows of an index walk without the later entries of a SAID already yielded"""
+    seen = set()
+    for position, said in rows:
+        if said not in seen:
+            seen.add(said)
+            yield position, said
 
-        end = self._skip + self._limit
-        return saids[self._skip : end]
 
-    def tableScanOrder(self, saids):
-        """Should we bother implementing table scan sort order
+def elapsed(start):
+    """Milliseconds since start, a time.perf_counter() reading"""
+    return (time.perf_counter() - start) * 1000
 
-        We have single field indexes for all fields in credentials so this situation will
-        only occur if multiple fields are selected for which we don't have a multi-column
-        index.  In that case, perhaps we raise an exception.
 
-        For now, we'll just slice the results to honor skip and limit.
+class QueryLog:
+    """Bounded log of the queries of one agent that took longer than a threshold"""
 
+    # Number of slow queries kept, the oldest are dropped first
+    Size = 100
+
+    def __init__(self, threshold=None, size=Size):
+        """
+        Parameters:
+            threshold (float | None): milliseconds a query must take to be logged, None logs none
+            size (int): number of slow queries kept
         """
-        return self.slice(saids)
+        self.threshold = threshold
+        self.entries = deque(maxlen=size)
+
+    def record(self, kind, cur):
+        """Log cur when the phases it timed took at least the threshold
+
+        Parameters:
+            kind (str): collection queried, credentials or exchanges
+            cur (Cursor): query after its page was read, counted and loaded
+
+        Returns:
+            bool: True if the query was logged
+        """
+        took = sum(cur.timings.values())
+        if self.threshold is None or took < self.threshold:
+            return False
+
+        entry = dict(
+            kind=kind,
+            ms=round(took, 3),
+            filter=cur.filtr,
+            sort=cur._sort,
+            skip=cur._skip,
+            limit=cur._limit,
+            explain=cur.explain(),
+        )
+        self.entries.append(entry)
+        logger.warning(f"Slow {kind} query took {took:.1f}ms: {json.dumps(entry)}")
+        return True
+
+
+def walk(suber, key=None, prefix=None, after=None, start=None):
+    """Stream the entries of a Seeker table or index in LMDB order with a read cursor
+
+    Parameters:
+        suber (SuberBase): table keyed by SAID or index with SAIDs as duplicate values of each key
+        key (str): only walk the entries at exactly this key
+        prefix (str): only walk the entries with keys starting with this prefix
+        after (tuple): (key, val) position to resume from, exclusive
+        start (str): key to start walking from, inclusive, when not resuming
+
+    Yields:
+        tuple: ((key, val) position, SAID) for each entry. Table positions have an empty val
+
+    """
+    if key is not None:
+        start = key
+    elif prefix is not None:
+        start = prefix
+    start = (start or "").encode("utf-8")
+
+    with suber.db.env.begin(db=suber.sdb, write=False, buffers=False) as txn:
+        dupsort = suber.sdb.flags(txn)["dupsort"]
+        cursor = txn.cursor()
+        found = (
+            cursor.set_range(start) if after is None else seek(cursor, after, dupsort)
+        )
+        while found:
+            ckey, cval = cursor.item()
+            if key is not None and ckey != start:
+                break
+            if prefix is not None and not ckey.startswith(start):
+                break
+
+            if dupsort:
+                yield (ckey, cval), cval.decode("utf-8")
+            else:
+                yield (ckey, b""), ckey.decode("utf-8")
+
+            found = cursor.next()
+
+
+def records(suber, rows):
+    """Stream the record saved in suber at the SAID of each (position, SAID) row
+
+    Records are read in one read transaction and decoded without computing their SAIDs again, they
+    were verified before they were saved.
+
+    Parameters:
+        suber (SerderSuber): credentials or exchange messages keyed by SAID
+        rows (Iterable): (position, SAID) rows of a walk of the table or an index
+
+    Yields:
+        tuple: (position, SAID, record) for each row with a saved record
+    """
+    with suber.db.env.begin(db=suber.sdb, write=False, buffers=True) as txn:
+        for position, said in rows:
+            if (raw := txn.get(said.encode("utf-8"))) is not None:
+                yield position, said, suber.klas(raw=bytes(raw), verify=False).sad
+
+
+def seek(cursor, after, dupsort):
+    """Move cursor to the first entry after position, which need not still exist"""
+    key, val = after
+    if dupsort and cursor.set_range_dup(key, val):
+        return cursor.next() if cursor.value() == val else True
+
+    if cursor.set_range(key):
+        return cursor.next_nodup() if cursor.key() == key else True
+
+    return False
+
+
+def encodeToken(position, driver=None):
+    """Opaque continuation token for a (key, val) position in the index named driver"""
+    key, val = position
+    token = [key.decode("utf-8"), val.decode("utf-8")]
+    if driver is not None:
+        token.append(driver)
+
+    raw = json.dumps(token).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("utf-8")
+
+
+def decodeToken(token):
+    """Position (key, val) of a continuation token and the index it is in, if recorded
+
+    Raises:
+        ValueError: if token was not made by encodeToken
+
+    """
+    try:
+        key, val, *driver = json.loads(base64.urlsafe_b64decode(token.encode("utf-8")))
+        driver = driver[0] if driver else None
+        if driver is not None and not isinstance(driver, str):
+            raise ValueError(f"invalid driver {driver}")
+
+        return (key.encode("utf-8"), val.encode("utf-8")), driver
+    except (TypeError, ValueError, AttributeError) as ex:
+        raise ValueError(f"invalid continuation token {token}") from ex
 
 
 def operators(filtr):
@@ -632,17 +1837,29 @@ def operators(filtr):
     executable operators to apply to a given credential search
 
     """
-    # filtr = {"-a-i": {"$begins": "984"}}
+    # filtr = {"-a-i": {"$begins": "984"}, "-a-dt": {"$gte": "2024-01-01", "$lt": "2025-01-01"}}
     ops = []
     for f, v in filtr.items():
         if isinstance(v, dict):
+            bounds = dict()
             for op, val in v.items():
                 match op:
                     case "$eq":
                         ops.append(Eq(field=f, value=val))
                     case "$begins":
                         ops.append(Begins(field=f, value=val))
-            pass
+                    case "$gt" | "$gte" | "$lt" | "$lte":
+                        bounds[op[1:]] = val
+                    case "$in":
+                        ops.append(In(field=f, values=val))
+                    case "$ne":
+                        ops.append(Ne(field=f, value=val))
+                    case "$exists":
+                        ops.append(Exists(field=f, exists=val))
+
+            # All bounds on a field are one range scan
+            if bounds:
+                ops.append(Range(field=f, **bounds))
         else:
             ops.append(Eq(field=f, value=v))
 
@@ -650,6 +1867,8 @@ def operators(filtr):
 
 
 class Eq:
+    indexed = True
+
     def __init__(self, field, value):
         self.field = field
         self.pather = coring.Pather(bext=self.field)
@@ -661,18 +1880,30 @@ class Eq:
                 f"invalid argument length={len(args)} for equals operator, must be 2"
             )
 
-        val = self.pather.resolve(args[0])
+        return self.test(resolve(self.pather, args[0]))
+
+    def test(self, val):
+        """True when val, the value of the field or None without it, matches"""
         return val == self.value
 
     @property
     def name(self) -> str:
         return self.pather.qb64
 
-    def index(self, idx):
-        return [val.qb64 for val in idx.getIter(keys=(self.value,))]
+    def index(self, idx, after=None):
+        return walk(idx, key=indexValue(self.value), after=after)
+
+    def estimate(self, idx, stats):
+        # LMDB counts the duplicates of one key without reading them
+        return idx.cnt(keys=(indexValue(self.value),))
 
 
 class Begins:
+    indexed = True
+
+    # Estimated number of distinct next characters after a prefix
+    Fanout = 16
+
     def __init__(self, field, value):
         self.field = field
         self.pather = coring.Pather(bext=self.field)
@@ -687,15 +1918,316 @@ class Begins:
                 f"invalid argument length={len(args)} for begins operator, must be 2"
             )
 
-        val = self.pather.resolve(args[0])
-        if not isinstance(val, str):
-            raise ValueError(f"invalid type={type(args[0])} for begins, must be `str`")
+        return self.test(resolve(self.pather, args[0]))
+
+    def test(self, val):
+        return isinstance(val, str) and val.startswith(self.value)
+
+    def index(self, idx, after=None):
+        return walk(idx, prefix=self.value, after=after)
+
+    def estimate(self, idx, stats):
+        # Assume each character of the prefix narrows the distinct keys by the fanout
+        keys = max(1.0, stats.keys / self.Fanout ** len(self.value))
+        return keys * stats.dups
+
+    @property
+    def name(self) -> str:
+        return self.pather.qb64
+
+
+def resolve(pather, sad):
+    """Value at pather in sad, None when it has no such field"""
+    try:
+        return pather.resolve(sad)
+    except (KeyError, ValueError):
+        return None
+
+
+def accessor(pather):
+    """Returns function of a record resolving pather in it, None when it has no such field
+
+    Follows the rules of Pather.resolve, where a number in a path indexes a list or the fields of
+    a map in order, with the path split once instead of for every record.
+    """
+    path = tuple((part, int(part) if part.isdigit() else None) for part in pather.path)
+
+    def get(sad):
+        val = sad
+        for part, i in path:
+            if isinstance(val, dict):
+                if i is None:
+                    val = val.get(part)
+                elif i < len(val):
+                    val = next(itertools.islice(val.values(), i, None))
+                else:
+                    return None
+            elif isinstance(val, list) and i is not None and i < len(val):
+                val = val[i]
+            else:
+                return None
+
+        return val
+
+    return get
+
+
+def predicate(ops):
+    """Compile ops into one test of a record, True when the record matches every operator
+
+    The value of each field is resolved once for all operators on it and the test returns at the
+    first operator that fails.
+    """
+    fields = dict()
+    for op in ops:
+        fields.setdefault(op.field, (accessor(op.pather), []))[1].append(op.test)
+    fields = tuple((get, tuple(tests)) for get, tests in fields.values())
+
+    def match(sad):
+        for get, tests in fields:
+            val = get(sad)
+            for test in tests:
+                if not test(val):
+                    return False
+
+        return True
+
+    return match
+
+
+def comparable(val, bound):
+    """True when val and bound order by the same rules, numbers with numbers and strings with strings"""
+    if isinstance(val, bool) or isinstance(bound, bool):
+        return False
+    if isinstance(val, (int, float)):
+        return isinstance(bound, (int, float))
+
+    return isinstance(val, str) and isinstance(bound, str)
+
+
+class Range:
+    indexed = True
+
+    # Assumed fraction of an index within a range
+    Selectivity = 0.25
+
+    def __init__(self, field, gt=None, gte=None, lt=None, lte=None):
+        self.field = field
+        self.pather = coring.Pather(bext=self.field)
+
+        if gt is not None and gte is not None:
+            raise ValueError("invalid range with both $gt and $gte")
+        if lt is not None and lte is not None:
+            raise ValueError("invalid range with both $lt and $lte")
+
+        self.lower = gt if gt is not None else gte
+        self.lowerInclusive = gt is None
+        self.upper = lt if lt is not None else lte
+        self.upperInclusive = lt is None
+
+        for bound in (self.lower, self.upper):
+            if bound is not None and not comparable(bound, bound):
+                raise ValueError(
+                    f"invalid type={type(bound)} for range, must be `str` or number"
+                )
+
+    def __call__(self, *args, **kwargs):
+        if len(args) != 1:
+            raise ValueError(
+                f"invalid argument length={len(args)} for range operator, must be 2"
+            )
+
+        return self.test(resolve(self.pather, args[0]))
+
+    def test(self, val):
+        if self.lower is not None:
+            if not comparable(val, self.lower):
+                return False
+            if val < self.lower or (val == self.lower and not self.lowerInclusive):
+                return False
+
+        if self.upper is not None:
+            if not comparable(val, self.upper):
+                return False
+            if val > self.upper or (val == self.upper and not self.upperInclusive):
+                return False
+
+        return val is not None
+
+    @property
+    def name(self) -> str:
+        return self.pather.qb64
+
+    @property
+    def value(self):
+        return [self.lower, self.upper]
+
+    def index(self, idx, after=None):
+        lower = indexValue(self.lower) if self.lower is not None else None
+        upper = indexValue(self.upper) if self.upper is not None else None
+        lowerb = lower.encode("utf-8") if lower is not None else None
+        upperb = upper.encode("utf-8") if upper is not None else None
+
+        for start, stop in self.spans(lower):
+            stopb = stop.encode("utf-8") if stop is not None else None
+            if after is not None and stopb is not None and after[0] >= stopb:
+                continue  # resumed past this span
+
+            for position, said in walk(idx, start=start, after=after):
+                key = position[0]
+                if stopb is not None and key >= stopb:
+                    break
+
+                if lowerb is not None and key == lowerb and not self.lowerInclusive:
+                    continue
+
+                if upperb is not None and (
+                    key > upperb or (key == upperb and not self.upperInclusive)
+                ):
+                    return
+
+                yield position, said
+
+            after = None
+
+    def spans(self, lower):
+        """(start, stop) key spans of the index holding values of the type of the bounds
+
+        Numbers are keyed between NUMBER_PREFIX and NUMBER_END, so a number range walks only
+        that span and a string range walks the spans on either side of it.
+        """
+        bound = self.lower if self.lower is not None else self.upper
+        if isinstance(bound, str):
+            spans = [(lower or "", NUMBER_PREFIX), (max(lower or "", NUMBER_END), None)]
+        else:
+            spans = [(lower or NUMBER_PREFIX, NUMBER_END)]
+
+        return [(start, stop) for start, stop in spans if stop is None or start < stop]
+
+    def estimate(self, idx, stats):
+        return stats.entries * self.Selectivity
+
+
+class In:
+    indexed = True
+
+    def __init__(self, field, values):
+        self.field = field
+        self.pather = coring.Pather(bext=self.field)
+
+        if not isinstance(values, list):
+            raise ValueError(f"invalid type={type(values)} for in, must be `list`")
+        for val in values:
+            if not comparable(val, val):
+                raise ValueError(
+                    f"invalid type={type(val)} for in value, must be `str` or number"
+                )
+        self.value = values
+
+    def __call__(self, *args, **kwargs):
+        if len(args) != 1:
+            raise ValueError(
+                f"invalid argument length={len(args)} for in operator, must be 2"
+            )
+
+        return self.test(resolve(self.pather, args[0]))
 
-        return val.startswith(self.value)
+    def test(self, val):
+        return val is not None and val in self.value
 
-    def index(self, idx):
-        return [val.qb64 for _, val in idx.getItemIter(keys=(self.value,))]
+    @property
+    def name(self) -> str:
+        return self.pather.qb64
+
+    def keys(self):
+        """Index keys of the values in index order"""
+        return sorted(set(indexValue(val).encode("utf-8") for val in self.value))
+
+    def index(self, idx, after=None):
+        for key in self.keys():
+            # Keys before the resumed position were read by earlier pages
+            if after is not None and key < after[0]:
+                continue
+
+            resume = after if after is not None and key == after[0] else None
+            yield from walk(idx, key=key.decode("utf-8"), after=resume)
+
+    def estimate(self, idx, stats):
+        return sum(idx.cnt(keys=(key,)) for key in self.keys())
+
+
+class Ne:
+    """Matches records with the field present and not equal to value"""
+
+    indexed = True
+
+    def __init__(self, field, value):
+        self.field = field
+        self.pather = coring.Pather(bext=self.field)
+
+        if not comparable(value, value):
+            raise ValueError(
+                f"invalid type={type(value)} for ne, must be `str` or number"
+            )
+        self.value = value
+
+    def __call__(self, *args, **kwargs):
+        if len(args) != 1:
+            raise ValueError(
+                f"invalid argument length={len(args)} for not equals operator, must be 2"
+            )
+
+        return self.test(resolve(self.pather, args[0]))
+
+    def test(self, val):
+        return val is not None and val != self.value
+
+    @property
+    def name(self) -> str:
+        return self.pather.qb64
+
+    def index(self, idx, after=None):
+        # The ranges before and after the key of value
+        key = indexValue(self.value).encode("utf-8")
+        for position, said in walk(idx, after=after):
+            if position[0] != key:
+                yield position, said
+
+    def estimate(self, idx, stats):
+        return stats.entries - idx.cnt(keys=(indexValue(self.value),))
+
+
+class Exists:
+    def __init__(self, field, exists):
+        self.field = field
+        self.pather = coring.Pather(bext=self.field)
+
+        if not isinstance(exists, bool):
+            raise ValueError(f"invalid type={type(exists)} for exists, must be `bool`")
+        self.value = exists
+
+    def __call__(self, *args, **kwargs):
+        if len(args) != 1:
+            raise ValueError(
+                f"invalid argument length={len(args)} for exists operator, must be 2"
+            )
+
+        return self.test(resolve(self.pather, args[0]))
+
+    def test(self, val):
+        return (val is not None) == self.value
+
+    @property
+    def indexed(self):
+        # Every entry of an index has the field, records without it are only found by scanning
+        return self.value
 
     @property
     def name(self) -> str:
         return self.pather.qb64
+
+    def index(self, idx, after=None):
+        return walk(idx, after=after)
+
+    def estimate(self, idx, stats):
+        return stats.entries
@@ -85,6 +85,12 @@ class OOBIEnd:
 
             aid = self.default
 
+        if not self.agency.warm(aid):
+            raise falcon.HTTPServiceUnavailable(
+                title=f"agent for {aid} is loading",
+                retry_after=self.agency.loader.RetryAfter,
+            )
+
         agent = self.agency.lookup(pre=aid)
         if agent is None:
             raise falcon.HTTPNotFound(description="AID not found for this OOBI")
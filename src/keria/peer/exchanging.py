@@ -6,6 +6,7 @@ keria.app.exchanging module
 """
 
 import json
+import time
 from typing import Union
 from dataclasses import dataclass
 
@@ -27,6 +28,9 @@ def loadEnds(app):
     exnColEnd = ExchangeQueryCollectionEnd()
     app.add_route("/exchanges/query", exnColEnd)
 
+    exnCountEnd = ExchangeQueryCountEnd()
+    app.add_route("/exchanges/query/count", exnCountEnd)
+
     exnResEnd = ExchangeResourceEnd()
     app.add_route("/exchanges/{said}", exnResEnd)
 
@@ -200,9 +204,24 @@ class ExchangeQueryCollectionEnd:
                     limit:
                       type: integer
                       description: The maximum number of exchange messages to return. (default=25)
+                    after:
+                      type: string
+                      description: Continuation-Token of the previous page to resume after.
+                    explain:
+                      type: boolean
+                      description: Return the query plan, the entries it read and its timings with the SAIDs found.
+                    count:
+                      type: boolean
+                      description: Count every matching record for the total of the Content-Range header, which
+                                   is * when the page is full and not counted.
         responses:
             200:
-              description: Successfully retrieved the exchange messages.
+              description: Successfully retrieved the exchange messages, or the explained query when explain is set.
+              headers:
+                Continuation-Token:
+                  schema:
+                    type: string
+                  description: Pass as `after` to get the next page, only present when the page is full.
               content:
                 application/json:
                   schema:
@@ -235,15 +254,41 @@ class ExchangeQueryCollectionEnd:
                 limit = body["limit"]
             else:
                 limit = 25
+
+            after = body.get("after")
+            explain = body.get("explain", False)
+            counting = body.get("count", False)
         except falcon.HTTPError:
             filtr = {}
             sort = {}
             skip = 0
             limit = 25
+            after = None
+            explain = False
+            counting = False
 
-        cur = agent.exnseeker.find(filtr=filtr, sort=sort, skip=skip, limit=limit)
-        saids = [coring.Saider(qb64=said) for said in cur]
-
+        try:
+            cur = agent.exnseeker.find(
+                filtr=filtr, sort=sort, skip=skip, limit=limit, after=after
+            )
+            saids = [coring.Saider(qb64=said) for said in cur]
+            total = cur.total(count=counting)
+        except ValueError as ex:
+            raise falcon.HTTPBadRequest(description=ex.args[0])
+
+        if (token := cur.token) is not None:
+            rep.set_header("Continuation-Token", token)
+
+        if explain:
+            agent.queryLog.record("exchanges", cur)
+            rep.status = falcon.HTTP_200
+            rep.content_type = "application/json"
+            rep.data = json.dumps(
+                dict(cur.explain(), count=total, results=[said.qb64 for said in saids])
+            ).encode("utf-8")
+            return
+
+        start = time.perf_counter()
         exns = []
         for said in saids:
             serder, pathed = exchanging.cloneMessage(agent.hby, said.qb64)
@@ -254,11 +299,75 @@ class ExchangeQueryCollectionEnd:
                 )
             )
 
+        cur.timings["load"] = (time.perf_counter() - start) * 1000
+        agent.queryLog.record("exchanges", cur)
+
+        end = skip + (len(exns) - 1) if len(exns) > 0 else 0
+        rep.set_header("Accept-Ranges", "exchanges")
+        rep.set_header(
+            "Content-Range",
+            f"exchanges {skip}-{end}/{'*' if total is None else total}",
+        )
+
         rep.status = falcon.HTTP_200
         rep.content_type = "application/json"
         rep.data = json.dumps(exns).encode("utf-8")
 
 
+class ExchangeQueryCountEnd:
+    @staticmethod
+    def on_post(req, rep):
+        """POST endpoint counting the exchange messages matching a query
+
+        Args:
+            req (Request): falcon HTTP request object
+            rep (Response): falcon HTTP response object
+
+        ---
+        summary: Count exchange messages matching a query.
+        description: This endpoint counts the exchange messages matching the filter without loading them.
+        tags:
+        - Exchange Message
+        requestBody:
+            content:
+              application/json:
+                schema:
+                  type: object
+                  properties:
+                    filter:
+                      type: object
+                      description: The filter criteria to apply on the exchange messages.
+        responses:
+            200:
+              description: Number of matching exchange messages.
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      count:
+                        type: integer
+            400:
+              description: Bad request. The filter is invalid.
+        """
+        agent = req.context.agent
+
+        try:
+            body = req.get_media()
+            filtr = body.get("filter", {})
+        except falcon.HTTPError:
+            filtr = {}
+
+        try:
+            count = agent.exnseeker.count(filtr=filtr)
+        except ValueError as ex:
+            raise falcon.HTTPBadRequest(description=ex.args[0])
+
+        rep.status = falcon.HTTP_200
+        rep.content_type = "application/json"
+        rep.data = json.dumps(dict(count=count)).encode("utf-8")
+
+
 class ExchangeResourceEnd:
     """Exchange message resource endpoint class"""
 
@@ -346,6 +346,197 @@ def test_agency():
         assert len(agent.doers) == 0
 
 
+def test_agency_loader():
+    salt = b"0123456789aaaaaa"
+    salter = core.Salter(raw=salt)
+    base = "keria-loader"
+
+    def clean():
+        for sub in ("db", "ks", "adb", "reg"):
+            if os.path.exists(f"/usr/local/var/keri/{sub}/{base}"):
+                shutil.rmtree(f"/usr/local/var/keri/{sub}/{base}")
+
+    clean()
+    agency = agenting.Agency(
+        name="agency",
+        base=base,
+        bran=None,
+        configFile="keria",
+        configDir=SCRIPTS_DIR,
+    )
+    doist = doing.Doist(limit=1.0, tock=0.03125, real=True)
+    doist.enter(doers=[agency])
+
+    # Without loader threads warm never defers to the background
+    caid = "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose"
+    assert agency.warm(caid) is True
+    agent = agency.create(caid, salt=salter.qb64)
+    pre = agent.pre
+    agency.shut(agent)
+    # LMDB environments must not be opened twice in one process
+    agency.adb.close()
+
+    agency = agenting.Agency(
+        name="agency",
+        base=base,
+        bran=None,
+        configFile="keria",
+        configDir=SCRIPTS_DIR,
+        loaders=1,
+    )
+    # Keep the deeds, the Loader exits once they are garbage collected
+    deeds = doist.enter(doers=[agency])
+
+    badcaid = "E987eerAdhmvrjDeam2eAO2SR5niCgnjAJXJHtJoe"
+    assert agency.warm(badcaid) is True
+    assert agency.adb.controller(pre) == caid
+
+    # Cold agent is loaded on a loader thread, get waits for the load in flight
+    assert agency.warm(caid) is False
+    assert caid in agency.loader.loads
+    agent = agency.get(caid)
+    assert agent.pre == pre
+    assert agency.agents[caid] is agent
+    assert caid not in agency.loader.loads
+    assert agency.warm(caid) is True
+    assert agency.warm(pre) is True
+
+    # Completed loads are installed by the Loader doer
+    agency.shut(agent)
+    assert agency.warm(caid) is False
+    agency.loader.loads[caid].result()
+    doist.recur(deeds=deeds)
+    assert caid in agency.agents
+    assert caid not in agency.loader.loads
+
+    agency.shut(agency.agents[caid])
+    agency.loader.exit()
+    clean()
+
+
+def test_agency_stretch():
+    bran = "0123456789abcdefghijk"
+    agency = agenting.Agency(name="agency", bran=bran, temp=True)
+    assert agency.seed is None
+    assert agency.aeid is None
+
+    doist = doing.Doist(limit=1.0, tock=0.03125, real=True)
+    doist.enter(doers=[agency])
+
+    salter = core.Salter(raw=b"0123456789aaaaaa")
+    agent = agency.create(
+        "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose", salt=salter.qb64
+    )
+    seed, aeid = agency.seed, agency.aeid
+    assert seed is not None
+    assert agent.hby.mgr.aeid == aeid
+
+    # The passcode is stretched once and reused for every agent
+    other = agency.create(
+        "EIaGMMWJFPmtXznY1IIiKDIrg-vIyge6mBl2QV8dDjI3", salt=salter.qb64
+    )
+    assert agency.stretch() == (seed, aeid)
+    assert other.hby.mgr.aeid == aeid
+
+    # Same keys Habery derives from the passcode itself
+    with habbing.openHby(name="stretch", temp=True, bran=bran) as hby:
+        assert hby.mgr.aeid == aeid
+
+    assert agenting.Agency(name="agency", bran=None, temp=True).stretch() == (
+        None,
+        None,
+    )
+    with pytest.raises(ValueError):
+        agenting.Agency(name="agency", bran="tooshort", temp=True).stretch()
+
+
+def test_releaser():
+    salter = core.Salter(raw=b"0123456789aaaaaa")
+    agency = agenting.Agency(name="agency", bran=None, temp=True, maxAgents=1)
+    doist = doing.Doist(limit=1.0, tock=0.03125, real=True)
+    doist.enter(doers=[agency])
+
+    releaser = agency.releaser
+    first = agency.create(
+        "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose", salt=salter.qb64
+    )
+    second = agency.create(
+        "EIaGMMWJFPmtXznY1IIiKDIrg-vIyge6mBl2QV8dDjI3", salt=salter.qb64
+    )
+    assert len(releaser.heap) == 2
+
+    # Using the first agent makes the second the least recently used
+    assert agency.get(first.caid) is first
+    releaser.release()
+    assert first.caid in agency.agents
+    assert second.caid not in agency.agents
+    assert second not in agency.doers
+    assert releaser.evictions == dict(idle=0, count=1, rss=0)
+
+    # Agents with a stream or long poll still open are kept until it closes
+    releaser.releaseTimeout = 0
+    stream = longrunning.OperationStream(first.monitor, timeout=60)
+    releaser.release()
+    assert first.caid in agency.agents
+    stream.expires = 0
+    with pytest.raises(StopIteration):
+        next(stream)
+
+    waiter = longrunning.OperationWaiter(
+        first.monitor, "done.op", longrunning.Operation(name="done.op"), 60
+    )
+    releaser.release()
+    assert first.caid in agency.agents
+    waiter.expires = 0
+    next(waiter)
+
+    # Idle agents are released once past the timeout
+    releaser.release()
+    assert len(agency.agents) == 0
+    assert releaser.heap == []
+    assert releaser.evictions == dict(idle=1, count=1, rss=0)
+
+    metrics = releaser.metrics()
+    assert metrics["resident"] == 0
+    assert metrics["maxAgents"] == 1
+    assert metrics["evictions"] == dict(idle=1, count=1, rss=0)
+    assert metrics["credentialCache"] == dict(hits=0, misses=0, sads=0, clones=0)
+
+
+def test_collector():
+    salter = core.Salter(raw=b"0123456789aaaaaa")
+    agency = agenting.Agency(
+        name="agency", bran=None, temp=True, opRetention=3600, opCollectBatch=2
+    )
+    doist = doing.Doist(limit=1.0, tock=0.03125, real=True)
+    doist.enter(doers=[agency])
+
+    collector = agency.collector
+    agent = agency.create(
+        "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose", salt=salter.qb64
+    )
+    for i in range(3):
+        agent.monitor.submit(
+            f"op{i}", longrunning.OpTypes.done, dict(response=dict(i=i))
+        )
+    oobi = "http://127.0.0.1:5642/oobi/EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+    agent.monitor.submit("op3", longrunning.OpTypes.oobi, dict(oobi=oobi))
+
+    # Nothing finished before the retention period
+    assert collector.collect() == 0
+
+    # Finished operations are removed oldest first in batches, pending ones are kept
+    collector.retention = 0
+    assert collector.collect() == 2
+    assert agent.monitor.get("done.op0") is None
+    assert agent.monitor.get("done.op1") is None
+    assert collector.collect() == 1
+    assert collector.collect() == 0
+    assert [name for _, name in agent.monitor.names()] == ["oobi.op3"]
+
+    assert collector.metrics() == dict(retention=0, reclaimed=3, agents={agent.caid: 3})
+
+
 def test_agency_without_config_file():
     salt = b"0123456789bbbbbb"
     salter = core.Salter(raw=salt)
@@ -944,12 +1135,13 @@ def test_query_ends(helpers):
 
 
 class MockServerTls:
-    def __init__(self, certify, keypath, certpath, cafilepath, port):
+    def __init__(self, certify, keypath, certpath, cafilepath, host, port):
         pass
 
 
 class MockHttpServer:
-    def __init__(self, port, app, servant=None):
+    def __init__(self, host, port, app, servant=None):
+        self.host = host
         self.servant = servant
 
 
@@ -968,6 +1160,10 @@ def test_createHttpServer(monkeypatch):
 
     assert isinstance(server, MockHttpServer)
     assert isinstance(server.servant, MockServerTls)
+    assert server.host == ""
+
+    server = httping.createHttpServer(port, app, host="127.0.0.1")
+    assert server.host == "127.0.0.1"
 
 
 def test_seeker_doer(helpers):
@@ -999,6 +1195,85 @@ def test_seeker_doer(helpers):
         assert result is False
         assert len(cues) == 1
 
+        # Cues are drained in bounded batches and unindexable ones requeued
+        cues.append(dict(kin="revoked", creder=creder))
+        seeker.BatchSize = 1
+        assert seeker.recur() is False
+        assert [cue["kin"] for cue in cues] == ["revoked", "saved"]
+
+        seeker.BatchSize = 10
+        assert seeker.recur() is False
+        assert [cue["kin"] for cue in cues] == ["revoked", "saved"]
+
+
+def test_agent_doze(helpers):
+    with helpers.openKeria() as (agency, agent, app, client):
+        assert agent.idleTock is None
+        agent.idleTock = 5.0
+
+        doist = doing.Doist(limit=1.0, tock=0.03125, real=True)
+        # Keep the deeds, the agent exits once they are garbage collected
+        deeds = doist.enter(doers=[agent])
+        assert len(deeds) == 1
+
+        escrower = next(
+            doer for doer in agent.dozers if isinstance(doer, agenting.Escrower)
+        )
+        delegator = next(
+            doer for doer in agent.dozers if isinstance(doer, agenting.Delegator)
+        )
+        assert escrower.idle is True
+        assert delegator.idle is True
+
+        agent.recur(tyme=0.0)
+        retymes = {doer: retyme for _, retyme, doer in agent.deeds}
+        assert retymes[escrower] == 5.0
+        assert retymes[delegator] == 5.0
+
+        # Queuing work wakes the agent so its dozing doers run on the next cycle
+        agent.anchors.append(dict(pre=agent.caid))
+        assert agent.woken is True
+        assert delegator.idle is False
+
+        agent.rouse(tyme=1.0)
+        assert agent.woken is False
+        retymes = {doer: retyme for _, retyme, doer in agent.deeds}
+        assert retymes[escrower] == 1.0
+        assert retymes[delegator] == 1.0
+
+        # Putting back cues that can not be handled yet does not wake the agent again
+        seeker = next(
+            doer for doer in agent.doers if isinstance(doer, agenting.SeekerDoer)
+        )
+        agent.verifier.cues.append(dict(kin="other"))
+        agent.woken = False
+        assert seeker.idle is False
+        assert seeker.recur() is False
+        assert len(agent.verifier.cues) == 1
+        assert agent.woken is False
+        # and leaves the doer idle until a new cue is queued
+        assert seeker.idle is True
+        agent.verifier.cues.append(dict(kin="other"))
+        assert seeker.idle is False
+        assert seeker.recur() is False
+        assert seeker.idle is True
+
+        # Writes that may have escrowed events make a dozing Escrower run after its tock
+        agent.doze(tyme=2.0)
+        retymes = {doer: retyme for _, retyme, doer in agent.deeds}
+        assert retymes[escrower] == 7.0
+        agent.hby.db.names.pin(keys=("", "doze"), val=agent.caid)
+        assert escrower.idle is False
+        agent.doze(tyme=3.0)
+        retymes = {doer: retyme for _, retyme, doer in agent.deeds}
+        assert retymes[escrower] == 3.0 + escrower.tock
+        escrower.recur(tyme=3.0)
+        assert escrower.idle is True
+
+        # Loading an agent from the agency wakes it too
+        agency.get(agent.caid)
+        assert agent.woken is True
+
 
 def test_submitter(seeder, helpers):
     with (
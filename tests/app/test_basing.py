@@ -7,13 +7,15 @@ Testing the database classes
 """
 
 import random
+import types
 
 import pytest
 from keri.app import habbing, signing
-from keri.core import parsing
+from keri.core import coring, parsing
 from keri.peer import exchanging
 from keri.vc import protocoling
 
+from keria.core import keeping, longrunning
 from keria.db import basing
 
 QVI_SAID = "EFgnk_c08WmZGgv9_mpldibRuqFMTQN-rAgtD-TCOwbs"
@@ -74,7 +76,7 @@ def test_seeker(helpers, seeder, mockHelpingNowUTC):
         ]
 
         # Test that the index tables were correctly created
-        assert len(seeker.indexes) == 29
+        assert len(seeker.indexes) == 34
 
         indexes = seeker.generateIndexes(LE_SAID)
 
@@ -112,7 +114,7 @@ def test_seeker(helpers, seeder, mockHelpingNowUTC):
         ]
 
         # Assure that no new index tables needed to be created
-        assert len(seeker.indexes) == 29
+        assert len(seeker.indexes) == 34
 
         # Test with a bad credential SAID
         with pytest.raises(ValueError):
@@ -148,6 +150,64 @@ def test_seeker(helpers, seeder, mockHelpingNowUTC):
         saids = seeker.find({"-a-LEI": {"$eq": "OKB9487U4IDOG92KVVFN"}})
         assert list(saids) == ["EJJzx89f1sTNdOPGHRx3e7ukcFW0F4nq9o7e8taLoNXt"]
 
+        # TEL status is indexed, alone and with schema and issuee
+        assert seeker.count({"-status": "issued"}) == 50
+        assert seeker.count({"-status": "revoked"}) == 0
+        # Virtual fields are not in the credential, their index tells whether they exist
+        assert seeker.count({"-status": {"$exists": True}}) == 50
+        assert seeker.count({"-status": {"$exists": False}}) == 0
+        assert list(seeker.find({"-status": {"$exists": False}})) == []
+        assert seeker.count({"-s": QVI_SAID, "-status": {"$exists": False}}) == 0
+        assert seeker.count({"-e-n": {"$exists": False}}) == 50
+        assert seeker.count({"-s": QVI_SAID, "-status": "issued"}) == 50
+        assert (
+            seeker.count({"-a-i": issueeHab.pre, "-s": QVI_SAID, "-status": "issued"})
+            == 50
+        )
+        assert (
+            seeker.count({"-a-LEI": "OKB9487U4IDOG92KVVFN", "-status": "issued"}) == 1
+        )
+        assert seeker.updateStatus([qvisaid]) == 0
+
+        # Edges are indexed in both directions
+        first, second, third = [said for said in seeker.find({}).limit(3)]
+        batch = basing.IndexBatch(seeker)
+        for said, node in ((first, second), (second, third)):
+            batch.add(basing.EDGE_FIELD.qb64, node, coring.Saider(qb64=said))
+            batch.add(basing.EDGES_INDEX, said, coring.Saider(qb64=node))
+        batch.write()
+
+        assert seeker.chain(first) == [(second, 1)]
+        assert seeker.chain(first, depth=3) == [(second, 1), (third, 2)]
+        assert seeker.chain(third, depth=2, reverse=True) == [(second, 1), (first, 2)]
+        assert list(seeker.find({"-e-n": second})) == [first]
+
+        # A credential with two edges has two entries in the edge index but is found once
+        batch = basing.IndexBatch(seeker)
+        batch.add(basing.EDGE_FIELD.qb64, third, coring.Saider(qb64=first))
+        batch.add(basing.EDGES_INDEX, first, coring.Saider(qb64=third))
+        batch.write()
+        assert seeker.count({"-e-n": {"$exists": True}}) == 2
+        assert seeker.count({"-e-n": {"$in": [second, third]}}) == 2
+        assert sorted(seeker.find({"-e-n": {"$in": [second, third]}})) == sorted(
+            [first, second]
+        )
+        assert list(seeker.find({"-e-n": {"$exists": True}}).limit(1)) in (
+            [first],
+            [second],
+        )
+        assert seeker.count({"-s": QVI_SAID, "-e-n": {"$exists": True}}) == 2
+        assert seeker.count({"-e-n": {"$exists": False}}) == 48
+        assert list(basing.Cursor.members(iter([(1, first), (2, first)]), {first})) == [
+            (1, first)
+        ]
+
+        creder = types.SimpleNamespace(
+            edge=dict(d="E", qvi=dict(n=first, s=QVI_SAID), other="x")
+        )
+        assert basing.nodes(creder) == [first]
+        assert basing.nodes(types.SimpleNamespace(edge=None)) == []
+
         saids = seeker.find({}).sort(["-a-LEI"]).limit(5)
         assert list(saids) == [
             "EAzc9zFLaK22zbrKDGIgKtrpDBNKWKvl8B0FKYAo19z_",
@@ -166,6 +226,125 @@ def test_seeker(helpers, seeder, mockHelpingNowUTC):
             "EF7vDsfikOf_rEX2Lc_LFQoQSSxJxUr1Xkxlj9XeMu_l",
         ]
 
+        # Continuation tokens resume where the previous page ended
+        cur = seeker.find({}).sort(["-a-LEI"]).limit(10)
+        assert len(list(cur)) == 10
+        saids = seeker.find({}).sort(["-a-LEI"]).limit(5).after(cur.token)
+        assert list(saids) == list(seeker.find({}).sort(["-a-LEI"]).skip(10).limit(5))
+
+        pages = []
+        token = None
+        while True:
+            cur = seeker.find({}, limit=20, after=token)
+            pages.extend(cur)
+            if (token := cur.token) is None:
+                break
+        assert len(pages) == 50
+        assert pages == list(seeker.find({}).limit(50))
+
+        cur = seeker.find({"-i": issuerHab.pre}).limit(30)
+        saids = list(cur) + list(seeker.find({"-i": issuerHab.pre}, after=cur.token))
+        assert saids == list(seeker.find({"-i": issuerHab.pre}).limit(50))
+
+        cur = seeker.find({"-a-LEI": {"$begins": "Q"}})
+        assert len(list(cur)) == 3
+        assert cur.token is None
+
+        with pytest.raises(ValueError):
+            list(seeker.find({}, after="not a token"))
+
+        # Index statistics are kept as credentials are indexed
+        lei = seeker.indexes["5AACAA-a-LEI"]
+        assert seeker.stats.get("5AACAA-a-LEI", lei) == basing.IndexStats(
+            keys=50, entries=50
+        )
+        assert seeker.stats.count(lei) == basing.IndexStats(keys=50, entries=50)
+        issuers = seeker.indexes["5AABAA-i"]
+        assert seeker.stats.get("5AABAA-i", issuers) == basing.IndexStats(
+            keys=1, entries=50
+        )
+
+        # The planner drives the query from the more selective LEI prefix
+        cur = seeker.find({"-i": {"$eq": issuerHab.pre}, "-a-LEI": {"$begins": "Q"}})
+        assert list(cur) == [
+            "EJCprDNJIkHzDkMm__X1zcz65YBMtaBhjugIPXN0R2iC",
+            "EGO5Dh4ADbgDSTj-0X3452s7R6iAjFG2amY1qXlhqVxe",
+            "EOMWNhcIYPuXkh-LDZTc--sVL-cOINWNINfqO9kUhnBG",
+        ]
+        assert cur.driver == "5AACAA-a-LEI"
+
+        # Totals are only inferred from pages that end the results
+        cur = seeker.find({}, limit=25)
+        assert len(list(cur)) == 25
+        assert cur.total() is None
+        assert cur.total(count=True) == 50
+        cur = seeker.find({}, skip=40, limit=25)
+        assert len(list(cur)) == 10
+        assert cur.total() == 50
+        cur = seeker.find({}, skip=60, limit=25)
+        assert list(cur) == []
+        assert cur.total() is None
+        assert cur.total(count=True) == 50
+
+        # Counts without loading credentials
+        assert seeker.count({}) == 50
+        assert seeker.count({"-i": issuerHab.pre}) == 50
+        assert seeker.count({"-i": issuerHab.pre, "-s": QVI_SAID}) == 50
+        assert seeker.count({"-a-LEI": {"$begins": "Q"}}) == 3
+        assert seeker.count({"-i": issuerHab.pre, "-a-LEI": {"$begins": "Q"}}) == 3
+        assert seeker.count({"-d": "EAzc9zFLaK22zbrKDGIgKtrpDBNKWKvl8B0FKYAo19z_"}) == 1
+
+        # Rebuilding the indexes from scratch gives the same results
+        ordered = list(seeker.find({}).sort(["-a-LEI"]).limit(50))
+        saids = [said for (said,), _ in seeker.reger.saved.getItemIter()]
+        seeker.reset()
+        assert list(seeker.find({"-i": issuerHab.pre})) == []
+        loaded = seeker.batch(saids).load()
+        assert loaded == sum(basing.entries(idx) for idx in seeker.indexes.values())
+        assert list(seeker.find({}).sort(["-a-LEI"]).limit(50)) == ordered
+
+        # Every SAID at a shared key is loaded and counted
+        assert len(list(seeker.find({"-i": issuerHab.pre}, limit=50))) == 50
+        assert seeker.count({"-i": issuerHab.pre}) == 50
+        assert seeker.stats.get("5AABAA-i", issuers) == basing.IndexStats(
+            keys=1, entries=50
+        )
+        assert seeker.stats.count(issuers) == basing.IndexStats(keys=1, entries=50)
+        assert seeker.stats.get("5AACAA-a-LEI", lei) == basing.IndexStats(
+            keys=50, entries=50
+        )
+
+        # A compound index recorded with a single path is rebuilt over both of its fields
+        subkey = "5AABAA-i.5AABAA-s"
+        record = basing.IndexRecord(subkey=subkey, paths=[subkey])
+        seeker.dynIdx.pin(keys=(subkey,), val=record)
+        assert seeker.createIndex(subkey) is False
+        assert seeker.rebuild([subkey]) == 50
+        assert seeker.dynIdx.get(keys=(subkey,)).paths == ["5AABAA-i", "5AABAA-s"]
+        assert seeker.createIndex(subkey) is True
+        assert seeker.count({"-i": issuerHab.pre, "-s": QVI_SAID}) == 50
+
+        # Range, $in, $ne and $exists read the LEI index
+        saids = seeker.find({"-a-LEI": {"$gte": "Q", "$lt": "R"}})
+        assert list(saids) == [
+            "EJCprDNJIkHzDkMm__X1zcz65YBMtaBhjugIPXN0R2iC",
+            "EGO5Dh4ADbgDSTj-0X3452s7R6iAjFG2amY1qXlhqVxe",
+            "EOMWNhcIYPuXkh-LDZTc--sVL-cOINWNINfqO9kUhnBG",
+        ]
+
+        saids = seeker.find({"-a-LEI": {"$in": ["OKB9487U4IDOG92KVVFN", "NOTANLEI"]}})
+        assert list(saids) == ["EJJzx89f1sTNdOPGHRx3e7ukcFW0F4nq9o7e8taLoNXt"]
+
+        saids = list(seeker.find({"-a-LEI": {"$ne": "OKB9487U4IDOG92KVVFN"}}, limit=50))
+        assert len(saids) == 49
+        assert "EJJzx89f1sTNdOPGHRx3e7ukcFW0F4nq9o7e8taLoNXt" not in saids
+
+        saids = seeker.find({"-a-LEI": {"$exists": True}}, limit=50)
+        assert len(list(saids)) == 50
+
+        saids = seeker.find({"-a-LEI": {"$exists": False}})
+        assert list(saids) == []
+
         saids = seeker.find({"-a-LEI": {"$begins": "Q"}}).sort(["-a-LEI"])
         assert list(saids) == [
             "EJCprDNJIkHzDkMm__X1zcz65YBMtaBhjugIPXN0R2iC",
@@ -194,6 +373,22 @@ def test_seeker(helpers, seeder, mockHelpingNowUTC):
 
         # Unindex the last one in prep for deletion from DB
         seeker.unindex(qvisaid)
+        assert seeker.stats.get("5AACAA-a-LEI", lei) == basing.IndexStats(
+            keys=49, entries=49
+        )
+        assert seeker.stats.get("5AABAA-i", issuers).entries == 49
+
+        # Statistics missing when an index is written are counted before the write, not after
+        seeker.stats.stats.rem(keys=("5AACAA-a-LEI",))
+        seeker.index(qvisaid)
+        assert seeker.stats.get("5AACAA-a-LEI", lei) == basing.IndexStats(
+            keys=50, entries=50
+        )
+        seeker.stats.stats.rem(keys=("5AACAA-a-LEI",))
+        seeker.unindex(qvisaid)
+        assert seeker.stats.get("5AACAA-a-LEI", lei) == basing.IndexStats(
+            keys=49, entries=49
+        )
 
         saids = seeker.find({"-a-LEI": "ZUQA6QTJDNYPF3DLP9NH"})
         assert list(saids) == []
@@ -219,6 +414,117 @@ def test_seeker(helpers, seeder, mockHelpingNowUTC):
         ).sort(["-a-LEI"])
         assert list(saids) == []
 
+        # A range only walks the keys of the type of its bounds
+        batch = basing.IndexBatch(seeker)
+        saider = coring.Saider(qb64=qvisaid)
+        batch.add("5AACAA-a-LEI", basing.encodeNumber(5), saider)
+        batch.add("5AACAA-a-LEI", "!5", saider)
+        batch.write()
+        assert list(seeker.find({"-a-LEI": {"$lte": 10}})) == [qvisaid]
+        assert list(seeker.find({"-a-LEI": {"$gt": 1}})) == [qvisaid]
+        op = basing.Range("-a-LEI", lt="1")
+        keys = [key for (key, _), _ in op.index(seeker.indexes[op.name])]
+        assert keys == [b"!5", b"0TRMLT6GMYU4KR2LF53X"]
+        cur = seeker.find({"-a-LEI": {"$lt": "1"}}, limit=1)
+        assert list(cur) == [qvisaid]
+        page = seeker.find({"-a-LEI": {"$lt": "1"}}, limit=1, after=cur.token)
+        assert len(saids := list(page)) == 1
+        assert saids != [qvisaid]
+
+
+def test_operators():
+    nums = [-1e10, -3.5, -1, 0, 0.25, 1, 2, 10, 1e10]
+    keys = [basing.encodeNumber(num) for num in nums]
+    assert keys == sorted(keys)
+    assert basing.indexValue(10) == basing.encodeNumber(10.0)
+    assert basing.indexValue("abc") == "abc"
+
+    ops = basing.operators(
+        {
+            "-a-n": {"$gt": 1, "$lte": 10},
+            "-a-s": {"$in": ["a", "b"]},
+            "-a-t": {"$ne": "x"},
+            "-a-u": {"$exists": False},
+        }
+    )
+    assert [type(op) for op in ops] == [
+        basing.Range,
+        basing.In,
+        basing.Ne,
+        basing.Exists,
+    ]
+    assert all(op({"a": {"n": 10, "s": "b", "t": "y"}}) for op in ops)
+
+    assert not ops[0]({"a": {"n": 1}})
+    assert not ops[0]({"a": {"n": "5"}})
+    assert not ops[0]({"a": {}})
+    assert not ops[1]({"a": {"s": "c"}})
+    assert not ops[2]({"a": {"t": "x"}})
+    assert not ops[2]({"a": {}})
+    assert not ops[3]({"a": {"u": 1}})
+    assert ops[3].indexed is False
+
+    match = basing.predicate(ops)
+    assert match({"a": {"n": 10, "s": "b", "t": "y"}})
+    assert not match({"a": {"n": 10, "s": "b", "t": "y", "u": 1}})
+    assert not match({"a": {"s": "b", "t": "y"}})
+    assert not match({"a": "n"})
+
+    begins = basing.operators({"-a-LEI": {"$begins": "Q"}, "-e-0-n": "E"})
+    assert basing.predicate(begins)({"a": {"LEI": "QX"}, "e": {"d": {"n": "E"}}})
+    assert not basing.predicate(begins)({"a": {"LEI": 5}, "e": {"d": {"n": "E"}}})
+    assert not basing.predicate(begins)({"a": {"LEI": "QX"}, "e": {}})
+
+    with pytest.raises(ValueError):
+        basing.operators({"-a-n": {"$gt": 1, "$gte": 2}})
+    with pytest.raises(ValueError):
+        basing.operators({"-a-s": {"$in": "a"}})
+    with pytest.raises(ValueError):
+        basing.operators({"-a-u": {"$exists": "yes"}})
+
+
+def test_cursor_members():
+    rows = iter([((b"a", b"1"), "1"), ((b"b", b"2"), "2"), ((b"c", b"3"), "3")])
+    assert list(basing.Cursor.members(rows, {"2"})) == [((b"b", b"2"), "2")]
+    # The walk stopped at the last candidate
+    assert next(rows) == ((b"c", b"3"), "3")
+
+    assert list(basing.Cursor.members(iter([((b"a", b"1"), "1")]), set())) == []
+
+
+def test_cache_budget():
+    sads = dict(a=dict(d="a"), b=dict(d="b"), c=dict(d="c"))
+    reger = types.SimpleNamespace(
+        creds=types.SimpleNamespace(
+            get=lambda keys: types.SimpleNamespace(sad=sads[keys[0]])
+        )
+    )
+    budget = basing.CacheBudget(size=2)
+    first = basing.CredentialCache(reger=reger, budget=budget)
+    second = basing.CredentialCache(reger=reger, budget=budget)
+
+    first.sad("a")
+    second.sad("b")
+    first.sad("a")  # used again so b of the other agent is the oldest
+    second.sad("c")
+    assert list(first.sads) == ["a"]
+    assert list(second.sads) == ["c"]
+    assert len(budget) == 2
+
+    # A cache over its own size returns what it drops to the budget
+    small = basing.CredentialCache(reger=reger, size=1, budget=budget)
+    small.sad("b")
+    assert list(first.sads) == []
+    small.sad("c")
+    assert list(small.sads) == ["c"]
+    assert list(second.sads) == ["c"]
+    assert len(budget) == 2
+
+    second.forget("c")
+    assert len(budget) == 1
+    small.clear()
+    assert len(budget) == 0
+
 
 def randomLEI():
     values = "0123456789ABCDEFGHIJKLNMOPQRTUVXZY"
@@ -298,33 +604,22 @@ def test_exnseeker(helpers, seeder, mockHelpingNowUTC):
 
         seeker = basing.ExnSeeker(db=issuerHby.db, reopen=True, temp=True)
 
+        # Only the single field indexes are kept until a query needs another
         assert list(seeker.indexes.keys()) == [
             "5AABAA-r",
-            "5AABAA-r.5AABAA-i",
-            "5AABAA-r.4AAB-a-i",
-            "5AABAA-r.4AABA-dt",
-            "5AABAA-r.6AADAAA-e-acdc-s",
             "5AABAA-i",
-            "5AABAA-i.5AABAA-r",
-            "5AABAA-i.4AAB-a-i",
-            "5AABAA-i.4AABA-dt",
-            "5AABAA-i.6AADAAA-e-acdc-s",
             "4AAB-a-i",
-            "4AAB-a-i.5AABAA-r",
-            "4AAB-a-i.5AABAA-i",
-            "4AAB-a-i.4AABA-dt",
-            "4AAB-a-i.6AADAAA-e-acdc-s",
             "4AABA-dt",
-            "4AABA-dt.5AABAA-r",
-            "4AABA-dt.5AABAA-i",
-            "4AABA-dt.4AAB-a-i",
-            "4AABA-dt.6AADAAA-e-acdc-s",
             "6AADAAA-e-acdc-s",
-            "6AADAAA-e-acdc-s.5AABAA-r",
-            "6AADAAA-e-acdc-s.5AABAA-i",
-            "6AADAAA-e-acdc-s.4AAB-a-i",
-            "6AADAAA-e-acdc-s.4AABA-dt",
         ]
+        assert len(seeker.available) == 25
+        assert seeker.demand("5AABAA-d") is False
+
+        configured = basing.ExnSeeker(
+            db=issuerHby.db, reopen=True, temp=True, indexes=["-r", "-i.-dt"]
+        )
+        assert list(configured.indexes.keys()) == ["5AABAA-r", "5AABAA-i.4AABA-dt"]
+        configured.close()
 
         issuer.createRegistry(issuerHab.pre, name="issuer")
         issuer.issueQVIvLEI("issuer", issuerHab, issueeHab.pre, "LEYGGPUNV3LJY3KPFDHP")
@@ -355,6 +650,7 @@ def test_exnseeker(helpers, seeder, mockHelpingNowUTC):
             {"-i": {"$eq": issuerHab.pre}, "-a-i": {"$eq": issueeHab.pre}}
         )
         assert list(saids) == [apply.said]
+        assert "5AABAA-i.4AAB-a-i" in seeker.indexes
 
         saids = seeker.find(
             {"-i": {"$eq": issueeHab.pre}, "-a-i": {"$eq": issuerHab.pre}}
@@ -387,3 +683,59 @@ def test_exnseeker(helpers, seeder, mockHelpingNowUTC):
 
         saids = seeker.find({"-a-i": {"$eq": issueeHab.pre}})
         assert list(saids) == [grant.said, apply.said]
+
+        # The index built by the earlier query is kept up to date
+        saids = seeker.find(
+            {"-i": {"$eq": issuerHab.pre}, "-a-i": {"$eq": issueeHab.pre}}
+        )
+        assert list(saids) == [grant.said, apply.said]
+
+        # Unindexed fields scan the exn table
+        saids = seeker.find({"-a-m": "Here's a credential"})
+        assert list(saids) == [grant.said]
+
+        cur = seeker.find({"-i": {"$eq": issuerHab.pre}}).limit(1)
+        assert list(cur) == [grant.said]
+        saids = seeker.find({"-i": {"$eq": issuerHab.pre}}, after=cur.token)
+        assert list(saids) == [apply.said]
+
+
+def test_shared_db():
+    kdb = basing.AgentBaser(name="shared", reopen=True, temp=True)
+    assert kdb.opened
+
+    seeker = basing.Seeker(db=None, reger=None, reopen=True, temp=True, shared=kdb)
+    exnseeker = basing.ExnSeeker(db=None, reopen=True, temp=True, shared=kdb)
+    opr = longrunning.Operator(name="shared", temp=True, shared=kdb)
+    rb = keeping.RemoteKeeper(name="shared", reopen=True, temp=True, shared=kdb)
+
+    for store in (seeker, exnseeker, opr, rb):
+        assert store.env is kdb.env
+        assert store.path == kdb.path
+
+    # Every store can open as many sub databases as in an environment of its own
+    stores = (seeker, exnseeker, opr, rb)
+    assert sum(store.MaxNamedDBs for store in stores) < kdb.MaxNamedDBs
+
+    # Index names of both seekers overlap so each is kept in its own namespace
+    assert basing.ISSUER_FIELD.qb64 in seeker.indexes
+    assert basing.ISSUER_FIELD.qb64 in exnseeker.indexes
+    with kdb.env.begin() as txn:
+        names = [bytes(key).decode() for key, _ in txn.cursor()]
+    assert f"seek:{basing.ISSUER_FIELD.qb64}" in names
+    assert f"exn:{basing.ISSUER_FIELD.qb64}" in names
+    assert "ops:opr." in names
+    assert "rks:gbls." in names
+
+    rb.gbls.pin(keys=("aeid",), val="ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose")
+
+    # Closing a sharing store leaves the shared environment open for the others
+    rb.close()
+    assert rb.env is None
+    assert kdb.env is not None
+    assert seeker.schIdx.cnt(keys=("missing",)) == 0
+
+    rb = keeping.RemoteKeeper(name="shared", reopen=True, temp=True, shared=kdb)
+    assert rb.gbls.get(keys=("aeid",)) == "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose"
+
+    kdb.close()
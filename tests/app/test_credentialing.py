@@ -441,6 +441,10 @@ def test_credentialing_ends(helpers, seeder):
         app.add_route("/identifiers/{name}/credentials", credEnd)
         credResEnd = credentialing.CredentialQueryCollectionEnd()
         app.add_route("/credentials/query", credResEnd)
+        countEnd = credentialing.CredentialQueryCountEnd()
+        app.add_route("/credentials/query/count", countEnd)
+        chainEnd = credentialing.CredentialChainEnd()
+        app.add_route("/credentials/{said}/chains", chainEnd)
         credResEnd = credentialing.CredentialResourceEnd()
         app.add_route("/credentials/{said}", credResEnd)
         credentialRegistryResEnd = credentialing.CredentialRegistryResourceEnd()
@@ -501,6 +505,7 @@ def test_credentialing_ends(helpers, seeder):
         res = client.simulate_post("/credentials/query")
         assert res.status_code == 200
         assert len(res.json) == 5
+        assert res.headers["Content-Range"] == "credentials 0-4/5"
 
         body = json.dumps({"filter": {"-i": issuee}}).encode("utf-8")
         res = client.simulate_post("/credentials/query", body=body)
@@ -522,6 +527,43 @@ def test_credentialing_ends(helpers, seeder):
         assert res.status_code == 200
         assert len(res.json) == 3
 
+        res = client.simulate_post("/credentials/query/count", body=body)
+        assert res.status_code == 200
+        assert res.json == {"count": 3}
+
+        body = json.dumps(
+            {"filter": {"-s": {"$eq": issuer.LE}}, "explain": True, "count": True}
+        ).encode("utf-8")
+        res = client.simulate_post("/credentials/query", body=body)
+        assert res.status_code == 200
+        assert res.json["plan"] == "indexSearch"
+        assert res.json["indexes"] == ["5AABAA-s"]
+        assert res.json["scanned"] == 3
+        assert res.json["loaded"] == 0
+        assert res.json["returned"] == 3
+        assert res.json["count"] == 3
+        assert len(res.json["results"]) == 3
+        assert set(res.json["timings"]) == {"plan", "fetch", "count"}
+
+        assert len(agent.queryLog.entries) == 0
+        agent.queryLog.threshold = 0
+        body = json.dumps({"filter": {"-i": hab.pre}}).encode("utf-8")
+        res = client.simulate_post("/credentials/query", body=body)
+        assert res.status_code == 200
+        (entry,) = agent.queryLog.entries
+        assert entry["kind"] == "credentials"
+        assert entry["filter"] == {"-i": hab.pre}
+        assert entry["explain"]["returned"] == 5
+        assert "load" in entry["explain"]["timings"]
+        agent.queryLog.threshold = None
+
+        res = client.simulate_post("/credentials/query/count")
+        assert res.json == {"count": 5}
+
+        body = json.dumps({"filter": {"-s": {"$in": issuer.LE}}}).encode("utf-8")
+        res = client.simulate_post("/credentials/query/count", body=body)
+        assert res.status_code == 400
+
         body = json.dumps({"filter": {"-s": {"$eq": issuer.QVI}}}).encode("utf-8")
         res = client.simulate_post("/credentials/query", body=body)
         assert res.status_code == 200
@@ -536,6 +578,13 @@ def test_credentialing_ends(helpers, seeder):
         res = client.simulate_post("/credentials/query", body=body)
         assert res.status_code == 200
         assert len(res.json) == 2
+        assert res.headers["Content-Range"] == "credentials 0-1/*"
+
+        body = json.dumps({"limit": 2, "count": True}).encode("utf-8")
+        res = client.simulate_post("/credentials/query", body=body)
+        assert res.status_code == 200
+        assert len(res.json) == 2
+        assert res.headers["Content-Range"] == "credentials 0-1/5"
 
         body = json.dumps({"limit": 4, "skip": 0}).encode("utf-8")
         res = client.simulate_post("/credentials/query", body=body)
@@ -546,6 +595,7 @@ def test_credentialing_ends(helpers, seeder):
         res = client.simulate_post("/credentials/query", body=body)
         assert res.status_code == 200
         assert len(res.json) == 1
+        assert res.headers["Content-Range"] == "credentials 4-4/5"
 
         body = json.dumps({"limit": 4, "skip": 0, "sort": ["-i"]}).encode("utf-8")
         res = client.simulate_post("/credentials/query", body=body)
@@ -557,6 +607,16 @@ def test_credentialing_ends(helpers, seeder):
         assert res.headers["content-type"] == "application/json"
         assert res.json["sad"]["d"] == saids[0]
 
+        res = client.simulate_get(f"/credentials/{saids[0]}/chains?depth=2")
+        assert res.status_code == 200
+        assert res.json == []
+        res = client.simulate_get(f"/credentials/{saids[0]}/chains?depth=0")
+        assert res.status_code == 400
+        res = client.simulate_get(
+            "/credentials/EDqDrGuzned0HOKFTLqd7m7O7WGE5zYIOHrlCq4EnWxy/chains"
+        )
+        assert res.status_code == 404
+
         res = client.simulate_get(
             "/credentials/EDqDrGuzned0HOKFTLqd7m7O7WGE5zYIOHrlCq4EnWxy"
         )
@@ -764,6 +824,8 @@ def test_revoke_credential(helpers, seeder):
             doist.recur(deeds=deeds)
 
         assert agent.credentialer.complete(creder.said) is True
+        # Indexing does not clone the credential, its first listing does
+        assert agent.seeker.summaries.get(keys=(creder.said,)) is None
 
         res = client.simulate_post("/credentials/query")
         assert res.status_code == 200
@@ -777,6 +839,15 @@ def test_revoke_credential(helpers, seeder):
         assert res.json[0]["sad"]["d"] == creder.said
         assert res.json[0]["status"]["s"] == "0"
 
+        # The second query is served the clone cached by the first
+        cache = agent.seeker.cache
+        assert cache.metrics()["hits"] == 1
+        assert cache.metrics()["clones"] == 1
+
+        # Listing the credential saved its summary row
+        row = json.loads(agent.seeker.summaries.get(keys=(creder.said,)))
+        assert row["cred"]["status"]["s"] == "0"
+
         regser = eventing.revoke(
             vcdig=creder.said, regk=registry["regk"], dig=regser.said, dt=dt
         )
@@ -846,7 +917,17 @@ def test_revoke_credential(helpers, seeder):
         while not agent.registrar.complete(creder.said, sn=1):
             doist.recur(deeds=deeds)
 
+        # The Registrar cues the revocation so the Seeker moves the credential's status entries
+        doist.recur(deeds=deeds)
+        assert list(agent.seeker.find({"-status": "revoked"})) == [creder.said]
+        assert list(agent.seeker.find({"-status": "issued"})) == []
+
+        # The revocation TEL event makes the cached clone stale
+        misses = cache.misses
         res = client.simulate_post("/credentials/query")
+        assert cache.misses == misses + 1
+        row = json.loads(agent.seeker.summaries.get(keys=(creder.said,)))
+        assert row["cred"]["status"]["s"] == "1"
         assert res.status_code == 200
         assert len(res.json) == 1
         assert res.json[0]["sad"]["d"] == creder.said
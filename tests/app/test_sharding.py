@@ -0,0 +1,145 @@
+# -*- encoding: utf-8 -*-
+"""
+KERIA
+keria.app.sharding module
+
+Testing the sharded agency router
+"""
+
+import io
+import json
+import threading
+import time
+from wsgiref.simple_server import make_server
+
+from keri.core import coring
+
+from keria.app import agenting, sharding
+from keria.db import basing
+
+
+def test_shard_of():
+    caid = "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose"
+    assert sharding.shardOf(caid, 4) == sharding.shardOf(caid, 4)
+    assert 0 <= sharding.shardOf(caid, 4) < 4
+    assert sharding.shardOf(caid, 1) == 0
+
+    caids = [coring.Diger(ser=f"{i}".encode()).qb64 for i in range(400)]
+    counts = [0] * 4
+    for caid in caids:
+        counts[sharding.shardOf(caid, 4)] += 1
+    assert all(count > 50 for count in counts)
+
+
+def test_shard_config():
+    config = agenting.KERIAServerConfig(
+        keyPath="key.pem", certPath="cert.pem", caFilePath="ca.pem", shards=3
+    )
+    shard = sharding.shardConfig(config, 2)
+    assert (shard.adminPort, shard.httpPort, shard.bootPort) == (4907, 4908, 4909)
+    assert shard.shards == 0
+    assert shard.keyPath is None
+    assert shard.host == "127.0.0.1"
+    assert config.adminPort == 3901
+    assert config.host == ""
+
+    config = agenting.KERIAServerConfig(httpPort=None, shards=2)
+    assert sharding.shardConfig(config, 0).httpPort is None
+
+
+def test_resolvers():
+    caid = "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose"
+    assert sharding.adminResolver({"HTTP_SIGNIFY_RESOURCE": caid}, b"") == caid
+    assert sharding.adminResolver({}, b"") is None
+
+    body = json.dumps(dict(icp=dict(i=caid))).encode("utf-8")
+    assert sharding.bootResolver({"PATH_INFO": "/boot"}, body) == caid
+    assert sharding.bootResolver({"PATH_INFO": "/boot"}, b"not json") is None
+    assert sharding.bootResolver({"PATH_INFO": "/health"}, body) is None
+
+    adb = basing.AgencyBaser(name="TheAgency", reopen=True, temp=True)
+    agent = "EBtONOpwylm2krDPNyvfN8F1dlbAxpGcKBcY7WRzs3aq"
+    managed = "EIaGMMWJFPmtXznY1IIiKDIrg-vIyge6mBl2QV8dDjI3"
+    adb.agnt.pin(keys=(caid,), val=coring.Prefixer(qb64=agent))
+    adb.ctrl.pin(keys=(agent,), val=coring.Prefixer(qb64=caid))
+    adb.aids.pin(keys=(managed,), val=coring.Prefixer(qb64=caid))
+
+    resolve = sharding.ingressResolver(adb)
+    assert resolve({"HTTP_CESR_DESTINATION": managed}, b"") == caid
+    assert resolve({"HTTP_CESR_DESTINATION": agent}, b"") == caid
+    assert resolve({"PATH_INFO": f"/oobi/{managed}/witness"}, b"") == caid
+    assert resolve({"PATH_INFO": "/"}, b"") is None
+    adb.close()
+
+
+def test_router():
+    def app(environ, start_response):
+        if environ["PATH_INFO"] == "/events":
+            start_response("200 OK", [("Content-Type", "text/event-stream")])
+            return events()
+
+        body = environ["wsgi.input"].read(int(environ.get("CONTENT_LENGTH") or 0))
+        start_response("202 Accepted", [("Content-Type", "application/json")])
+        return [
+            json.dumps(
+                dict(
+                    path=environ["PATH_INFO"],
+                    query=environ["QUERY_STRING"],
+                    resource=environ.get("HTTP_SIGNIFY_RESOURCE"),
+                    body=body.decode("utf-8"),
+                )
+            ).encode("utf-8")
+        ]
+
+    def events():
+        yield b"retry: 5000\n\n"
+        time.sleep(0.5)
+        yield b": heartbeat\n\n"
+
+    server = make_server("127.0.0.1", 0, app)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    caid = "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose"
+    router = sharding.Router(
+        ports=[server.server_port, server.server_port],
+        resolve=sharding.adminResolver,
+    )
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "PATH_INFO": "/identifiers/aid1",
+        "QUERY_STRING": "type=test",
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": "2",
+        "HTTP_SIGNIFY_RESOURCE": caid,
+        "wsgi.input": io.BytesIO(b"{}"),
+    }
+    started = []
+    body = b"".join(
+        router(environ, lambda status, headers: started.append((status, headers)))
+    )
+    assert started[0][0] == "202 Accepted"
+    assert json.loads(body) == dict(
+        path="/identifiers/aid1", query="type=test", resource=caid, body="{}"
+    )
+
+    # Event streams are not cut off by the timeout of the router
+    router.timeout = 0.2
+    environ.update(
+        {"REQUEST_METHOD": "GET", "PATH_INFO": "/events", "CONTENT_LENGTH": ""}
+    )
+    body = b"".join(
+        router(environ, lambda status, headers: started.append((status, headers)))
+    )
+    assert body == b"retry: 5000\n\n: heartbeat\n\n"
+    started.pop()
+
+    server.shutdown()
+    server.server_close()
+
+    # Unreachable worker answers 503 with Retry-After
+    environ["wsgi.input"] = io.BytesIO(b"{}")
+    body = b"".join(
+        router(environ, lambda status, headers: started.append((status, headers)))
+    )
+    assert started[1][0] == "503 Service Unavailable"
+    assert ("Retry-After", "1") in started[1][1]
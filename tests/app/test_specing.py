@@ -46,7 +46,10 @@ def test_spec_resource(helpers):
         assert "/oobis/{alias}" in paths
         assert "/operations" in paths
         assert "/operations/{name}" in paths
+        assert "/operations/events" in paths
+        assert "/operations/status" in paths
         assert "/queries" in paths
+        assert "/queries/slow" in paths
         assert "/states" in paths
         assert "/config" in paths
 
@@ -55,5 +58,5 @@ def test_spec_resource(helpers):
         # Assert on the entire JSON to ensure we are getting all the docs
         assert (
             js
-            == '{"paths": {"/operations": {"get": {"summary": "Get list of long running operations", "parameters": [{"in": "query", "name": "type", "schema": {"type": "string"}, "required": false, "description": "filter list of long running operations by type"}], "responses": {"200": {"description": "list of long running operations", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/Operation"}}}}}}}}, "/oobis": {"post": {"summary": "Resolve OOBI and assign an alias for the remote identifier", "description": "Resolve OOBI URL or `rpy` message by process results of request and assign \'alias\' in contact data for resolved identifier", "tags": ["OOBIs"], "requestBody": {"required": true, "content": {"application/json": {"schema": {"description": "OOBI", "oneOf": [{"type": "object", "properties": {"oobialias": {"type": "string", "description": "alias to assign to the identifier resolved from this OOBI"}, "url": {"type": "string", "description": "URL OOBI"}, "rpy": {"type": "object", "description": "unsigned KERI `rpy` event message with endpoints"}}}]}}}}, "responses": {"202": {"description": "OOBI resolution to key state successful", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}}}}, "/states": {"get": {"summary": "Display key event log (KEL) for given identifier prefix", "description": "If provided qb64 identifier prefix is in Kevers, return the current state of the identifier along with the KEL and all associated signatures and receipts", "tags": ["Key Event Log"], "parameters": [{"in": "path", "name": "pre", "description": "qb64 identifier prefix of KEL to load", "schema": {"type": "string"}, "required": true}], "responses": {"200": {"description": "Key event log and key state of identifier", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/KeyStateRecord"}}}}}, "400": {"description": "Bad request, missing required fields"}, "404": {"description": "Identifier not found in Key event database"}}}}, "/events": {"get": {"summary": "Display key event log (KEL) for given identifier prefix", "description": "If provided qb64 identifier prefix is in Kevers, return the current state of the identifier along with the KEL and all associated signatures and receipts", "tags": ["Key Event Log"], "parameters": [{"in": "path", "name": "pre", "schema": {"type": "string"}, "required": true, "description": "qb64 identifier prefix of KEL to load"}], "responses": {"200": {"description": "Key event log and key state of identifier", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/KeyEventRecord"}}}}}, "404": {"description": "Identifier not found in Key event database"}}}}, "/queries": {"post": {"summary": "Display key event log (KEL) for given identifier prefix", "description": "If provided qb64 identifier prefix is in Kevers, return the current state of the identifier along with the KEL and all associated signatures and receipts", "tags": ["Query"], "requestBody": {"required": true, "content": {"application/json": {"schema": {"type": "object", "required": ["pre"], "properties": {"pre": {"type": "string", "description": "qb64 identifier prefix of KEL to load"}, "anchor": {"type": "string", "description": "Anchor"}, "sn": {"type": "string", "description": "Serial number"}}}}}}, "responses": {"200": {"description": "Key event log and key state of identifier", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "404": {"description": "Identifier not found in Key event database"}}}}, "/config": {"get": {"summary": "Retrieve agent configuration", "description": "Retrieve agent configuration (only necessary fields are exposed)", "tags": ["Config"], "responses": {"200": {"description": "Subset of configuration dict as JSON", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/AgentConfig"}}}}}}}, "/identifiers": {"get": {"summary": "Retrieve a list of identifiers associated with the agent.", "description": "This endpoint retrieves a list of identifiers associated with the agent. It supports pagination through the \'Range\' header.", "tags": ["Identifier"], "parameters": [{"in": "header", "name": "Range", "schema": {"type": "string"}, "required": false, "description": "The \'Range\' header is used for pagination. The default range is 0-9."}], "responses": {"200": {"description": "Successfully retrieved identifiers.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/Identifier"}}}}}, "206": {"description": "Successfully retrieved identifiers within the specified range."}}}, "options": {}, "post": {"summary": "Create an identifier.", "description": "This endpoint creates an identifier with the provided inception event, name, and signatures.", "tags": ["Identifier"], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"icp": {"type": "object", "description": "The inception event for the identifier."}, "name": {"type": "string", "description": "The name of the identifier."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures for the inception event."}, "group": {"type": "object", "description": "Multisig group information."}, "salty": {"type": "object", "description": "Salty parameters."}, "randy": {"type": "object", "description": "Randomly generated materials."}, "extern": {"type": "object", "description": "External parameters."}}}}}}, "responses": {"202": {"description": "Identifier creation is in progress. The response is a long running operation.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}}}}, "/challenges": {"get": {"summary": "Get random list of words for a 2 factor auth challenge", "description": "Get the list of identifiers associated with this agent", "tags": ["Challenge/Response"], "parameters": [{"in": "query", "name": "strength", "schema": {"type": "integer"}, "description": "cryptographic strength of word list", "required": false}], "responses": {"200": {"description": "An array of random words", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Challenge"}}}}}}}, "/contacts": {"get": {"summary": "Get list of contact information associated with remote identifiers", "description": "Get list of contact information associated with remote identifiers.  All information is metadata and kept in local storage only", "tags": ["Contacts"], "parameters": [{"in": "query", "name": "group", "schema": {"type": "string"}, "required": false, "description": "field name to group results by"}, {"in": "query", "name": "filter_field", "schema": {"type": "string"}, "description": "field name to search", "required": false}, {"in": "query", "name": "filter_value", "schema": {"type": "string"}, "description": "value to search for", "required": false}], "responses": {"200": {"description": "List of contact information for remote identifiers", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/Contact"}}}}}}}}, "/oobi": {"get": {"summary": "Retrieve OOBI resource.", "description": "This endpoint retrieves the OOBI resource based on the provided aid, role, and eid.", "tags": ["OOBI Resource"], "parameters": [{"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of OOBI."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The requested role for OOBI rpy message."}, {"in": "path", "name": "eid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of participant in role."}], "responses": {"200": {"description": "Successfully retrieved the OOBI resource."}, "400": {"description": "Bad request. This could be due to invalid or missing parameters."}, "404": {"description": "The requested OOBI resource was not found."}}}}, "/": {"post": {"summary": "Accept KERI events with attachment headers and parse", "description": "Accept KERI events with attachment headers and parse.", "tags": ["Events"], "requestBody": {"required": true, "content": {"application/json": {"schema": {"type": "object", "description": "KERI event message"}}}}, "responses": {"204": {"description": "KEL EXN, QRY, RPY event accepted."}}}, "put": {"summary": "Accept KERI events with attachment headers and parse", "description": "Accept KERI events with attachment headers and parse.", "tags": ["Events"], "requestBody": {"required": true, "content": {"application/json": {"schema": {"type": "object", "description": "KERI event message"}}}}, "responses": {"200": {"description": "Mailbox query response for server sent events"}, "204": {"description": "KEL or EXN event accepted."}}}}, "/notifications": {"get": {"summary": "Get list of notifications for the controller of the agent", "description": "Get list of notifications for the controller of the agent.  Notifications will be sorted by creation date/time", "parameters": [{"in": "header", "name": "Range", "schema": {"type": "string"}, "required": false, "description": "size of the result list.  Defaults to 25"}], "tags": ["Notifications"], "responses": {"200": {"description": "List of contact information for remote identifiers", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/Notification"}}}}}}}}, "/operations/{name}": {"delete": {"summary": "Remove a specific long running operation.", "description": "This endpoint removes a long running operation by its name.", "tags": ["Operation"], "parameters": [{"in": "path", "name": "name", "schema": {"type": "string"}, "required": true, "description": "The name of the long running operation to remove."}], "responses": {"204": {"description": "Successfully removed the long running operation."}, "404": {"description": "The requested long running operation was not found."}, "500": {"description": "Internal server error. This could be due to an issue with removing the operation."}}}, "get": {"summary": "Retrieve a specific long running operation.", "description": "This endpoint retrieves the status of a long running operation by its name.", "tags": ["Operation"], "parameters": [{"in": "path", "name": "name", "schema": {"type": "string"}, "required": true, "description": "The name of the long running operation to retrieve."}], "responses": {"200": {"description": "Successfully retrieved the status of the long running operation.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "404": {"description": "The requested long running operation was not found."}}}}, "/oobis/{alias}": {"get": {"summary": "Get OOBI for specific identifier", "description": "Generate OOBI for the identifier of the specified alias and role", "tags": ["OOBIs"], "parameters": [{"in": "path", "name": "alias", "schema": {"type": "string"}, "required": true, "description": "human readable alias for the identifier generate OOBI for"}, {"in": "query", "name": "role", "schema": {"type": "string"}, "required": true, "description": "role for which to generate OOBI"}], "responses": {"200": {"description": "An array of Identifier key state information", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/OOBI"}}}}}}}, "/agent/{caid}": {"get": {"summary": "Retrieve key state record of an agent by controller AID.", "description": "This endpoint retrieves the key state record for a given controller of an agent.", "tags": ["Agent"], "parameters": [{"in": "path", "name": "caid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of Controller."}], "responses": {"200": {"description": "Successfully retrieved the key state record.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/AgentResourceResult"}}}}, "400": {"description": "Bad request. This could be due to an invalid agent or controller configuration."}, "404": {"description": "The requested controller or agent was not found."}}}, "put": {"summary": "Update agent configuration by controller AID.", "description": "This endpoint updates the agent configuration based on the provided request parameters and body.", "tags": ["Agent"], "parameters": [{"in": "path", "name": "caid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of Controller."}], "requestBody": {"required": true, "content": {"application/json": {"schema": {"type": "object", "required": ["rot", "sigs", "sxlt", "kyes"], "properties": {"rot": {"type": "object", "description": "The rotation event."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures."}, "sxlt": {"type": "string", "description": "The salty parameters."}, "keys": {"type": "object", "description": "The keys."}}}}}}, "responses": {"204": {"description": "Successfully updated the agent configuration."}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested agent was not found."}, "500": {"description": "Internal server error. This could be due to an issue with updating the agent configuration."}}}}, "/identifiers/{name}": {"get": {"summary": "Retrieve an identifier.", "description": "This endpoint retrieves an identifier by its prefix or human-readable name.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "responses": {"200": {"description": "Successfully retrieved the identifier details.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Identifier"}}}}, "400": {"description": "Bad request. This could be due to a missing or invalid name parameter."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Process identifier events.", "description": "This endpoint handles the \'rot\' or \'ixn\' events of an identifier, or the request to resubmit the KEL, based on the provided request.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rot": {"type": "object", "description": "The rotation event details."}, "ixn": {"type": "object", "description": "The interaction event details."}, "submit": {"type": "object", "description": "The request to resubmit event details to witnesses."}}, "oneOf": [{"required": ["rot"]}, {"required": ["ixn"]}, {"required": ["submit"]}]}}}}, "responses": {"200": {"description": "Successfully processed the identifier\'s event.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}}}, "put": {"summary": "Rename an identifier.", "description": "This endpoint renames an identifier with the provided new name.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The current human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"name": {"type": "string", "description": "The new human-readable name for the identifier."}}, "required": ["name"]}}}}, "responses": {"200": {"description": "Successfully renamed the identifier and returns the updated information.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Identifier"}}}}, "400": {"description": "Bad request. This could be due to a missing or invalid name parameter."}, "404": {"description": "The requested identifier was not found."}}}}, "/endroles/{aid}": {"get": {"summary": "Retrieve end roles.", "description": "This endpoint retrieves the end roles associated with an identifier prefix or human-readable name. It can also filter the end roles based on a specific role.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The identifier (AID)."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The specific role to filter the end roles."}], "responses": {"200": {"description": "Successfully retrieved the end roles. The response body contains the end roles.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/EndRole"}}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Create an end role.", "description": "This endpoint creates an end role associated with a given identifier prefix or human-readable name.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "Not supported for POST. If provided, a 404 is returned."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rpy": {"type": "object", "description": "The reply object."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures."}}}}}}, "responses": {"202": {"description": "Accepted. The end role creation is in progress.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "Not found. The requested identifier was not found."}}}}, "/escrows/rpy": {"get": {"summary": "Retrieve reply escrows.", "description": "This endpoint retrieves the reply escrows and can filter the collection based on a specific route.", "tags": ["Reply Escrow"], "parameters": [{"in": "query", "name": "route", "schema": {"type": "string"}, "required": false, "description": "The specific route to filter the reply escrow collection."}], "responses": {"200": {"description": "Successfully retrieved the reply escrows.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/Rpy"}}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}}}}, "/challenges/{name}": {"post": {"summary": "Sign challenge message and forward to peer identifier", "description": "Sign a challenge word list received out of bands and send `exn` peer to peer message to recipient", "tags": ["Challenge/Response"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "Human readable alias or prefix for the identifier to create"}], "requestBody": {"required": true, "content": {"application/json": {"schema": {"description": "Challenge response", "properties": {"recipient": {"type": "string", "description": "human readable alias recipient identifier to send signed challenge to"}, "words": {"type": "array", "description": "challenge in form of word list", "items": {"type": "string"}}}}}}}, "responses": {"202": {"description": "Success submission of signed challenge/response"}}}}, "/challenges_verify/{source}": {"post": {"summary": "Sign challenge message and forward to peer identifier", "description": "Sign a challenge word list received out of bands and send `exn` peer to peer message to recipient", "tags": ["Challenge/Response"], "parameters": [{"in": "path", "name": "source", "schema": {"type": "string"}, "required": true, "description": "Human readable alias for the identifier to create"}], "requestBody": {"required": true, "content": {"application/json": {"schema": {"description": "Challenge response", "properties": {"recipient": {"type": "string", "description": "human readable alias recipient identifier to send signed challenge to"}, "words": {"type": "array", "description": "challenge in form of word list", "items": {"type": "string"}}}}}}}, "responses": {"202": {"description": "Success submission of signed challenge/response", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}}}, "put": {"summary": "Mark challenge response exn message as signed", "description": "Mark challenge response exn message as signed", "tags": ["Challenge/Response"], "parameters": [{"in": "path", "name": "source", "schema": {"type": "string"}, "required": true, "description": "Human readable alias for the identifier to create"}], "requestBody": {"required": true, "content": {"application/json": {"schema": {"description": "Challenge response", "properties": {"aid": {"type": "string", "description": "aid of signer of accepted challenge response"}, "said": {"type": "array", "description": "SAID of challenge message signed", "items": {"type": "string"}}}}}}}, "responses": {"202": {"description": "Success submission of signed challenge/response"}}}}, "/contacts/{prefix}": {"delete": {"summary": "Delete contact information associated with remote identifier", "description": "Delete contact information associated with remote identifier", "tags": ["Contacts"], "parameters": [{"in": "path", "name": "prefix", "schema": {"type": "string"}, "required": true, "description": "qb64 identifier prefix of contact to delete"}], "responses": {"202": {"description": "Contact information successfully deleted for prefix"}, "404": {"description": "No contact information found for prefix"}}}, "get": {"summary": "Get contact information associated with single remote identifier", "description": "Get contact information associated with single remote identifier.  All information is meta-data and kept in local storage only", "tags": ["Contacts"], "parameters": [{"in": "path", "name": "prefix", "schema": {"type": "string"}, "required": true, "description": "qb64 identifier prefix of contact to get"}], "responses": {"200": {"description": "Contact information successfully retrieved for prefix", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Contact"}}}}, "404": {"description": "No contact information found for prefix"}}}, "post": {"summary": "Create new contact information for an identifier", "description": "Creates new information for an identifier, overwriting all existing information for that identifier", "tags": ["Contacts"], "parameters": [{"in": "path", "name": "prefix", "schema": {"type": "string"}, "required": true, "description": "qb64 identifier prefix to add contact metadata to"}], "requestBody": {"required": true, "content": {"application/json": {"schema": {"description": "Contact information", "type": "object"}}}}, "responses": {"200": {"description": "Updated contact information for remote identifier", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Contact"}}}}, "400": {"description": "Invalid identifier used to update contact information"}, "404": {"description": "Prefix not found in identifier contact information"}}}, "put": {"summary": "Update provided fields in contact information associated with remote identifier prefix", "description": "Update provided fields in contact information associated with remote identifier prefix.  All information is metadata and kept in local storage only", "tags": ["Contacts"], "parameters": [{"in": "path", "name": "prefix", "schema": {"type": "string"}, "required": true, "description": "qb64 identifier prefix to add contact metadata to"}], "requestBody": {"required": true, "content": {"application/json": {"schema": {"description": "Contact information", "type": "object"}}}}, "responses": {"200": {"description": "Updated contact information for remote identifier", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Contact"}}}}, "400": {"description": "Invalid identifier used to update contact information"}, "404": {"description": "Prefix not found in identifier contact information"}}}}, "/oobi/{aid}": {"get": {"summary": "Retrieve OOBI resource.", "description": "This endpoint retrieves the OOBI resource based on the provided aid, role, and eid.", "tags": ["OOBI Resource"], "parameters": [{"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of OOBI."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The requested role for OOBI rpy message."}, {"in": "path", "name": "eid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of participant in role."}], "responses": {"200": {"description": "Successfully retrieved the OOBI resource."}, "400": {"description": "Bad request. This could be due to invalid or missing parameters."}, "404": {"description": "The requested OOBI resource was not found."}}}}, "/notifications/{said}": {"delete": {"summary": "Delete notification", "description": "Delete notification", "tags": ["Notifications"], "parameters": [{"in": "path", "name": "said", "schema": {"type": "string"}, "required": true, "description": "qb64 said of note to delete"}], "responses": {"202": {"description": "Notification successfully deleted for prefix"}, "404": {"description": "No notification information found for prefix"}}}, "put": {"summary": "Mark notification as read", "description": "Mark notification as read", "tags": ["Notifications"], "parameters": [{"in": "path", "name": "said", "schema": {"type": "string"}, "required": true, "description": "qb64 said of note to mark as read"}], "responses": {"202": {"description": "Notification successfully marked as read for prefix"}, "404": {"description": "No notification information found for SAID"}}}}, "/identifiers/{name}/events": {"get": {"summary": "Retrieve an identifier.", "description": "This endpoint retrieves an identifier by its prefix or human-readable name.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "responses": {"200": {"description": "Successfully retrieved the identifier details.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Identifier"}}}}, "400": {"description": "Bad request. This could be due to a missing or invalid name parameter."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Process identifier events.", "description": "This endpoint handles the \'rot\' or \'ixn\' events of an identifier, or the request to resubmit the KEL, based on the provided request.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rot": {"type": "object", "description": "The rotation event details."}, "ixn": {"type": "object", "description": "The interaction event details."}, "submit": {"type": "object", "description": "The request to resubmit event details to witnesses."}}, "oneOf": [{"required": ["rot"]}, {"required": ["ixn"]}, {"required": ["submit"]}]}}}}, "responses": {"200": {"description": "Successfully processed the identifier\'s event.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}}}, "put": {"summary": "Rename an identifier.", "description": "This endpoint renames an identifier with the provided new name.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The current human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"name": {"type": "string", "description": "The new human-readable name for the identifier."}}, "required": ["name"]}}}}, "responses": {"200": {"description": "Successfully renamed the identifier and returns the updated information.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Identifier"}}}}, "400": {"description": "Bad request. This could be due to a missing or invalid name parameter."}, "404": {"description": "The requested identifier was not found."}}}}, "/identifiers/{name}/submit": {"get": {"summary": "Retrieve an identifier.", "description": "This endpoint retrieves an identifier by its prefix or human-readable name.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "responses": {"200": {"description": "Successfully retrieved the identifier details.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Identifier"}}}}, "400": {"description": "Bad request. This could be due to a missing or invalid name parameter."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Process identifier events.", "description": "This endpoint handles the \'rot\' or \'ixn\' events of an identifier, or the request to resubmit the KEL, based on the provided request.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rot": {"type": "object", "description": "The rotation event details."}, "ixn": {"type": "object", "description": "The interaction event details."}, "submit": {"type": "object", "description": "The request to resubmit event details to witnesses."}}, "oneOf": [{"required": ["rot"]}, {"required": ["ixn"]}, {"required": ["submit"]}]}}}}, "responses": {"200": {"description": "Successfully processed the identifier\'s event.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}}}, "put": {"summary": "Rename an identifier.", "description": "This endpoint renames an identifier with the provided new name.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The current human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"name": {"type": "string", "description": "The new human-readable name for the identifier."}}, "required": ["name"]}}}}, "responses": {"200": {"description": "Successfully renamed the identifier and returns the updated information.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Identifier"}}}}, "400": {"description": "Bad request. This could be due to a missing or invalid name parameter."}, "404": {"description": "The requested identifier was not found."}}}}, "/identifiers/{name}/oobis": {"get": {"summary": "Fetch OOBI URLs of an identifier.", "description": "This endpoint fetches the OOBI URLs for a specific role associated with an identifier.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "query", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The role for which to fetch the OOBI URLs. Can be a witness, controller, agent, or mailbox."}], "responses": {"200": {"description": "Successfully fetched the OOBI URLs. The response body contains the OOBI URLs.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/OOBI"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested identifier was not found."}}}}, "/identifiers/{name}/endroles": {"get": {"summary": "Retrieve end roles.", "description": "This endpoint retrieves the end roles associated with an identifier prefix or human-readable name. It can also filter the end roles based on a specific role.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The identifier (AID)."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The specific role to filter the end roles."}], "responses": {"200": {"description": "Successfully retrieved the end roles. The response body contains the end roles.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/EndRole"}}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Create an end role.", "description": "This endpoint creates an end role associated with a given identifier prefix or human-readable name.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "Not supported for POST. If provided, a 404 is returned."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rpy": {"type": "object", "description": "The reply object."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures."}}}}}}, "responses": {"202": {"description": "Accepted. The end role creation is in progress.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "Not found. The requested identifier was not found."}}}}, "/identifiers/{name}/locschemes": {"post": {"summary": "Authorises a new location scheme.", "description": "This endpoint authorises a new location scheme (endpoint) for a particular endpoint identifier.", "tags": ["Loc Scheme"], "parameters": [{"in": "path", "name": "name", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rpy": {"type": "object", "description": "The reply object."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures."}}}}}}, "responses": {"202": {"description": "Accepted. The loc scheme authorisation is in progress.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "Not found. The requested identifier was not found."}}}}, "/identifiers/{name}/members": {"get": {"summary": "Fetch group member information.", "description": "This endpoint retrieves the signing and rotation members for a specific group associated with an identifier.", "tags": ["Group Member"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "responses": {"200": {"description": "Successfully fetched the group member information.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/GroupMember"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested identifier was not found."}}}}, "/identifiers/{name}/delegation": {"post": {}}, "/endroles/{aid}/{role}": {"get": {"summary": "Retrieve end roles.", "description": "This endpoint retrieves the end roles associated with an identifier prefix or human-readable name. It can also filter the end roles based on a specific role.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The identifier (AID)."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The specific role to filter the end roles."}], "responses": {"200": {"description": "Successfully retrieved the end roles. The response body contains the end roles.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/EndRole"}}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Create an end role.", "description": "This endpoint creates an end role associated with a given identifier prefix or human-readable name.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "Not supported for POST. If provided, a 404 is returned."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rpy": {"type": "object", "description": "The reply object."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures."}}}}}}, "responses": {"202": {"description": "Accepted. The end role creation is in progress.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "Not found. The requested identifier was not found."}}}}, "/contacts/{prefix}/img": {"get": {"summary": "Get contact image for identifer prefix", "description": "Get contact image for identifer prefix", "tags": ["Contacts"], "parameters": [{"in": "path", "name": "prefix", "schema": {"type": "string"}, "required": true, "description": "qb64 identifier prefix of contact image to get"}], "responses": {"200": {"description": "Contact information successfully retrieved for prefix", "content": {"image/jpg": {"schema": {"description": "Image", "type": "binary"}}}}, "404": {"description": "No contact information found for prefix"}}}, "post": {"summary": "Uploads an image to associate with identifier.", "description": "Uploads an image to associate with identifier.", "tags": ["Contacts"], "parameters": [{"in": "path", "name": "prefix", "schema": {"type": "string"}, "description": "identifier prefix to associate image to", "required": true}], "requestBody": {"required": true, "content": {"image/jpg": {"schema": {"type": "string", "format": "binary"}}, "image/png": {"schema": {"type": "string", "format": "binary"}}}}, "responses": {"200": {"description": "Image successfully uploaded"}}}}, "/oobi/{aid}/{role}": {"get": {"summary": "Retrieve OOBI resource.", "description": "This endpoint retrieves the OOBI resource based on the provided aid, role, and eid.", "tags": ["OOBI Resource"], "parameters": [{"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of OOBI."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The requested role for OOBI rpy message."}, {"in": "path", "name": "eid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of participant in role."}], "responses": {"200": {"description": "Successfully retrieved the OOBI resource."}, "400": {"description": "Bad request. This could be due to invalid or missing parameters."}, "404": {"description": "The requested OOBI resource was not found."}}}}, "/identifiers/{name}/endroles/{role}": {"get": {"summary": "Retrieve end roles.", "description": "This endpoint retrieves the end roles associated with an identifier prefix or human-readable name. It can also filter the end roles based on a specific role.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The identifier (AID)."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The specific role to filter the end roles."}], "responses": {"200": {"description": "Successfully retrieved the end roles. The response body contains the end roles.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/EndRole"}}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Create an end role.", "description": "This endpoint creates an end role associated with a given identifier prefix or human-readable name.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "Not supported for POST. If provided, a 404 is returned."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rpy": {"type": "object", "description": "The reply object."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures."}}}}}}, "responses": {"202": {"description": "Accepted. The end role creation is in progress.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "Not found. The requested identifier was not found."}}}}, "/oobi/{aid}/{role}/{eid}": {"get": {"summary": "Retrieve OOBI resource.", "description": "This endpoint retrieves the OOBI resource based on the provided aid, role, and eid.", "tags": ["OOBI Resource"], "parameters": [{"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of OOBI."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The requested role for OOBI rpy message."}, {"in": "path", "name": "eid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of participant in role."}], "responses": {"200": {"description": "Successfully retrieved the OOBI resource."}, "400": {"description": "Bad request. This could be due to invalid or missing parameters."}, "404": {"description": "The requested OOBI resource was not found."}}}}, "/identifiers/{name}/endroles/{role}/{eid}": {"delete": {}}}, "info": {"title": "KERIA Interactive Web Interface API", "version": "1.0.1"}, "openapi": "3.1.0", "components": {"schemas": {"ACDCAttributes": {"type": "object", "properties": {"dt": {"type": "string"}, "i": {"type": "string"}, "u": {"type": "string"}}, "additionalProperties": true}, "ACDC_V_1": {"oneOf": [{"type": "object", "properties": {"v": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "u": {"type": "string"}, "ri": {"type": "string"}, "e": {"type": "string"}, "r": {"type": "string"}, "a": {"$ref": "#/components/schemas/ACDCAttributes"}}, "additionalProperties": false, "required": ["d", "i", "s", "v"]}, {"type": "object", "properties": {"v": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "u": {"type": "string"}, "ri": {"type": "string"}, "e": {"type": "string"}, "r": {"type": "string"}, "A": {"anyOf": [{"type": "string"}, {"type": "array"}]}}, "additionalProperties": false, "required": ["d", "i", "s", "v"]}]}, "ACDC_V_2": {"oneOf": [{"type": "object", "properties": {"v": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "u": {"type": "string"}, "rd": {"type": "string"}, "e": {"type": "string"}, "r": {"type": "string"}, "a": {"$ref": "#/components/schemas/ACDCAttributes"}}, "additionalProperties": false, "required": ["d", "i", "s", "v"]}, {"type": "object", "properties": {"v": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "u": {"type": "string"}, "rd": {"type": "string"}, "e": {"type": "string"}, "r": {"type": "string"}, "A": {"anyOf": [{"type": "string"}, {"type": "array"}]}}, "additionalProperties": false, "required": ["d", "i", "s", "v"]}]}, "IssEvent": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"enum": ["iss", "bis"]}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "ri": {"type": "string"}, "dt": {"type": "string"}}, "required": ["d", "dt", "i", "ri", "s", "t", "v"]}, "Schema": {"type": "object", "properties": {"$id": {"type": "string"}, "$schema": {"type": "string"}, "title": {"type": "string"}, "description": {"type": "string"}, "type": {"type": "string"}, "credentialType": {"type": "string"}, "version": {"type": "string"}, "properties": {"type": "object", "additionalProperties": {}}, "additionalProperties": {"type": "boolean"}, "required": {"type": "array", "items": {"type": "string"}}}, "required": ["$id", "$schema", "additionalProperties", "credentialType", "description", "properties", "required", "title", "type", "version"]}, "Anchor": {"type": "object", "properties": {"pre": {"type": "string"}, "sn": {"type": "integer"}, "d": {"type": "string"}}, "required": ["d", "pre", "sn"]}, "Seal": {"type": "object", "properties": {"s": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}}, "required": ["d", "s"]}, "IXN_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "p": {"type": "string"}, "a": {}}, "required": ["a", "d", "i", "p", "s", "t", "v"]}, "IXN_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "p": {"type": "string"}, "a": {}}, "required": ["a", "d", "i", "p", "s", "t", "v"]}, "ICP_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "b": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "a": {}}, "required": ["a", "b", "bt", "c", "d", "i", "k", "kt", "n", "nt", "s", "t", "v"]}, "ICP_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "b": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "a": {}}, "required": ["a", "b", "bt", "c", "d", "i", "k", "kt", "n", "nt", "s", "t", "v"]}, "ROT_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "p": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "br": {"type": "array", "items": {"type": "string"}}, "ba": {"type": "array", "items": {"type": "string"}}, "a": {}}, "required": ["a", "ba", "br", "bt", "d", "i", "k", "kt", "n", "nt", "p", "s", "t", "v"]}, "ROT_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "p": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "br": {"type": "array", "items": {"type": "string"}}, "ba": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "a": {}}, "required": ["a", "ba", "br", "bt", "c", "d", "i", "k", "kt", "n", "nt", "p", "s", "t", "v"]}, "DIP_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "b": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "a": {}, "di": {"type": "string"}}, "required": ["a", "b", "bt", "c", "d", "di", "i", "k", "kt", "n", "nt", "s", "t", "v"]}, "DIP_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "b": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "a": {}, "di": {"type": "string"}}, "required": ["a", "b", "bt", "c", "d", "di", "i", "k", "kt", "n", "nt", "s", "t", "v"]}, "DRT_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "p": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "br": {"type": "array", "items": {"type": "string"}}, "ba": {"type": "array", "items": {"type": "string"}}, "a": {}}, "required": ["a", "ba", "br", "bt", "d", "i", "k", "kt", "n", "nt", "p", "s", "t", "v"]}, "DRT_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "p": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "br": {"type": "array", "items": {"type": "string"}}, "ba": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "a": {}}, "required": ["a", "ba", "br", "bt", "c", "d", "i", "k", "kt", "n", "nt", "p", "s", "t", "v"]}, "RPY_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "dt": {"type": "string"}, "r": {"type": "string"}, "a": {}}, "required": ["a", "d", "dt", "r", "t", "v"]}, "RPY_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "dt": {"type": "string"}, "r": {"type": "string"}, "a": {}}, "required": ["a", "d", "dt", "i", "r", "t", "v"]}, "VCP_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "ii": {"type": "string"}, "s": {"type": "string"}, "c": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "b": {"type": "array", "items": {"type": "string"}}, "n": {"type": "string"}}, "required": ["b", "bt", "c", "d", "i", "ii", "n", "s", "t", "v"]}, "EXN_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "rp": {"type": "string"}, "p": {"type": "string"}, "dt": {"type": "string"}, "r": {"type": "string"}, "q": {"type": "object", "additionalProperties": {}}, "a": {}, "e": {"type": "object", "additionalProperties": {}}}, "required": ["a", "d", "dt", "e", "i", "p", "q", "r", "rp", "t", "v"]}, "EXN_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "x": {"type": "string"}, "p": {"type": "string"}, "dt": {"type": "string"}, "r": {"type": "string"}, "q": {"type": "object", "additionalProperties": {}}, "a": {}}, "required": ["a", "d", "dt", "i", "p", "q", "r", "t", "v", "x"]}, "Credential": {"type": "object", "properties": {"sad": {"oneOf": [{"$ref": "#/components/schemas/ACDC_V_1"}, {"$ref": "#/components/schemas/ACDC_V_2"}]}, "atc": {"type": "string"}, "iss": {"$ref": "#/components/schemas/IssEvent"}, "issatc": {"type": "string"}, "pre": {"type": "string"}, "schema": {"$ref": "#/components/schemas/Schema"}, "chains": {"type": "array", "items": {"type": "object", "additionalProperties": {}}}, "status": {"$ref": "#/components/schemas/CredentialState"}, "anchor": {"$ref": "#/components/schemas/Anchor"}, "anc": {"oneOf": [{"$ref": "#/components/schemas/IXN_V_1"}, {"$ref": "#/components/schemas/IXN_V_2"}, {"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}, {"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}, {"$ref": "#/components/schemas/DIP_V_1"}, {"$ref": "#/components/schemas/DIP_V_2"}, {"$ref": "#/components/schemas/DRT_V_1"}, {"$ref": "#/components/schemas/DRT_V_2"}]}, "ancatc": {"type": "string"}}, "required": ["anc", "ancatc", "anchor", "atc", "chains", "iss", "issatc", "pre", "sad", "schema", "status"]}, "OperationStatus": {"type": "object", "properties": {"code": {"type": "integer"}, "message": {"type": "string"}, "details": {"type": ["object", "null"], "additionalProperties": {}}}, "required": ["code", "message"]}, "Operation": {"type": "object", "properties": {"name": {"type": "string"}, "error": {"$ref": "#/components/schemas/OperationStatus"}, "done": {"type": "boolean"}, "metadata": {"type": "object"}, "response": {"type": "object"}}, "required": ["name"]}, "EmptyDict": {"type": "object", "properties": {}}, "CredentialStateIssOrRev": {"type": "object", "properties": {"vn": {}, "i": {"type": "string"}, "s": {"type": "string"}, "d": {"type": "string"}, "ri": {"type": "string"}, "a": {"$ref": "#/components/schemas/Seal"}, "dt": {"type": "string"}, "et": {"enum": ["iss", "rev"]}, "ra": {"$ref": "#/components/schemas/EmptyDict"}}, "required": ["a", "d", "dt", "et", "i", "ra", "ri", "s", "vn"]}, "RaFields": {"type": "object", "properties": {"i": {"type": "string"}, "s": {"type": "string"}, "d": {"type": "string"}}, "required": ["d", "i", "s"]}, "CredentialStateBisOrBrv": {"type": "object", "properties": {"vn": {}, "i": {"type": "string"}, "s": {"type": "string"}, "d": {"type": "string"}, "ri": {"type": "string"}, "a": {"$ref": "#/components/schemas/Seal"}, "dt": {"type": "string"}, "et": {"enum": ["bis", "brv"]}, "ra": {"$ref": "#/components/schemas/RaFields"}}, "required": ["a", "d", "dt", "et", "i", "ra", "ri", "s", "vn"]}, "CredentialState": {"oneOf": [{"$ref": "#/components/schemas/CredentialStateIssOrRev"}, {"$ref": "#/components/schemas/CredentialStateBisOrBrv"}]}, "Registry": {"type": "object", "properties": {"name": {"type": "string"}, "regk": {"type": "string"}, "pre": {"type": "string"}, "state": {"$ref": "#/components/schemas/CredentialState"}}, "required": ["name", "pre", "regk", "state"]}, "StateEERecord": {"type": "object", "properties": {"s": {"type": "string", "default": "0"}, "d": {"type": "string", "default": ""}, "br": {"type": "array", "items": {}}, "ba": {"type": "array", "items": {}}}}, "KeyStateRecord": {"type": "object", "properties": {"vn": {"type": "array", "items": {"type": "integer"}}, "i": {"type": "string", "default": ""}, "s": {"type": "string", "default": "0"}, "p": {"type": "string", "default": ""}, "d": {"type": "string", "default": ""}, "f": {"type": "string", "default": "0"}, "dt": {"type": "string", "default": ""}, "et": {"type": "string", "default": ""}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string", "default": "0"}, "b": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "ee": {"$ref": "#/components/schemas/StateEERecord"}, "di": {"type": "string", "default": ""}}, "required": ["b", "c", "ee", "k", "n", "kt", "nt"]}, "Controller": {"type": "object", "properties": {"state": {"$ref": "#/components/schemas/KeyStateRecord"}, "ee": {"oneOf": [{"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}, {"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}, {"$ref": "#/components/schemas/DIP_V_1"}, {"$ref": "#/components/schemas/DIP_V_2"}, {"$ref": "#/components/schemas/DRT_V_1"}, {"$ref": "#/components/schemas/DRT_V_2"}]}}, "required": ["ee", "state"]}, "AgentResourceResult": {"type": "object", "properties": {"agent": {"$ref": "#/components/schemas/KeyStateRecord"}, "controller": {"$ref": "#/components/schemas/Controller"}, "pidx": {"type": "integer"}, "ridx": {"type": ["integer", "null"], "default": null}, "sxlt": {"type": ["string", "null"], "default": null}}, "required": ["agent", "controller", "pidx"]}, "SaltyState": {"type": "object", "properties": {"tier": {"$ref": "#/components/schemas/Tier"}, "sxlt": {"type": "string", "default": ""}, "pidx": {"type": "integer", "default": 0}, "kidx": {"type": "integer", "default": 0}, "stem": {"type": "string", "default": ""}, "dcode": {"type": "string", "default": ""}, "icodes": {"type": "array", "items": {"type": "string"}}, "ncodes": {"type": "array", "items": {"type": "string"}}, "transferable": {"type": "boolean", "default": false}}, "required": ["icodes", "ncodes", "tier"]}, "RandyKeyState": {"type": "object", "properties": {"prxs": {"type": "array", "items": {"type": "string"}}, "nxts": {"type": "array", "items": {"type": "string"}}}, "required": ["nxts", "prxs"]}, "HabState": {"type": "object", "properties": {"name": {"type": "string"}, "prefix": {"type": "string"}, "icp_dt": {"type": "string"}, "state": {"$ref": "#/components/schemas/KeyStateRecord"}, "transferable": {"type": ["boolean", "null"], "default": null}, "windexes": {"type": ["array", "null"], "default": null, "items": {"type": "string"}}}, "required": ["icp_dt", "name", "prefix", "state"]}, "GroupKeyState": {"type": "object", "properties": {"mhab": {"$ref": "#/components/schemas/Identifier"}, "keys": {"type": "array", "items": {"type": "string"}}, "ndigs": {"type": "array", "items": {"type": "string"}}}, "required": ["keys", "mhab", "ndigs"]}, "ExternState": {"type": "object", "properties": {"extern_type": {"type": "string"}, "pidx": {"type": "integer"}}, "required": ["extern_type", "pidx"], "additionalProperties": true}, "Identifier": {"type": "object", "properties": {"name": {"type": "string"}, "prefix": {"type": "string"}, "icp_dt": {"type": "string"}, "state": {"$ref": "#/components/schemas/KeyStateRecord"}, "transferable": {"type": ["boolean", "null"], "default": null}, "windexes": {"type": ["array", "null"], "default": null, "items": {"type": "string"}}}, "required": ["icp_dt", "name", "prefix", "state"], "oneOf": [{"required": ["salty"], "properties": {"salty": {"$ref": "#/components/schemas/SaltyState"}}}, {"required": ["randy"], "properties": {"randy": {"$ref": "#/components/schemas/RandyKeyState"}}}, {"required": ["group"], "properties": {"group": {"$ref": "#/components/schemas/GroupKeyState"}}}, {"required": ["extern"], "properties": {"extern": {"$ref": "#/components/schemas/ExternState"}}}]}, "Tier": {"type": "string", "enum": ["low", "med", "high"], "description": "Tier of key material"}, "OOBI": {"type": "object", "properties": {"role": {"type": "string", "enum": ["controller", "witness", "registrar", "watcher", "judge", "juror", "peer", "mailbox", "agent"]}, "oobis": {"type": "array", "items": {"type": "string"}}}, "required": ["oobis", "role"]}, "EndRole": {"type": "object", "properties": {"cid": {"type": "string"}, "role": {"type": "string"}, "eid": {"type": "string"}}, "required": ["cid", "eid", "role"]}, "Rpy": {"oneOf": [{"$ref": "#/components/schemas/RPY_V_1"}, {"$ref": "#/components/schemas/RPY_V_2"}]}, "Challenge": {"type": "object", "properties": {"words": {"type": "array", "items": {"type": "string"}}, "dt": {"type": "string"}, "said": {"type": "string"}, "authenticated": {"type": "boolean"}}, "required": ["words"]}, "MemberEnds": {"type": "object", "properties": {"agent": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "controller": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "witness": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "registrar": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "watcher": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "judge": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "juror": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "peer": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "mailbox": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}}}, "WellKnown": {"type": "object", "properties": {"url": {"type": "string"}, "dt": {"type": "string"}}, "required": ["dt", "url"]}, "Contact": {"type": "object", "properties": {"id": {"type": "string"}, "alias": {"type": "string"}, "oobi": {"type": "string"}, "ends": {"$ref": "#/components/schemas/MemberEnds"}, "challenges": {"type": "array", "items": {"$ref": "#/components/schemas/Challenge"}}, "wellKnowns": {"type": "array", "items": {"$ref": "#/components/schemas/WellKnown"}}}, "required": ["id"], "additionalProperties": true}, "AidRecord": {"type": "object", "properties": {"aid": {"type": "string"}, "ends": {"$ref": "#/components/schemas/MemberEnds"}}, "required": ["aid", "ends"]}, "GroupMember": {"type": "object", "properties": {"signing": {"type": "array", "items": {"$ref": "#/components/schemas/AidRecord"}}, "rotation": {"type": "array", "items": {"$ref": "#/components/schemas/AidRecord"}}}, "required": ["rotation", "signing"]}, "KeyEventRecord": {"type": "object", "properties": {"ked": {"oneOf": [{"$ref": "#/components/schemas/IXN_V_1"}, {"$ref": "#/components/schemas/IXN_V_2"}, {"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}, {"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}, {"$ref": "#/components/schemas/DIP_V_1"}, {"$ref": "#/components/schemas/DIP_V_2"}, {"$ref": "#/components/schemas/DRT_V_1"}, {"$ref": "#/components/schemas/DRT_V_2"}]}, "atc": {"type": "string"}}, "required": ["atc", "ked"]}, "AgentConfig": {"type": "object", "properties": {"iurls": {"type": "array", "items": {"type": "string"}}}}, "Exn": {"oneOf": [{"$ref": "#/components/schemas/EXN_V_1"}, {"$ref": "#/components/schemas/EXN_V_2"}]}, "Icp": {"oneOf": [{"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}]}, "Rot": {"oneOf": [{"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}]}, "Vcp": {"oneOf": [{"$ref": "#/components/schemas/VCP_V_1"}]}, "Iss": {"oneOf": [{"$ref": "#/components/schemas/ISS_V_1"}]}, "Ixn": {"oneOf": [{"$ref": "#/components/schemas/IXN_V_1"}, {"$ref": "#/components/schemas/IXN_V_2"}]}, "NotificationData": {"type": "object", "properties": {"r": {"type": "string"}, "d": {"type": "string"}, "m": {"type": "string"}}, "additionalProperties": true}, "Notification": {"type": "object", "properties": {"i": {"type": "string"}, "dt": {"type": "string"}, "r": {"type": "boolean"}, "a": {"$ref": "#/components/schemas/NotificationData"}}, "required": ["a", "dt", "i", "r"]}, "ExchangeResource": {"type": "object", "properties": {"exn": {"$ref": "#/components/schemas/Exn"}, "pathed": {"type": "object", "additionalProperties": {}}}, "required": ["exn", "pathed"]}, "MultisigInceptEmbeds": {"type": "object", "properties": {"icp": {"$ref": "#/components/schemas/Icp"}}, "required": ["icp"]}, "MultisigRotateEmbeds": {"type": "object", "properties": {"rot": {"$ref": "#/components/schemas/Rot"}}, "required": ["rot"]}, "MultisigInteractEmbeds": {"type": "object", "properties": {"ixn": {"$ref": "#/components/schemas/Ixn"}}, "required": ["ixn"]}, "MultisigRegistryInceptEmbeds": {"type": "object", "properties": {"vcp": {"$ref": "#/components/schemas/Vcp"}, "anc": {"oneOf": [{"$ref": "#/components/schemas/IXN_V_1"}, {"$ref": "#/components/schemas/IXN_V_2"}, {"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}, {"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}, {"$ref": "#/components/schemas/DIP_V_1"}, {"$ref": "#/components/schemas/DIP_V_2"}, {"$ref": "#/components/schemas/DRT_V_1"}, {"$ref": "#/components/schemas/DRT_V_2"}]}}, "required": ["anc", "vcp"]}, "ISS_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "ri": {"type": "string"}, "dt": {"type": "string"}}, "required": ["d", "dt", "i", "ri", "s", "t", "v"]}, "MultisigIssueEmbeds": {"type": "object", "properties": {"acdc": {"oneOf": [{"$ref": "#/components/schemas/ACDC_V_1"}, {"$ref": "#/components/schemas/ACDC_V_2"}]}, "iss": {"$ref": "#/components/schemas/Iss"}, "anc": {"oneOf": [{"$ref": "#/components/schemas/IXN_V_1"}, {"$ref": "#/components/schemas/IXN_V_2"}, {"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}, {"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}, {"$ref": "#/components/schemas/DIP_V_1"}, {"$ref": "#/components/schemas/DIP_V_2"}, {"$ref": "#/components/schemas/DRT_V_1"}, {"$ref": "#/components/schemas/DRT_V_2"}]}}, "required": ["acdc", "anc", "iss"]}, "REV_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "ri": {"type": "string"}, "p": {"type": "string"}, "dt": {"type": "string"}}, "required": ["d", "dt", "i", "p", "ri", "s", "t", "v"]}, "MultisigRevokeEmbeds": {"type": "object", "properties": {"rev": {"$ref": "#/components/schemas/REV_V_1"}, "anc": {"oneOf": [{"$ref": "#/components/schemas/IXN_V_1"}, {"$ref": "#/components/schemas/IXN_V_2"}, {"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}, {"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}, {"$ref": "#/components/schemas/DIP_V_1"}, {"$ref": "#/components/schemas/DIP_V_2"}, {"$ref": "#/components/schemas/DRT_V_1"}, {"$ref": "#/components/schemas/DRT_V_2"}]}}, "required": ["anc", "rev"]}, "MultisigRpyEmbeds": {"type": "object", "properties": {"rpy": {"$ref": "#/components/schemas/Rpy"}}, "required": ["rpy"]}, "MultisigExnEmbeds": {"type": "object", "properties": {"exn": {"$ref": "#/components/schemas/Exn"}}, "required": ["exn"]}, "ExnEmbeds": {"type": "object", "properties": {"d": {"type": "string"}}, "required": ["d"], "oneOf": [{"$ref": "#/components/schemas/MultisigInceptEmbeds"}, {"$ref": "#/components/schemas/MultisigRotateEmbeds"}, {"$ref": "#/components/schemas/MultisigInteractEmbeds"}, {"$ref": "#/components/schemas/MultisigRegistryInceptEmbeds"}, {"$ref": "#/components/schemas/MultisigIssueEmbeds"}, {"$ref": "#/components/schemas/MultisigRevokeEmbeds"}, {"$ref": "#/components/schemas/MultisigRpyEmbeds"}, {"$ref": "#/components/schemas/MultisigExnEmbeds"}]}, "ExnMultisig": {"type": "object", "properties": {"exn": {"$ref": "#/components/schemas/Exn"}, "paths": {"type": "object", "additionalProperties": {}}, "groupName": {"type": ["string", "null"], "default": null}, "memberName": {"type": ["string", "null"], "default": null}, "sender": {"type": ["string", "null"], "default": null}}, "required": ["exn", "paths"]}}}}'
+            == '{"paths": {"/operations": {"get": {"summary": "Get list of long running operations", "description": "List long running operations in the order they were started. Pages are selected with a Range header like operations=0-9 or resumed after the Continuation-Token of the previous page.", "parameters": [{"in": "query", "name": "type", "schema": {"type": "string"}, "required": false, "description": "filter list of long running operations by type"}, {"in": "query", "name": "pending", "schema": {"type": "boolean"}, "required": false, "description": "only list operations not yet done, finished operations are not checked again"}, {"in": "query", "name": "limit", "schema": {"type": "integer"}, "required": false, "description": "most operations to return"}, {"in": "query", "name": "after", "schema": {"type": "string"}, "required": false, "description": "Continuation-Token of the previous page to resume after"}, {"in": "header", "name": "Range", "schema": {"type": "string"}, "required": false, "description": "size of the result list (page)"}], "responses": {"200": {"description": "list of long running operations", "headers": {"Continuation-Token": {"schema": {"type": "string"}, "description": "Pass as `after` to get the next page, only present when the page is full."}}, "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/Operation"}}}}}, "206": {"description": "Range of the list of long running operations"}, "400": {"description": "Invalid continuation token"}}}}, "/oobis": {"post": {"summary": "Resolve OOBI and assign an alias for the remote identifier", "description": "Resolve OOBI URL or `rpy` message by process results of request and assign \'alias\' in contact data for resolved identifier", "tags": ["OOBIs"], "requestBody": {"required": true, "content": {"application/json": {"schema": {"description": "OOBI", "oneOf": [{"type": "object", "properties": {"oobialias": {"type": "string", "description": "alias to assign to the identifier resolved from this OOBI"}, "url": {"type": "string", "description": "URL OOBI"}, "rpy": {"type": "object", "description": "unsigned KERI `rpy` event message with endpoints"}}}]}}}}, "responses": {"202": {"description": "OOBI resolution to key state successful", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}}}}, "/states": {"get": {"summary": "Display key event log (KEL) for given identifier prefix", "description": "If provided qb64 identifier prefix is in Kevers, return the current state of the identifier along with the KEL and all associated signatures and receipts", "tags": ["Key Event Log"], "parameters": [{"in": "path", "name": "pre", "description": "qb64 identifier prefix of KEL to load", "schema": {"type": "string"}, "required": true}], "responses": {"200": {"description": "Key event log and key state of identifier", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/KeyStateRecord"}}}}}, "400": {"description": "Bad request, missing required fields"}, "404": {"description": "Identifier not found in Key event database"}}}}, "/events": {"get": {"summary": "Display key event log (KEL) for given identifier prefix", "description": "If provided qb64 identifier prefix is in Kevers, return the current state of the identifier along with the KEL and all associated signatures and receipts", "tags": ["Key Event Log"], "parameters": [{"in": "path", "name": "pre", "schema": {"type": "string"}, "required": true, "description": "qb64 identifier prefix of KEL to load"}], "responses": {"200": {"description": "Key event log and key state of identifier", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/KeyEventRecord"}}}}}, "404": {"description": "Identifier not found in Key event database"}}}}, "/queries": {"post": {"summary": "Display key event log (KEL) for given identifier prefix", "description": "If provided qb64 identifier prefix is in Kevers, return the current state of the identifier along with the KEL and all associated signatures and receipts", "tags": ["Query"], "requestBody": {"required": true, "content": {"application/json": {"schema": {"type": "object", "required": ["pre"], "properties": {"pre": {"type": "string", "description": "qb64 identifier prefix of KEL to load"}, "anchor": {"type": "string", "description": "Anchor"}, "sn": {"type": "string", "description": "Serial number"}}}}}}, "responses": {"200": {"description": "Key event log and key state of identifier", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "404": {"description": "Identifier not found in Key event database"}}}}, "/config": {"get": {"summary": "Retrieve agent configuration", "description": "Retrieve agent configuration (only necessary fields are exposed)", "tags": ["Config"], "responses": {"200": {"description": "Subset of configuration dict as JSON", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/AgentConfig"}}}}}}}, "/identifiers": {"get": {"summary": "Retrieve a list of identifiers associated with the agent.", "description": "This endpoint retrieves a list of identifiers associated with the agent. It supports pagination through the \'Range\' header.", "tags": ["Identifier"], "parameters": [{"in": "header", "name": "Range", "schema": {"type": "string"}, "required": false, "description": "The \'Range\' header is used for pagination. The default range is 0-9."}], "responses": {"200": {"description": "Successfully retrieved identifiers.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/Identifier"}}}}}, "206": {"description": "Successfully retrieved identifiers within the specified range."}}}, "options": {}, "post": {"summary": "Create an identifier.", "description": "This endpoint creates an identifier with the provided inception event, name, and signatures.", "tags": ["Identifier"], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"icp": {"type": "object", "description": "The inception event for the identifier."}, "name": {"type": "string", "description": "The name of the identifier."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures for the inception event."}, "group": {"type": "object", "description": "Multisig group information."}, "salty": {"type": "object", "description": "Salty parameters."}, "randy": {"type": "object", "description": "Randomly generated materials."}, "extern": {"type": "object", "description": "External parameters."}}}}}}, "responses": {"202": {"description": "Identifier creation is in progress. The response is a long running operation.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}}}}, "/challenges": {"get": {"summary": "Get random list of words for a 2 factor auth challenge", "description": "Get the list of identifiers associated with this agent", "tags": ["Challenge/Response"], "parameters": [{"in": "query", "name": "strength", "schema": {"type": "integer"}, "description": "cryptographic strength of word list", "required": false}], "responses": {"200": {"description": "An array of random words", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Challenge"}}}}}}}, "/contacts": {"get": {"summary": "Get list of contact information associated with remote identifiers", "description": "Get list of contact information associated with remote identifiers.  All information is metadata and kept in local storage only", "tags": ["Contacts"], "parameters": [{"in": "query", "name": "group", "schema": {"type": "string"}, "required": false, "description": "field name to group results by"}, {"in": "query", "name": "filter_field", "schema": {"type": "string"}, "description": "field name to search", "required": false}, {"in": "query", "name": "filter_value", "schema": {"type": "string"}, "description": "value to search for", "required": false}], "responses": {"200": {"description": "List of contact information for remote identifiers", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/Contact"}}}}}}}}, "/oobi": {"get": {"summary": "Retrieve OOBI resource.", "description": "This endpoint retrieves the OOBI resource based on the provided aid, role, and eid.", "tags": ["OOBI Resource"], "parameters": [{"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of OOBI."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The requested role for OOBI rpy message."}, {"in": "path", "name": "eid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of participant in role."}], "responses": {"200": {"description": "Successfully retrieved the OOBI resource."}, "400": {"description": "Bad request. This could be due to invalid or missing parameters."}, "404": {"description": "The requested OOBI resource was not found."}}}}, "/": {"post": {"summary": "Accept KERI events with attachment headers and parse", "description": "Accept KERI events with attachment headers and parse.", "tags": ["Events"], "requestBody": {"required": true, "content": {"application/json": {"schema": {"type": "object", "description": "KERI event message"}}}}, "responses": {"204": {"description": "KEL EXN, QRY, RPY event accepted."}}}, "put": {"summary": "Accept KERI events with attachment headers and parse", "description": "Accept KERI events with attachment headers and parse.", "tags": ["Events"], "requestBody": {"required": true, "content": {"application/json": {"schema": {"type": "object", "description": "KERI event message"}}}}, "responses": {"200": {"description": "Mailbox query response for server sent events"}, "204": {"description": "KEL or EXN event accepted."}}}}, "/notifications": {"get": {"summary": "Get list of notifications for the controller of the agent", "description": "Get list of notifications for the controller of the agent.  Notifications will be sorted by creation date/time", "parameters": [{"in": "header", "name": "Range", "schema": {"type": "string"}, "required": false, "description": "size of the result list.  Defaults to 25"}], "tags": ["Notifications"], "responses": {"200": {"description": "List of contact information for remote identifiers", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/Notification"}}}}}}}}, "/operations/events": {"get": {"summary": "Stream long running operations as they complete", "description": "Server-sent events stream with an operation event for each long running operation of the agent that completes while the stream is open.", "tags": ["Operation"], "parameters": [{"in": "query", "name": "timeout", "schema": {"type": "number"}, "required": false, "description": "seconds to keep the stream open, at most 300"}], "responses": {"200": {"description": "Stream of completed long running operations", "content": {"text/event-stream": {"schema": {"type": "string"}}}}}}}, "/operations/status": {"post": {"summary": "Retrieve the status of several long running operations.", "description": "Returns the status of each named long running operation in the order requested, operations that do not exist are returned done with a 404 error.", "tags": ["Operation"], "requestBody": {"required": true, "content": {"application/json": {"schema": {"type": "object", "properties": {"names": {"type": "array", "items": {"type": "string"}, "description": "Names of the long running operations, at most 100."}}}}}}, "responses": {"200": {"description": "Status of each long running operation.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/Operation"}}}}}, "400": {"description": "Missing or invalid list of operation names."}}}}, "/operations/{name}": {"delete": {"summary": "Remove a specific long running operation.", "description": "This endpoint removes a long running operation by its name.", "tags": ["Operation"], "parameters": [{"in": "path", "name": "name", "schema": {"type": "string"}, "required": true, "description": "The name of the long running operation to remove."}], "responses": {"204": {"description": "Successfully removed the long running operation."}, "404": {"description": "The requested long running operation was not found."}, "500": {"description": "Internal server error. This could be due to an issue with removing the operation."}}}, "get": {"summary": "Retrieve a specific long running operation.", "description": "This endpoint retrieves the status of a long running operation by its name.", "tags": ["Operation"], "parameters": [{"in": "path", "name": "name", "schema": {"type": "string"}, "required": true, "description": "The name of the long running operation to retrieve."}, {"in": "query", "name": "wait", "schema": {"type": "number"}, "required": false, "description": "seconds to wait for the operation to complete before answering, at most 30"}], "responses": {"200": {"description": "Successfully retrieved the status of the long running operation.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "404": {"description": "The requested long running operation was not found."}}}}, "/oobis/{alias}": {"get": {"summary": "Get OOBI for specific identifier", "description": "Generate OOBI for the identifier of the specified alias and role", "tags": ["OOBIs"], "parameters": [{"in": "path", "name": "alias", "schema": {"type": "string"}, "required": true, "description": "human readable alias for the identifier generate OOBI for"}, {"in": "query", "name": "role", "schema": {"type": "string"}, "required": true, "description": "role for which to generate OOBI"}], "responses": {"200": {"description": "An array of Identifier key state information", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/OOBI"}}}}}}}, "/queries/slow": {"get": {"summary": "List slow credential and exchange message queries", "description": "List the most recent queries of this agent that took longer than the slow query threshold, oldest first, with the plan each used and where its time went", "tags": ["Queries"], "responses": {"200": {"description": "Slow queries", "content": {"application/json": {"schema": {"type": "array", "items": {"type": "object"}}}}}}}}, "/agent/{caid}": {"get": {"summary": "Retrieve key state record of an agent by controller AID.", "description": "This endpoint retrieves the key state record for a given controller of an agent.", "tags": ["Agent"], "parameters": [{"in": "path", "name": "caid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of Controller."}], "responses": {"200": {"description": "Successfully retrieved the key state record.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/AgentResourceResult"}}}}, "400": {"description": "Bad request. This could be due to an invalid agent or controller configuration."}, "404": {"description": "The requested controller or agent was not found."}}}, "put": {"summary": "Update agent configuration by controller AID.", "description": "This endpoint updates the agent configuration based on the provided request parameters and body.", "tags": ["Agent"], "parameters": [{"in": "path", "name": "caid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of Controller."}], "requestBody": {"required": true, "content": {"application/json": {"schema": {"type": "object", "required": ["rot", "sigs", "sxlt", "kyes"], "properties": {"rot": {"type": "object", "description": "The rotation event."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures."}, "sxlt": {"type": "string", "description": "The salty parameters."}, "keys": {"type": "object", "description": "The keys."}}}}}}, "responses": {"204": {"description": "Successfully updated the agent configuration."}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested agent was not found."}, "500": {"description": "Internal server error. This could be due to an issue with updating the agent configuration."}}}}, "/identifiers/{name}": {"get": {"summary": "Retrieve an identifier.", "description": "This endpoint retrieves an identifier by its prefix or human-readable name.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "responses": {"200": {"description": "Successfully retrieved the identifier details.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Identifier"}}}}, "400": {"description": "Bad request. This could be due to a missing or invalid name parameter."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Process identifier events.", "description": "This endpoint handles the \'rot\' or \'ixn\' events of an identifier, or the request to resubmit the KEL, based on the provided request.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rot": {"type": "object", "description": "The rotation event details."}, "ixn": {"type": "object", "description": "The interaction event details."}, "submit": {"type": "object", "description": "The request to resubmit event details to witnesses."}}, "oneOf": [{"required": ["rot"]}, {"required": ["ixn"]}, {"required": ["submit"]}]}}}}, "responses": {"200": {"description": "Successfully processed the identifier\'s event.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}}}, "put": {"summary": "Rename an identifier.", "description": "This endpoint renames an identifier with the provided new name.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The current human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"name": {"type": "string", "description": "The new human-readable name for the identifier."}}, "required": ["name"]}}}}, "responses": {"200": {"description": "Successfully renamed the identifier and returns the updated information.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Identifier"}}}}, "400": {"description": "Bad request. This could be due to a missing or invalid name parameter."}, "404": {"description": "The requested identifier was not found."}}}}, "/endroles/{aid}": {"get": {"summary": "Retrieve end roles.", "description": "This endpoint retrieves the end roles associated with an identifier prefix or human-readable name. It can also filter the end roles based on a specific role.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The identifier (AID)."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The specific role to filter the end roles."}], "responses": {"200": {"description": "Successfully retrieved the end roles. The response body contains the end roles.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/EndRole"}}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Create an end role.", "description": "This endpoint creates an end role associated with a given identifier prefix or human-readable name.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "Not supported for POST. If provided, a 404 is returned."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rpy": {"type": "object", "description": "The reply object."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures."}}}}}}, "responses": {"202": {"description": "Accepted. The end role creation is in progress.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "Not found. The requested identifier was not found."}}}}, "/escrows/rpy": {"get": {"summary": "Retrieve reply escrows.", "description": "This endpoint retrieves the reply escrows and can filter the collection based on a specific route.", "tags": ["Reply Escrow"], "parameters": [{"in": "query", "name": "route", "schema": {"type": "string"}, "required": false, "description": "The specific route to filter the reply escrow collection."}], "responses": {"200": {"description": "Successfully retrieved the reply escrows.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/Rpy"}}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}}}}, "/challenges/{name}": {"post": {"summary": "Sign challenge message and forward to peer identifier", "description": "Sign a challenge word list received out of bands and send `exn` peer to peer message to recipient", "tags": ["Challenge/Response"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "Human readable alias or prefix for the identifier to create"}], "requestBody": {"required": true, "content": {"application/json": {"schema": {"description": "Challenge response", "properties": {"recipient": {"type": "string", "description": "human readable alias recipient identifier to send signed challenge to"}, "words": {"type": "array", "description": "challenge in form of word list", "items": {"type": "string"}}}}}}}, "responses": {"202": {"description": "Success submission of signed challenge/response"}}}}, "/challenges_verify/{source}": {"post": {"summary": "Sign challenge message and forward to peer identifier", "description": "Sign a challenge word list received out of bands and send `exn` peer to peer message to recipient", "tags": ["Challenge/Response"], "parameters": [{"in": "path", "name": "source", "schema": {"type": "string"}, "required": true, "description": "Human readable alias for the identifier to create"}], "requestBody": {"required": true, "content": {"application/json": {"schema": {"description": "Challenge response", "properties": {"recipient": {"type": "string", "description": "human readable alias recipient identifier to send signed challenge to"}, "words": {"type": "array", "description": "challenge in form of word list", "items": {"type": "string"}}}}}}}, "responses": {"202": {"description": "Success submission of signed challenge/response", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}}}, "put": {"summary": "Mark challenge response exn message as signed", "description": "Mark challenge response exn message as signed", "tags": ["Challenge/Response"], "parameters": [{"in": "path", "name": "source", "schema": {"type": "string"}, "required": true, "description": "Human readable alias for the identifier to create"}], "requestBody": {"required": true, "content": {"application/json": {"schema": {"description": "Challenge response", "properties": {"aid": {"type": "string", "description": "aid of signer of accepted challenge response"}, "said": {"type": "array", "description": "SAID of challenge message signed", "items": {"type": "string"}}}}}}}, "responses": {"202": {"description": "Success submission of signed challenge/response"}}}}, "/contacts/{prefix}": {"delete": {"summary": "Delete contact information associated with remote identifier", "description": "Delete contact information associated with remote identifier", "tags": ["Contacts"], "parameters": [{"in": "path", "name": "prefix", "schema": {"type": "string"}, "required": true, "description": "qb64 identifier prefix of contact to delete"}], "responses": {"202": {"description": "Contact information successfully deleted for prefix"}, "404": {"description": "No contact information found for prefix"}}}, "get": {"summary": "Get contact information associated with single remote identifier", "description": "Get contact information associated with single remote identifier.  All information is meta-data and kept in local storage only", "tags": ["Contacts"], "parameters": [{"in": "path", "name": "prefix", "schema": {"type": "string"}, "required": true, "description": "qb64 identifier prefix of contact to get"}], "responses": {"200": {"description": "Contact information successfully retrieved for prefix", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Contact"}}}}, "404": {"description": "No contact information found for prefix"}}}, "post": {"summary": "Create new contact information for an identifier", "description": "Creates new information for an identifier, overwriting all existing information for that identifier", "tags": ["Contacts"], "parameters": [{"in": "path", "name": "prefix", "schema": {"type": "string"}, "required": true, "description": "qb64 identifier prefix to add contact metadata to"}], "requestBody": {"required": true, "content": {"application/json": {"schema": {"description": "Contact information", "type": "object"}}}}, "responses": {"200": {"description": "Updated contact information for remote identifier", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Contact"}}}}, "400": {"description": "Invalid identifier used to update contact information"}, "404": {"description": "Prefix not found in identifier contact information"}}}, "put": {"summary": "Update provided fields in contact information associated with remote identifier prefix", "description": "Update provided fields in contact information associated with remote identifier prefix.  All information is metadata and kept in local storage only", "tags": ["Contacts"], "parameters": [{"in": "path", "name": "prefix", "schema": {"type": "string"}, "required": true, "description": "qb64 identifier prefix to add contact metadata to"}], "requestBody": {"required": true, "content": {"application/json": {"schema": {"description": "Contact information", "type": "object"}}}}, "responses": {"200": {"description": "Updated contact information for remote identifier", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Contact"}}}}, "400": {"description": "Invalid identifier used to update contact information"}, "404": {"description": "Prefix not found in identifier contact information"}}}}, "/oobi/{aid}": {"get": {"summary": "Retrieve OOBI resource.", "description": "This endpoint retrieves the OOBI resource based on the provided aid, role, and eid.", "tags": ["OOBI Resource"], "parameters": [{"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of OOBI."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The requested role for OOBI rpy message."}, {"in": "path", "name": "eid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of participant in role."}], "responses": {"200": {"description": "Successfully retrieved the OOBI resource."}, "400": {"description": "Bad request. This could be due to invalid or missing parameters."}, "404": {"description": "The requested OOBI resource was not found."}}}}, "/notifications/{said}": {"delete": {"summary": "Delete notification", "description": "Delete notification", "tags": ["Notifications"], "parameters": [{"in": "path", "name": "said", "schema": {"type": "string"}, "required": true, "description": "qb64 said of note to delete"}], "responses": {"202": {"description": "Notification successfully deleted for prefix"}, "404": {"description": "No notification information found for prefix"}}}, "put": {"summary": "Mark notification as read", "description": "Mark notification as read", "tags": ["Notifications"], "parameters": [{"in": "path", "name": "said", "schema": {"type": "string"}, "required": true, "description": "qb64 said of note to mark as read"}], "responses": {"202": {"description": "Notification successfully marked as read for prefix"}, "404": {"description": "No notification information found for SAID"}}}}, "/identifiers/{name}/events": {"get": {"summary": "Retrieve an identifier.", "description": "This endpoint retrieves an identifier by its prefix or human-readable name.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "responses": {"200": {"description": "Successfully retrieved the identifier details.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Identifier"}}}}, "400": {"description": "Bad request. This could be due to a missing or invalid name parameter."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Process identifier events.", "description": "This endpoint handles the \'rot\' or \'ixn\' events of an identifier, or the request to resubmit the KEL, based on the provided request.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rot": {"type": "object", "description": "The rotation event details."}, "ixn": {"type": "object", "description": "The interaction event details."}, "submit": {"type": "object", "description": "The request to resubmit event details to witnesses."}}, "oneOf": [{"required": ["rot"]}, {"required": ["ixn"]}, {"required": ["submit"]}]}}}}, "responses": {"200": {"description": "Successfully processed the identifier\'s event.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}}}, "put": {"summary": "Rename an identifier.", "description": "This endpoint renames an identifier with the provided new name.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The current human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"name": {"type": "string", "description": "The new human-readable name for the identifier."}}, "required": ["name"]}}}}, "responses": {"200": {"description": "Successfully renamed the identifier and returns the updated information.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Identifier"}}}}, "400": {"description": "Bad request. This could be due to a missing or invalid name parameter."}, "404": {"description": "The requested identifier was not found."}}}}, "/identifiers/{name}/submit": {"get": {"summary": "Retrieve an identifier.", "description": "This endpoint retrieves an identifier by its prefix or human-readable name.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "responses": {"200": {"description": "Successfully retrieved the identifier details.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Identifier"}}}}, "400": {"description": "Bad request. This could be due to a missing or invalid name parameter."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Process identifier events.", "description": "This endpoint handles the \'rot\' or \'ixn\' events of an identifier, or the request to resubmit the KEL, based on the provided request.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rot": {"type": "object", "description": "The rotation event details."}, "ixn": {"type": "object", "description": "The interaction event details."}, "submit": {"type": "object", "description": "The request to resubmit event details to witnesses."}}, "oneOf": [{"required": ["rot"]}, {"required": ["ixn"]}, {"required": ["submit"]}]}}}}, "responses": {"200": {"description": "Successfully processed the identifier\'s event.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}}}, "put": {"summary": "Rename an identifier.", "description": "This endpoint renames an identifier with the provided new name.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The current human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"name": {"type": "string", "description": "The new human-readable name for the identifier."}}, "required": ["name"]}}}}, "responses": {"200": {"description": "Successfully renamed the identifier and returns the updated information.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Identifier"}}}}, "400": {"description": "Bad request. This could be due to a missing or invalid name parameter."}, "404": {"description": "The requested identifier was not found."}}}}, "/identifiers/{name}/oobis": {"get": {"summary": "Fetch OOBI URLs of an identifier.", "description": "This endpoint fetches the OOBI URLs for a specific role associated with an identifier.", "tags": ["Identifier"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "query", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The role for which to fetch the OOBI URLs. Can be a witness, controller, agent, or mailbox."}], "responses": {"200": {"description": "Successfully fetched the OOBI URLs. The response body contains the OOBI URLs.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/OOBI"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested identifier was not found."}}}}, "/identifiers/{name}/endroles": {"get": {"summary": "Retrieve end roles.", "description": "This endpoint retrieves the end roles associated with an identifier prefix or human-readable name. It can also filter the end roles based on a specific role.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The identifier (AID)."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The specific role to filter the end roles."}], "responses": {"200": {"description": "Successfully retrieved the end roles. The response body contains the end roles.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/EndRole"}}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Create an end role.", "description": "This endpoint creates an end role associated with a given identifier prefix or human-readable name.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "Not supported for POST. If provided, a 404 is returned."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rpy": {"type": "object", "description": "The reply object."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures."}}}}}}, "responses": {"202": {"description": "Accepted. The end role creation is in progress.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "Not found. The requested identifier was not found."}}}}, "/identifiers/{name}/locschemes": {"post": {"summary": "Authorises a new location scheme.", "description": "This endpoint authorises a new location scheme (endpoint) for a particular endpoint identifier.", "tags": ["Loc Scheme"], "parameters": [{"in": "path", "name": "name", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rpy": {"type": "object", "description": "The reply object."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures."}}}}}}, "responses": {"202": {"description": "Accepted. The loc scheme authorisation is in progress.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "Not found. The requested identifier was not found."}}}}, "/identifiers/{name}/members": {"get": {"summary": "Fetch group member information.", "description": "This endpoint retrieves the signing and rotation members for a specific group associated with an identifier.", "tags": ["Group Member"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}], "responses": {"200": {"description": "Successfully fetched the group member information.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/GroupMember"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested identifier was not found."}}}}, "/identifiers/{name}/delegation": {"post": {}}, "/endroles/{aid}/{role}": {"get": {"summary": "Retrieve end roles.", "description": "This endpoint retrieves the end roles associated with an identifier prefix or human-readable name. It can also filter the end roles based on a specific role.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The identifier (AID)."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The specific role to filter the end roles."}], "responses": {"200": {"description": "Successfully retrieved the end roles. The response body contains the end roles.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/EndRole"}}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Create an end role.", "description": "This endpoint creates an end role associated with a given identifier prefix or human-readable name.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "Not supported for POST. If provided, a 404 is returned."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rpy": {"type": "object", "description": "The reply object."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures."}}}}}}, "responses": {"202": {"description": "Accepted. The end role creation is in progress.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "Not found. The requested identifier was not found."}}}}, "/contacts/{prefix}/img": {"get": {"summary": "Get contact image for identifer prefix", "description": "Get contact image for identifer prefix", "tags": ["Contacts"], "parameters": [{"in": "path", "name": "prefix", "schema": {"type": "string"}, "required": true, "description": "qb64 identifier prefix of contact image to get"}], "responses": {"200": {"description": "Contact information successfully retrieved for prefix", "content": {"image/jpg": {"schema": {"description": "Image", "type": "binary"}}}}, "404": {"description": "No contact information found for prefix"}}}, "post": {"summary": "Uploads an image to associate with identifier.", "description": "Uploads an image to associate with identifier.", "tags": ["Contacts"], "parameters": [{"in": "path", "name": "prefix", "schema": {"type": "string"}, "description": "identifier prefix to associate image to", "required": true}], "requestBody": {"required": true, "content": {"image/jpg": {"schema": {"type": "string", "format": "binary"}}, "image/png": {"schema": {"type": "string", "format": "binary"}}}}, "responses": {"200": {"description": "Image successfully uploaded"}}}}, "/oobi/{aid}/{role}": {"get": {"summary": "Retrieve OOBI resource.", "description": "This endpoint retrieves the OOBI resource based on the provided aid, role, and eid.", "tags": ["OOBI Resource"], "parameters": [{"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of OOBI."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The requested role for OOBI rpy message."}, {"in": "path", "name": "eid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of participant in role."}], "responses": {"200": {"description": "Successfully retrieved the OOBI resource."}, "400": {"description": "Bad request. This could be due to invalid or missing parameters."}, "404": {"description": "The requested OOBI resource was not found."}}}}, "/identifiers/{name}/endroles/{role}": {"get": {"summary": "Retrieve end roles.", "description": "This endpoint retrieves the end roles associated with an identifier prefix or human-readable name. It can also filter the end roles based on a specific role.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The identifier (AID)."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The specific role to filter the end roles."}], "responses": {"200": {"description": "Successfully retrieved the end roles. The response body contains the end roles.", "content": {"application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/EndRole"}}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "The requested identifier was not found."}}}, "post": {"summary": "Create an end role.", "description": "This endpoint creates an end role associated with a given identifier prefix or human-readable name.", "tags": ["End Role"], "parameters": [{"in": "path", "name": "name or prefix", "schema": {"type": "string"}, "required": true, "description": "The human-readable name of the identifier or its prefix."}, {"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "Not supported for POST. If provided, a 404 is returned."}], "requestBody": {"content": {"application/json": {"schema": {"type": "object", "properties": {"rpy": {"type": "object", "description": "The reply object."}, "sigs": {"type": "array", "items": {"type": "string"}, "description": "The signatures."}}}}}}, "responses": {"202": {"description": "Accepted. The end role creation is in progress.", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Operation"}}}}, "400": {"description": "Bad request. This could be due to missing or invalid parameters."}, "404": {"description": "Not found. The requested identifier was not found."}}}}, "/oobi/{aid}/{role}/{eid}": {"get": {"summary": "Retrieve OOBI resource.", "description": "This endpoint retrieves the OOBI resource based on the provided aid, role, and eid.", "tags": ["OOBI Resource"], "parameters": [{"in": "path", "name": "aid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of OOBI."}, {"in": "path", "name": "role", "schema": {"type": "string"}, "required": true, "description": "The requested role for OOBI rpy message."}, {"in": "path", "name": "eid", "schema": {"type": "string"}, "required": true, "description": "The qb64 identifier prefix of participant in role."}], "responses": {"200": {"description": "Successfully retrieved the OOBI resource."}, "400": {"description": "Bad request. This could be due to invalid or missing parameters."}, "404": {"description": "The requested OOBI resource was not found."}}}}, "/identifiers/{name}/endroles/{role}/{eid}": {"delete": {}}}, "info": {"title": "KERIA Interactive Web Interface API", "version": "1.0.1"}, "openapi": "3.1.0", "components": {"schemas": {"ACDCAttributes": {"type": "object", "properties": {"dt": {"type": "string"}, "i": {"type": "string"}, "u": {"type": "string"}}, "additionalProperties": true}, "ACDC_V_1": {"oneOf": [{"type": "object", "properties": {"v": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "u": {"type": "string"}, "ri": {"type": "string"}, "e": {"type": "string"}, "r": {"type": "string"}, "a": {"$ref": "#/components/schemas/ACDCAttributes"}}, "additionalProperties": false, "required": ["d", "i", "s", "v"]}, {"type": "object", "properties": {"v": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "u": {"type": "string"}, "ri": {"type": "string"}, "e": {"type": "string"}, "r": {"type": "string"}, "A": {"anyOf": [{"type": "string"}, {"type": "array"}]}}, "additionalProperties": false, "required": ["d", "i", "s", "v"]}]}, "ACDC_V_2": {"oneOf": [{"type": "object", "properties": {"v": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "u": {"type": "string"}, "rd": {"type": "string"}, "e": {"type": "string"}, "r": {"type": "string"}, "a": {"$ref": "#/components/schemas/ACDCAttributes"}}, "additionalProperties": false, "required": ["d", "i", "s", "v"]}, {"type": "object", "properties": {"v": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "u": {"type": "string"}, "rd": {"type": "string"}, "e": {"type": "string"}, "r": {"type": "string"}, "A": {"anyOf": [{"type": "string"}, {"type": "array"}]}}, "additionalProperties": false, "required": ["d", "i", "s", "v"]}]}, "IssEvent": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"enum": ["iss", "bis"]}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "ri": {"type": "string"}, "dt": {"type": "string"}}, "required": ["d", "dt", "i", "ri", "s", "t", "v"]}, "Schema": {"type": "object", "properties": {"$id": {"type": "string"}, "$schema": {"type": "string"}, "title": {"type": "string"}, "description": {"type": "string"}, "type": {"type": "string"}, "credentialType": {"type": "string"}, "version": {"type": "string"}, "properties": {"type": "object", "additionalProperties": {}}, "additionalProperties": {"type": "boolean"}, "required": {"type": "array", "items": {"type": "string"}}}, "required": ["$id", "$schema", "additionalProperties", "credentialType", "description", "properties", "required", "title", "type", "version"]}, "Anchor": {"type": "object", "properties": {"pre": {"type": "string"}, "sn": {"type": "integer"}, "d": {"type": "string"}}, "required": ["d", "pre", "sn"]}, "Seal": {"type": "object", "properties": {"s": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}}, "required": ["d", "s"]}, "IXN_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "p": {"type": "string"}, "a": {}}, "required": ["a", "d", "i", "p", "s", "t", "v"]}, "IXN_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "p": {"type": "string"}, "a": {}}, "required": ["a", "d", "i", "p", "s", "t", "v"]}, "ICP_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "b": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "a": {}}, "required": ["a", "b", "bt", "c", "d", "i", "k", "kt", "n", "nt", "s", "t", "v"]}, "ICP_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "b": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "a": {}}, "required": ["a", "b", "bt", "c", "d", "i", "k", "kt", "n", "nt", "s", "t", "v"]}, "ROT_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "p": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "br": {"type": "array", "items": {"type": "string"}}, "ba": {"type": "array", "items": {"type": "string"}}, "a": {}}, "required": ["a", "ba", "br", "bt", "d", "i", "k", "kt", "n", "nt", "p", "s", "t", "v"]}, "ROT_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "p": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "br": {"type": "array", "items": {"type": "string"}}, "ba": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "a": {}}, "required": ["a", "ba", "br", "bt", "c", "d", "i", "k", "kt", "n", "nt", "p", "s", "t", "v"]}, "DIP_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "b": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "a": {}, "di": {"type": "string"}}, "required": ["a", "b", "bt", "c", "d", "di", "i", "k", "kt", "n", "nt", "s", "t", "v"]}, "DIP_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "b": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "a": {}, "di": {"type": "string"}}, "required": ["a", "b", "bt", "c", "d", "di", "i", "k", "kt", "n", "nt", "s", "t", "v"]}, "DRT_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "p": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "br": {"type": "array", "items": {"type": "string"}}, "ba": {"type": "array", "items": {"type": "string"}}, "a": {}}, "required": ["a", "ba", "br", "bt", "d", "i", "k", "kt", "n", "nt", "p", "s", "t", "v"]}, "DRT_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "p": {"type": "string"}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}, {"type": "array", "items": {"type": "array", "items": {"type": "string"}}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "br": {"type": "array", "items": {"type": "string"}}, "ba": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "a": {}}, "required": ["a", "ba", "br", "bt", "c", "d", "i", "k", "kt", "n", "nt", "p", "s", "t", "v"]}, "RPY_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "dt": {"type": "string"}, "r": {"type": "string"}, "a": {}}, "required": ["a", "d", "dt", "r", "t", "v"]}, "RPY_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "dt": {"type": "string"}, "r": {"type": "string"}, "a": {}}, "required": ["a", "d", "dt", "i", "r", "t", "v"]}, "VCP_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "ii": {"type": "string"}, "s": {"type": "string"}, "c": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string"}, "b": {"type": "array", "items": {"type": "string"}}, "n": {"type": "string"}}, "required": ["b", "bt", "c", "d", "i", "ii", "n", "s", "t", "v"]}, "EXN_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "rp": {"type": "string"}, "p": {"type": "string"}, "dt": {"type": "string"}, "r": {"type": "string"}, "q": {"type": "object", "additionalProperties": {}}, "a": {}, "e": {"type": "object", "additionalProperties": {}}}, "required": ["a", "d", "dt", "e", "i", "p", "q", "r", "rp", "t", "v"]}, "EXN_V_2": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "x": {"type": "string"}, "p": {"type": "string"}, "dt": {"type": "string"}, "r": {"type": "string"}, "q": {"type": "object", "additionalProperties": {}}, "a": {}}, "required": ["a", "d", "dt", "i", "p", "q", "r", "t", "v", "x"]}, "Credential": {"type": "object", "properties": {"sad": {"oneOf": [{"$ref": "#/components/schemas/ACDC_V_1"}, {"$ref": "#/components/schemas/ACDC_V_2"}]}, "atc": {"type": "string"}, "iss": {"$ref": "#/components/schemas/IssEvent"}, "issatc": {"type": "string"}, "pre": {"type": "string"}, "schema": {"$ref": "#/components/schemas/Schema"}, "chains": {"type": "array", "items": {"type": "object", "additionalProperties": {}}}, "status": {"$ref": "#/components/schemas/CredentialState"}, "anchor": {"$ref": "#/components/schemas/Anchor"}, "anc": {"oneOf": [{"$ref": "#/components/schemas/IXN_V_1"}, {"$ref": "#/components/schemas/IXN_V_2"}, {"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}, {"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}, {"$ref": "#/components/schemas/DIP_V_1"}, {"$ref": "#/components/schemas/DIP_V_2"}, {"$ref": "#/components/schemas/DRT_V_1"}, {"$ref": "#/components/schemas/DRT_V_2"}]}, "ancatc": {"type": "string"}}, "required": ["anc", "ancatc", "anchor", "atc", "chains", "iss", "issatc", "pre", "sad", "schema", "status"]}, "OperationStatus": {"type": "object", "properties": {"code": {"type": "integer"}, "message": {"type": "string"}, "details": {"type": ["object", "null"], "additionalProperties": {}}}, "required": ["code", "message"]}, "Operation": {"type": "object", "properties": {"name": {"type": "string"}, "error": {"$ref": "#/components/schemas/OperationStatus"}, "done": {"type": "boolean"}, "metadata": {"type": "object"}, "response": {"type": "object"}}, "required": ["name"]}, "EmptyDict": {"type": "object", "properties": {}}, "CredentialStateIssOrRev": {"type": "object", "properties": {"vn": {}, "i": {"type": "string"}, "s": {"type": "string"}, "d": {"type": "string"}, "ri": {"type": "string"}, "a": {"$ref": "#/components/schemas/Seal"}, "dt": {"type": "string"}, "et": {"enum": ["iss", "rev"]}, "ra": {"$ref": "#/components/schemas/EmptyDict"}}, "required": ["a", "d", "dt", "et", "i", "ra", "ri", "s", "vn"]}, "RaFields": {"type": "object", "properties": {"i": {"type": "string"}, "s": {"type": "string"}, "d": {"type": "string"}}, "required": ["d", "i", "s"]}, "CredentialStateBisOrBrv": {"type": "object", "properties": {"vn": {}, "i": {"type": "string"}, "s": {"type": "string"}, "d": {"type": "string"}, "ri": {"type": "string"}, "a": {"$ref": "#/components/schemas/Seal"}, "dt": {"type": "string"}, "et": {"enum": ["bis", "brv"]}, "ra": {"$ref": "#/components/schemas/RaFields"}}, "required": ["a", "d", "dt", "et", "i", "ra", "ri", "s", "vn"]}, "CredentialState": {"oneOf": [{"$ref": "#/components/schemas/CredentialStateIssOrRev"}, {"$ref": "#/components/schemas/CredentialStateBisOrBrv"}]}, "Registry": {"type": "object", "properties": {"name": {"type": "string"}, "regk": {"type": "string"}, "pre": {"type": "string"}, "state": {"$ref": "#/components/schemas/CredentialState"}}, "required": ["name", "pre", "regk", "state"]}, "StateEERecord": {"type": "object", "properties": {"s": {"type": "string", "default": "0"}, "d": {"type": "string", "default": ""}, "br": {"type": "array", "items": {}}, "ba": {"type": "array", "items": {}}}}, "KeyStateRecord": {"type": "object", "properties": {"vn": {"type": "array", "items": {"type": "integer"}}, "i": {"type": "string", "default": ""}, "s": {"type": "string", "default": "0"}, "p": {"type": "string", "default": ""}, "d": {"type": "string", "default": ""}, "f": {"type": "string", "default": "0"}, "dt": {"type": "string", "default": ""}, "et": {"type": "string", "default": ""}, "kt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}]}, "k": {"type": "array", "items": {"type": "string"}}, "nt": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}]}, "n": {"type": "array", "items": {"type": "string"}}, "bt": {"type": "string", "default": "0"}, "b": {"type": "array", "items": {"type": "string"}}, "c": {"type": "array", "items": {"type": "string"}}, "ee": {"$ref": "#/components/schemas/StateEERecord"}, "di": {"type": "string", "default": ""}}, "required": ["b", "c", "ee", "k", "n", "kt", "nt"]}, "Controller": {"type": "object", "properties": {"state": {"$ref": "#/components/schemas/KeyStateRecord"}, "ee": {"oneOf": [{"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}, {"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}, {"$ref": "#/components/schemas/DIP_V_1"}, {"$ref": "#/components/schemas/DIP_V_2"}, {"$ref": "#/components/schemas/DRT_V_1"}, {"$ref": "#/components/schemas/DRT_V_2"}]}}, "required": ["ee", "state"]}, "AgentResourceResult": {"type": "object", "properties": {"agent": {"$ref": "#/components/schemas/KeyStateRecord"}, "controller": {"$ref": "#/components/schemas/Controller"}, "pidx": {"type": "integer"}, "ridx": {"type": ["integer", "null"], "default": null}, "sxlt": {"type": ["string", "null"], "default": null}}, "required": ["agent", "controller", "pidx"]}, "SaltyState": {"type": "object", "properties": {"tier": {"$ref": "#/components/schemas/Tier"}, "sxlt": {"type": "string", "default": ""}, "pidx": {"type": "integer", "default": 0}, "kidx": {"type": "integer", "default": 0}, "stem": {"type": "string", "default": ""}, "dcode": {"type": "string", "default": ""}, "icodes": {"type": "array", "items": {"type": "string"}}, "ncodes": {"type": "array", "items": {"type": "string"}}, "transferable": {"type": "boolean", "default": false}}, "required": ["icodes", "ncodes", "tier"]}, "RandyKeyState": {"type": "object", "properties": {"prxs": {"type": "array", "items": {"type": "string"}}, "nxts": {"type": "array", "items": {"type": "string"}}}, "required": ["nxts", "prxs"]}, "HabState": {"type": "object", "properties": {"name": {"type": "string"}, "prefix": {"type": "string"}, "icp_dt": {"type": "string"}, "state": {"$ref": "#/components/schemas/KeyStateRecord"}, "transferable": {"type": ["boolean", "null"], "default": null}, "windexes": {"type": ["array", "null"], "default": null, "items": {"type": "string"}}}, "required": ["icp_dt", "name", "prefix", "state"]}, "GroupKeyState": {"type": "object", "properties": {"mhab": {"$ref": "#/components/schemas/Identifier"}, "keys": {"type": "array", "items": {"type": "string"}}, "ndigs": {"type": "array", "items": {"type": "string"}}}, "required": ["keys", "mhab", "ndigs"]}, "ExternState": {"type": "object", "properties": {"extern_type": {"type": "string"}, "pidx": {"type": "integer"}}, "required": ["extern_type", "pidx"], "additionalProperties": true}, "Identifier": {"type": "object", "properties": {"name": {"type": "string"}, "prefix": {"type": "string"}, "icp_dt": {"type": "string"}, "state": {"$ref": "#/components/schemas/KeyStateRecord"}, "transferable": {"type": ["boolean", "null"], "default": null}, "windexes": {"type": ["array", "null"], "default": null, "items": {"type": "string"}}}, "required": ["icp_dt", "name", "prefix", "state"], "oneOf": [{"required": ["salty"], "properties": {"salty": {"$ref": "#/components/schemas/SaltyState"}}}, {"required": ["randy"], "properties": {"randy": {"$ref": "#/components/schemas/RandyKeyState"}}}, {"required": ["group"], "properties": {"group": {"$ref": "#/components/schemas/GroupKeyState"}}}, {"required": ["extern"], "properties": {"extern": {"$ref": "#/components/schemas/ExternState"}}}]}, "Tier": {"type": "string", "enum": ["low", "med", "high"], "description": "Tier of key material"}, "OOBI": {"type": "object", "properties": {"role": {"type": "string", "enum": ["controller", "witness", "registrar", "watcher", "judge", "juror", "peer", "mailbox", "agent"]}, "oobis": {"type": "array", "items": {"type": "string"}}}, "required": ["oobis", "role"]}, "EndRole": {"type": "object", "properties": {"cid": {"type": "string"}, "role": {"type": "string"}, "eid": {"type": "string"}}, "required": ["cid", "eid", "role"]}, "Rpy": {"oneOf": [{"$ref": "#/components/schemas/RPY_V_1"}, {"$ref": "#/components/schemas/RPY_V_2"}]}, "Challenge": {"type": "object", "properties": {"words": {"type": "array", "items": {"type": "string"}}, "dt": {"type": "string"}, "said": {"type": "string"}, "authenticated": {"type": "boolean"}}, "required": ["words"]}, "MemberEnds": {"type": "object", "properties": {"agent": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "controller": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "witness": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "registrar": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "watcher": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "judge": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "juror": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "peer": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}, "mailbox": {"type": ["object", "null"], "default": null, "additionalProperties": {"type": "string"}}}}, "WellKnown": {"type": "object", "properties": {"url": {"type": "string"}, "dt": {"type": "string"}}, "required": ["dt", "url"]}, "Contact": {"type": "object", "properties": {"id": {"type": "string"}, "alias": {"type": "string"}, "oobi": {"type": "string"}, "ends": {"$ref": "#/components/schemas/MemberEnds"}, "challenges": {"type": "array", "items": {"$ref": "#/components/schemas/Challenge"}}, "wellKnowns": {"type": "array", "items": {"$ref": "#/components/schemas/WellKnown"}}}, "required": ["id"], "additionalProperties": true}, "AidRecord": {"type": "object", "properties": {"aid": {"type": "string"}, "ends": {"$ref": "#/components/schemas/MemberEnds"}}, "required": ["aid", "ends"]}, "GroupMember": {"type": "object", "properties": {"signing": {"type": "array", "items": {"$ref": "#/components/schemas/AidRecord"}}, "rotation": {"type": "array", "items": {"$ref": "#/components/schemas/AidRecord"}}}, "required": ["rotation", "signing"]}, "KeyEventRecord": {"type": "object", "properties": {"ked": {"oneOf": [{"$ref": "#/components/schemas/IXN_V_1"}, {"$ref": "#/components/schemas/IXN_V_2"}, {"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}, {"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}, {"$ref": "#/components/schemas/DIP_V_1"}, {"$ref": "#/components/schemas/DIP_V_2"}, {"$ref": "#/components/schemas/DRT_V_1"}, {"$ref": "#/components/schemas/DRT_V_2"}]}, "atc": {"type": "string"}}, "required": ["atc", "ked"]}, "AgentConfig": {"type": "object", "properties": {"iurls": {"type": "array", "items": {"type": "string"}}}}, "Exn": {"oneOf": [{"$ref": "#/components/schemas/EXN_V_1"}, {"$ref": "#/components/schemas/EXN_V_2"}]}, "Icp": {"oneOf": [{"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}]}, "Rot": {"oneOf": [{"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}]}, "Vcp": {"oneOf": [{"$ref": "#/components/schemas/VCP_V_1"}]}, "Iss": {"oneOf": [{"$ref": "#/components/schemas/ISS_V_1"}]}, "Ixn": {"oneOf": [{"$ref": "#/components/schemas/IXN_V_1"}, {"$ref": "#/components/schemas/IXN_V_2"}]}, "NotificationData": {"type": "object", "properties": {"r": {"type": "string"}, "d": {"type": "string"}, "m": {"type": "string"}}, "additionalProperties": true}, "Notification": {"type": "object", "properties": {"i": {"type": "string"}, "dt": {"type": "string"}, "r": {"type": "boolean"}, "a": {"$ref": "#/components/schemas/NotificationData"}}, "required": ["a", "dt", "i", "r"]}, "ExchangeResource": {"type": "object", "properties": {"exn": {"$ref": "#/components/schemas/Exn"}, "pathed": {"type": "object", "additionalProperties": {}}}, "required": ["exn", "pathed"]}, "MultisigInceptEmbeds": {"type": "object", "properties": {"icp": {"$ref": "#/components/schemas/Icp"}}, "required": ["icp"]}, "MultisigRotateEmbeds": {"type": "object", "properties": {"rot": {"$ref": "#/components/schemas/Rot"}}, "required": ["rot"]}, "MultisigInteractEmbeds": {"type": "object", "properties": {"ixn": {"$ref": "#/components/schemas/Ixn"}}, "required": ["ixn"]}, "MultisigRegistryInceptEmbeds": {"type": "object", "properties": {"vcp": {"$ref": "#/components/schemas/Vcp"}, "anc": {"oneOf": [{"$ref": "#/components/schemas/IXN_V_1"}, {"$ref": "#/components/schemas/IXN_V_2"}, {"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}, {"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}, {"$ref": "#/components/schemas/DIP_V_1"}, {"$ref": "#/components/schemas/DIP_V_2"}, {"$ref": "#/components/schemas/DRT_V_1"}, {"$ref": "#/components/schemas/DRT_V_2"}]}}, "required": ["anc", "vcp"]}, "ISS_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "ri": {"type": "string"}, "dt": {"type": "string"}}, "required": ["d", "dt", "i", "ri", "s", "t", "v"]}, "MultisigIssueEmbeds": {"type": "object", "properties": {"acdc": {"oneOf": [{"$ref": "#/components/schemas/ACDC_V_1"}, {"$ref": "#/components/schemas/ACDC_V_2"}]}, "iss": {"$ref": "#/components/schemas/Iss"}, "anc": {"oneOf": [{"$ref": "#/components/schemas/IXN_V_1"}, {"$ref": "#/components/schemas/IXN_V_2"}, {"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}, {"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}, {"$ref": "#/components/schemas/DIP_V_1"}, {"$ref": "#/components/schemas/DIP_V_2"}, {"$ref": "#/components/schemas/DRT_V_1"}, {"$ref": "#/components/schemas/DRT_V_2"}]}}, "required": ["acdc", "anc", "iss"]}, "REV_V_1": {"type": "object", "properties": {"v": {"type": "string"}, "t": {"type": "string"}, "d": {"type": "string"}, "i": {"type": "string"}, "s": {"type": "string"}, "ri": {"type": "string"}, "p": {"type": "string"}, "dt": {"type": "string"}}, "required": ["d", "dt", "i", "p", "ri", "s", "t", "v"]}, "MultisigRevokeEmbeds": {"type": "object", "properties": {"rev": {"$ref": "#/components/schemas/REV_V_1"}, "anc": {"oneOf": [{"$ref": "#/components/schemas/IXN_V_1"}, {"$ref": "#/components/schemas/IXN_V_2"}, {"$ref": "#/components/schemas/ICP_V_1"}, {"$ref": "#/components/schemas/ICP_V_2"}, {"$ref": "#/components/schemas/ROT_V_1"}, {"$ref": "#/components/schemas/ROT_V_2"}, {"$ref": "#/components/schemas/DIP_V_1"}, {"$ref": "#/components/schemas/DIP_V_2"}, {"$ref": "#/components/schemas/DRT_V_1"}, {"$ref": "#/components/schemas/DRT_V_2"}]}}, "required": ["anc", "rev"]}, "MultisigRpyEmbeds": {"type": "object", "properties": {"rpy": {"$ref": "#/components/schemas/Rpy"}}, "required": ["rpy"]}, "MultisigExnEmbeds": {"type": "object", "properties": {"exn": {"$ref": "#/components/schemas/Exn"}}, "required": ["exn"]}, "ExnEmbeds": {"type": "object", "properties": {"d": {"type": "string"}}, "required": ["d"], "oneOf": [{"$ref": "#/components/schemas/MultisigInceptEmbeds"}, {"$ref": "#/components/schemas/MultisigRotateEmbeds"}, {"$ref": "#/components/schemas/MultisigInteractEmbeds"}, {"$ref": "#/components/schemas/MultisigRegistryInceptEmbeds"}, {"$ref": "#/components/schemas/MultisigIssueEmbeds"}, {"$ref": "#/components/schemas/MultisigRevokeEmbeds"}, {"$ref": "#/components/schemas/MultisigRpyEmbeds"}, {"$ref": "#/components/schemas/MultisigExnEmbeds"}]}, "ExnMultisig": {"type": "object", "properties": {"exn": {"$ref": "#/components/schemas/Exn"}, "paths": {"type": "object", "additionalProperties": {}}, "groupName": {"type": ["string", "null"], "default": null}, "memberName": {"type": ["string", "null"], "default": null}, "sender": {"type": ["string", "null"], "default": null}}, "required": ["exn", "paths"]}}}}'
         )
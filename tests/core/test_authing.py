@@ -128,12 +128,17 @@ def test_authenticater(mockHelpingNowUTC):
 
 
 class MockAgency:
-    def __init__(self, agent=None):
+    def __init__(self, agent=None, loading=False):
         self.agent = agent
+        self.loading = loading
+        self.loader = agenting.Loader
 
     def get(self, caid=None):
         return self.agent
 
+    def warm(self, pre):
+        return not self.loading
+
 
 class MockAuthN:
     def __init__(self, valid=False, error=None):
@@ -239,6 +244,17 @@ def test_signature_validation(mockHelpingNowUTC):
     assert rep.complete is True
     assert rep.status == falcon.HTTP_401
 
+    vc = authing.SignatureValidationComponent(
+        agency=MockAgency(agent=object(), loading=True), authn=MockAuthN(valid=True)
+    )
+    req = testing.create_req(method="GET", path="/identifiers")
+    rep = falcon.Response()
+
+    vc.process_request(req, rep)
+    assert rep.complete is True
+    assert rep.status == falcon.HTTP_503
+    assert rep.headers["retry-after"] == "1"
+
     salt = b"0000456789abcdef"
     salter = core.Salter(raw=salt)
     with habbing.openHab(name="caid", salt=salt, temp=True) as (
@@ -1,9 +1,17 @@
+import json
+import time
+
+import lmdb
+
+from keri.app.oobiing import Result
+from keri.db import basing
 from keri.help import helping
 
 import pytest
 from keria.app import aiding
 from keri.kering import ValidationError
 from keria.core import longrunning
+from keria.db.basing import SnapshotEnv, snapshot
 
 
 def test_operations(helpers):
@@ -477,3 +485,259 @@ def test_error(helpers):
             "title": "long running operation "
             "'query.EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao' not found"
         }
+
+
+def test_operation_wait_and_stream(helpers):
+    with helpers.openKeria() as (agency, agent, app, client):
+        opResEnd = longrunning.OperationResourceEnd()
+        app.add_route("/operations/{name}", opResEnd)
+        opStreamEnd = longrunning.OperationStreamEnd()
+        app.add_route("/operations/events", opStreamEnd)
+
+        oobi = "http://127.0.0.1:5642/oobi/EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+        op = agent.monitor.submit("op1", longrunning.OpTypes.oobi, dict(oobi=oobi))
+        assert op.done is False
+
+        # Waits until the wait expires for a pending operation
+        start = time.perf_counter()
+        res = client.simulate_get(path="/operations/oobi.op1", params=dict(wait=0.1))
+        assert res.status_code == 200
+        assert res.json["done"] is False
+        assert time.perf_counter() - start >= 0.1
+
+        agent.monitor.submit("op2", longrunning.OpTypes.done, dict(response=dict(a=1)))
+        res = client.simulate_get(path="/operations/done.op2", params=dict(wait=30))
+        assert res.status_code == 200
+        assert res.json["done"] is True
+        assert res.json["response"] == dict(a=1)
+
+        res = client.simulate_get(path="/operations/events", params=dict(timeout=0))
+        assert res.status_code == 200
+        assert res.headers["content-type"] == "text/event-stream"
+
+        stream = longrunning.OperationStream(agent.monitor, timeout=60)
+        assert agent.monitor.pending == {"oobi.op1"}
+        assert next(stream) == b"retry: 5000\n\n"
+        assert next(stream) == b""
+        # A silent stream sends a comment line so proxies do not time it out
+        stream.beat = 0
+        assert next(stream) == b": heartbeat\n\n"
+        assert next(stream) == b""
+
+        # Completes once the change to the OOBI state is seen
+        agent.hby.db.roobi.pin(
+            keys=(oobi,), val=basing.OobiRecord(state=Result.resolved)
+        )
+        agent.monitor.touch()
+        data = next(stream).decode("utf-8")
+        assert data.startswith("id: oobi.op1\nevent: operation\ndata: ")
+        operation = json.loads(data.split("data: ")[1])
+        assert operation["done"] is True
+        assert operation["response"] == dict(oobi=oobi)
+        assert agent.monitor.pending == set()
+
+        waiter = longrunning.OperationWaiter(
+            agent.monitor, "oobi.op1", longrunning.Operation(name="oobi.op1"), 30
+        )
+        assert next(waiter) == b""
+        agent.monitor.touch()
+        assert json.loads(next(waiter))["done"] is True
+        with pytest.raises(StopIteration):
+            next(waiter)
+
+        stream.expires = 0
+        with pytest.raises(StopIteration):
+            next(stream)
+        assert len(agent.monitor.streams) == 0
+
+
+def test_operation_outcome(helpers):
+    with helpers.openKeria() as (agency, agent, app, client):
+        oobi = "http://127.0.0.1:5642/oobi/EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+        op = agent.monitor.submit("op1", longrunning.OpTypes.oobi, dict(oobi=oobi))
+        assert op.done is False
+        assert agent.monitor.opr.outcomes.get(keys=("oobi.op1",)) is None
+
+        agent.hby.db.roobi.pin(
+            keys=(oobi,), val=basing.OobiRecord(state=Result.resolved)
+        )
+        op = agent.monitor.get("oobi.op1")
+        assert op.done is True
+
+        outcome = agent.monitor.opr.outcomes.get(keys=("oobi.op1",))
+        assert outcome.operation == op.to_dict()
+        assert helping.fromIso8601(outcome.completed) <= helping.nowUTC()
+
+        # Finished operations are read from their outcome without checking them again
+        def status(op):
+            raise AssertionError("finished operation checked again")
+
+        agent.monitor.status = status
+        assert agent.monitor.get("oobi.op1") == op
+        assert agent.monitor.getOperations() == [op]
+
+        agent.monitor.rem("oobi.op1")
+        assert agent.monitor.opr.outcomes.get(keys=("oobi.op1",)) is None
+        assert agent.monitor.get("oobi.op1") is None
+
+
+def test_operation_pages(helpers):
+    with helpers.openKeria() as (agency, agent, app, client):
+        opColEnd = longrunning.OperationCollectionEnd()
+        app.add_route("/operations", opColEnd)
+
+        for i in range(3):
+            agent.monitor.submit(
+                f"op{i}", longrunning.OpTypes.done, dict(response=dict(i=i))
+            )
+        oobi = "http://127.0.0.1:5642/oobi/EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+        for i in range(2):
+            agent.monitor.submit(f"op{i}", longrunning.OpTypes.oobi, dict(oobi=oobi))
+
+        assert [name for _, name in agent.monitor.names()] == [
+            "done.op0",
+            "done.op1",
+            "done.op2",
+            "oobi.op0",
+            "oobi.op1",
+        ]
+        assert [name for _, name in agent.monitor.names(type="oobi")] == [
+            "oobi.op0",
+            "oobi.op1",
+        ]
+
+        res = client.simulate_get(path="/operations", params=dict(limit=2))
+        assert res.status_code == 200
+        assert [op["name"] for op in res.json] == ["done.op0", "done.op1"]
+        token = res.headers["Continuation-Token"]
+
+        res = client.simulate_get(path="/operations", params=dict(limit=2, after=token))
+        assert [op["name"] for op in res.json] == ["done.op2", "oobi.op0"]
+        token = res.headers["Continuation-Token"]
+
+        res = client.simulate_get(path="/operations", params=dict(limit=2, after=token))
+        assert [op["name"] for op in res.json] == ["oobi.op1"]
+        assert "Continuation-Token" not in res.headers
+
+        res = client.simulate_get(path="/operations", params=dict(after="bad"))
+        assert res.status_code == 400
+
+        res = client.simulate_get(
+            path="/operations", headers=dict(Range="operations=1-2")
+        )
+        assert res.status_code == 206
+        assert [op["name"] for op in res.json] == ["done.op1", "done.op2"]
+        assert res.headers["Content-Range"] == "operations 1-2/5"
+
+        # Finished operations are skipped without checking them
+        res = client.simulate_get(path="/operations", params=dict(pending="true"))
+        assert [op["name"] for op in res.json] == ["oobi.op0", "oobi.op1"]
+        assert all(op["done"] is False for op in res.json)
+
+        res = client.simulate_get(
+            path="/operations", params=dict(type="done", pending="true")
+        )
+        assert res.json == []
+
+        # Resubmitting moves an operation to its new start time
+        agent.monitor.submit("op0", longrunning.OpTypes.oobi, dict(oobi=oobi))
+        assert [name for _, name in agent.monitor.names(type="oobi")] == [
+            "oobi.op1",
+            "oobi.op0",
+        ]
+
+        agent.monitor.rem("oobi.op0")
+        assert [name for _, name in agent.monitor.names(type="oobi")] == ["oobi.op1"]
+        assert len(list(agent.monitor.names())) == 4
+
+
+def test_operator_reopen(tmp_path):
+    opr = longrunning.Operator(name="reopen", headDirPath=str(tmp_path), reopen=True)
+    start = helping.nowIso8601()
+    op = longrunning.Op(oid="EABC", type="witness", start=start, metadata={})
+    opr.ops.pin(keys=("witness.EABC",), val=op)
+    outcome = longrunning.Outcome(completed=start, operation={})
+    opr.outcomes.pin(keys=("witness.EABC",), val=outcome)
+
+    # Operations saved before there were indexes are indexed when reopened
+    with opr.env.begin(write=True) as txn:
+        txn.drop(opr.starts.sdb, delete=False)
+        txn.drop(opr.types.sdb, delete=False)
+        txn.drop(opr.completes.sdb, delete=False)
+    opr.close()
+    opr.reopen()
+    assert [name for _, name in opr.starts.getItemIter()] == ["witness.EABC"]
+    assert [name for _, name in opr.types.getItemIter()] == ["witness.EABC"]
+    assert [name for _, name in opr.completes.getItemIter()] == ["witness.EABC"]
+
+    opr.close(clear=True)
+
+
+def test_operation_statuses(helpers):
+    with helpers.openKeria() as (agency, agent, app, client):
+        opStatusEnd = longrunning.OperationStatusCollectionEnd()
+        app.add_route("/operations/status", opStatusEnd)
+
+        agent.monitor.submit("op0", longrunning.OpTypes.done, dict(response=dict(i=0)))
+        oobi = "http://127.0.0.1:5642/oobi/EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+        agent.monitor.submit("op1", longrunning.OpTypes.oobi, dict(oobi=oobi))
+
+        body = dict(names=["oobi.op1", "done.op0", "oobi.op2"])
+        res = client.simulate_post(path="/operations/status", json=body)
+        assert res.status_code == 200
+        assert [op["name"] for op in res.json] == body["names"]
+        assert res.json[0]["done"] is False
+        assert res.json[1]["done"] is True
+        assert res.json[1]["response"] == dict(i=0)
+        assert res.json[2]["done"] is True
+        assert res.json[2]["error"]["code"] == 404
+
+        # Pending operations of a batch are all checked against one snapshot of the Habery
+        agent.monitor.submit("op2", longrunning.OpTypes.oobi, dict(oobi=oobi))
+        agent.hby.db.roobi.pin(
+            keys=(oobi,), val=basing.OobiRecord(state=Result.resolved)
+        )
+        envs = []
+        check = agent.monitor.check
+
+        def checking(op):
+            envs.append(agent.hby.db.env)
+            return check(op)
+
+        agent.monitor.check = checking
+        operations = agent.monitor.statuses(["oobi.op1", "oobi.op2"])
+        assert [op.done for op in operations] == [True, True]
+        assert len(envs) == 2
+        assert isinstance(envs[0], SnapshotEnv)
+        assert envs[0] is envs[1]
+        assert not isinstance(agent.hby.db.env, SnapshotEnv)
+
+        # Checks that write, approving a delegation, run after the snapshot in their place
+        agent.monitor.submit(
+            "op3", longrunning.OpTypes.delegation, dict(pre=agent.agentHab.pre, sn=5)
+        )
+        agent.monitor.submit(
+            "op4", longrunning.OpTypes.oobi, dict(oobi=f"{oobi}/witness")
+        )
+        envs.clear()
+        names = ["delegation.op3", "oobi.op4"]
+        operations = agent.monitor.statuses(names)
+        assert [op.name for op in operations] == names
+        assert isinstance(envs[0], SnapshotEnv)
+        assert not isinstance(envs[1], SnapshotEnv)
+        agent.monitor.check = check
+
+        # Nothing is written to a database while it is read through a snapshot
+        with snapshot(agent.hby.db):
+            with pytest.raises(lmdb.ReadonlyError):
+                agent.hby.db.roobi.pin(
+                    keys=(oobi,), val=basing.OobiRecord(state=Result.failed)
+                )
+        assert agent.hby.db.roobi.get(keys=(oobi,)).state == Result.resolved
+
+        res = client.simulate_post(path="/operations/status", json=dict(names="op"))
+        assert res.status_code == 400
+
+        body = dict(names=[f"done.op{i}" for i in range(101)])
+        res = client.simulate_post(path="/operations/status", json=body)
+        assert res.status_code == 400
@@ -27,6 +27,8 @@ def test_load_ends(helpers):
 
         (end, *_) = app._router.find("/identifiers/NAME/exchanges")
         assert isinstance(end, exchanging.ExchangeCollectionEnd)
+        (end, *_) = app._router.find("/exchanges/query/count")
+        assert isinstance(end, exchanging.ExchangeQueryCountEnd)
 
 
 def test_exchange_end(helpers):
@@ -135,11 +137,40 @@ def test_exchange_end(helpers):
         res = client.simulate_post("/exchanges/query", body=body)
         assert res.status_code == 200
         assert len(res.json) == 1
+        assert res.headers["Content-Range"] == "exchanges 1-1/*"
+
+        body = json.dumps(
+            {
+                "filter": {"-i": pre},
+                "sort": ["-dt"],
+                "skip": 1,
+                "limit": 1,
+                "count": True,
+            }
+        ).encode("utf-8")
+        res = client.simulate_post("/exchanges/query", body=body)
+        assert res.status_code == 200
+        assert len(res.json) == 1
+        assert res.headers["Content-Range"] == "exchanges 1-1/2"
 
         ked = res.json[0]["exn"]
         serder = serdering.SerderKERI(sad=ked)
         assert serder.said == exn.said
 
+        body = json.dumps({"filter": {"-i": pre}}).encode("utf-8")
+        res = client.simulate_post("/exchanges/query/count", body=body)
+        assert res.status_code == 200
+        assert res.json == {"count": 2}
+
+        body = json.dumps(
+            {"filter": {"-i": pre}, "sort": ["-dt"], "explain": True}
+        ).encode("utf-8")
+        res = client.simulate_post("/exchanges/query", body=body)
+        assert res.status_code == 200
+        assert res.json["sort"] is not None
+        assert res.json["returned"] == 2
+        assert res.json["results"] == [cexn.said, exn.said]
+
         res = client.simulate_get(f"/exchanges/{exn.said}")
         assert res.status_code == 200
         serder = serdering.SerderKERI(sad=res.json["exn"])